@@ -1,24 +1,48 @@
 """
 Data retrieval endpoints for Congressional Data API
 """
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import select
 import logging
 
 from app.core.database import get_db
+from app.core.facets import facet_counts
+from app.core.read_cache import CachedRoute
+from app.core.pagination import (
+    InvalidCursorError, decode_cursor, keyset_filter, keyset_order_by, keyset_sql, next_cursor
+)
 from app.models.member import Member
 from app.models.committee import Committee
 from app.models.hearing import Hearing
-from app.schemas.member import MemberResponse
+from app.schemas.member import MemberResponse, MemberListResponse
 from app.schemas.committee import CommitteeResponse
-from app.schemas.hearing import HearingResponse
+from app.schemas.hearing import HearingResponse, HearingListResponse
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+# Roster data changes a few times a day; serve repeat reads from the read cache
+router = APIRouter(route_class=CachedRoute)
+
+# Response header carrying the keyset cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _decode_cursor_or_400(cursor: str, sort_by: str, sort_order: str):
+    """Decode a request cursor, turning invalid cursors into a 400."""
+    try:
+        return decode_cursor(cursor, sort_by, sort_order)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+# Columns counted when a listing is requested with include_facets
+MEMBER_FACETS = ["party", "state", "chamber"]
+HEARING_FACETS = ["status", "hearing_type", "committee_id"]
+
+# Upper bound on committee nesting walked by the hierarchy query (guards against cycles)
+MAX_HIERARCHY_DEPTH = 10
 
 @router.get("/debug-test")
 async def debug_test():
@@ -157,7 +181,7 @@ async def get_members_fixed(
             "total_members": total
         }
 
-@router.get("/members", response_model=List[dict])
+@router.get("/members", response_model=Union[List[dict], MemberListResponse])
 async def get_members_new_version(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=200, description="Items per page"),
@@ -168,15 +192,23 @@ async def get_members_new_version(
     sort_by: Optional[str] = Query("last_name", description="Sort by field (last_name, first_name, state, party)"),
     sort_order: Optional[str] = Query("asc", description="Sort order (asc/desc)"),
     include_committees: bool = Query(False, description="Include committee summary information"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header (overrides page)"),
+    include_total: bool = Query(False, description="Wrap results with the total number of matches"),
+    include_facets: bool = Query(False, description="Wrap results with per-party/state/chamber counts"),
+    response: Response = None,
     db: Session = Depends(get_db)
 ):
     """
     Retrieve congressional members with search, filtering, and sorting
     Enhanced with optional committee information
+    
+    The cursor for the following page is returned in the X-Next-Cursor header.
+    With include_total or include_facets the list is wrapped in an object
+    carrying the counts, computed in one grouped query.
     """
     logger.info(f"get_members called with params: page={page}, limit={limit}, search={search}, chamber={chamber}, state={state}, party={party}, sort_by={sort_by}, sort_order={sort_order}, include_committees={include_committees}")
     
-    from sqlalchemy import text
+    from sqlalchemy import text, bindparam
     
     # Build WHERE clause
     where_conditions = []
@@ -199,19 +231,29 @@ async def get_members_new_version(
         where_conditions.append("party = :party")
         params["party"] = party
     
-    # Build ORDER BY clause
-    order_by = "last_name"
+    # Build ORDER BY clause (NULLs last and id as tiebreaker so keyset paging is stable)
+    sort_field = "last_name"
     if sort_by in ["first_name", "last_name", "state", "party", "chamber"]:
-        order_by = sort_by
+        sort_field = sort_by
     
-    if sort_order.lower() == "desc":
-        order_by += " DESC"
-    else:
-        order_by += " ASC"
+    direction = "DESC" if sort_order.lower() == "desc" else "ASC"
+    order_by = f"{sort_field} {direction} NULLS LAST, id {direction}"
+    
+    # Filters without the cursor, for total and facet counts
+    filter_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+    filter_params = dict(params)
+    
+    # Continue after the cursor row, or fall back to offset paging
+    offset = (page - 1) * limit
+    if cursor:
+        cursor_value, cursor_id = _decode_cursor_or_400(cursor, sort_field, sort_order)
+        cursor_condition, cursor_params = keyset_sql(sort_field, cursor_value, cursor_id, direction == "DESC")
+        where_conditions.append(cursor_condition)
+        params.update(cursor_params)
+        offset = 0
     
     # Build complete SQL
     where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-    offset = (page - 1) * limit
     
     sql = text(f"""
         SELECT id, bioguide_id, congress_gov_id, first_name, last_name, middle_name, 
@@ -224,12 +266,19 @@ async def get_members_new_version(
         LIMIT :limit OFFSET :offset
     """)
     
-    params.update({"limit": limit, "offset": offset})
+    # Fetch one extra row to learn whether another page exists
+    params.update({"limit": limit + 1, "offset": offset})
     
     logger.info(f"Executing SQL with params: {params}")
     
     # Execute the query
     result = db.execute(sql, params).fetchall()
+    cursor_for_next = next_cursor(
+        result, limit, sort_field, sort_order,
+        lambda row: (row._mapping[sort_field], row._mapping["id"])
+    )
+    if cursor_for_next and response is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_for_next
     
     logger.info(f"Raw SQL returned {len(result)} members")
     
@@ -264,38 +313,43 @@ async def get_members_new_version(
             "last_scraped_at": row[24]
         }
         
-        # Add committee information if requested
-        if include_committees:
-            # Get committee memberships for this member
-            committee_sql = text("""
-                SELECT c.id, c.name, c.chamber, c.committee_type, c.is_subcommittee, 
-                       cm.position, cm.is_current
-                FROM committee_memberships cm
-                JOIN committees c ON cm.committee_id = c.id
-                WHERE cm.member_id = :member_id AND cm.is_current = true
-                ORDER BY c.name
-            """)
-            
-            committee_result = db.execute(committee_sql, {"member_id": row[0]}).fetchall()
-            
-            committees = []
-            leadership_count = 0
+        members_response.append(member_data)
+    
+    # Add committee information if requested (one query for the whole page)
+    if include_committees and members_response:
+        committee_sql = text("""
+            SELECT cm.member_id, c.id, c.name, c.chamber, c.committee_type, c.is_subcommittee, 
+                   cm.position, cm.is_current
+            FROM committee_memberships cm
+            JOIN committees c ON cm.committee_id = c.id
+            WHERE cm.member_id IN :member_ids AND cm.is_current = true
+            ORDER BY cm.member_id, c.name
+        """).bindparams(bindparam("member_ids", expanding=True))
+        
+        committee_result = db.execute(
+            committee_sql, {"member_ids": [m["id"] for m in members_response]}
+        ).fetchall()
+        
+        committees_by_member = {}
+        for comm_row in committee_result:
+            committees_by_member.setdefault(comm_row[0], []).append({
+                "id": comm_row[1],
+                "name": comm_row[2],
+                "chamber": comm_row[3],
+                "committee_type": comm_row[4],
+                "is_subcommittee": comm_row[5],
+                "position": comm_row[6],
+                "is_current": comm_row[7]
+            })
+        
+        for member_data in members_response:
+            committees = committees_by_member.get(member_data["id"], [])
             
-            for comm_row in committee_result:
-                committee_info = {
-                    "id": comm_row[0],
-                    "name": comm_row[1],
-                    "chamber": comm_row[2],
-                    "committee_type": comm_row[3],
-                    "is_subcommittee": comm_row[4],
-                    "position": comm_row[5],
-                    "is_current": comm_row[6]
-                }
-                committees.append(committee_info)
-                
-                # Count leadership positions
-                if comm_row[5] and comm_row[5].lower() in ['chair', 'ranking member', 'chairwoman', 'chairman']:
-                    leadership_count += 1
+            # Count leadership positions
+            leadership_count = len([
+                c for c in committees
+                if c["position"] and c["position"].lower() in ['chair', 'ranking member', 'chairwoman', 'chairman']
+            ])
             
             member_data["committees"] = committees
             member_data["committee_summary"] = {
@@ -304,12 +358,24 @@ async def get_members_new_version(
                 "standing_committees": len([c for c in committees if not c["is_subcommittee"]]),
                 "subcommittees": len([c for c in committees if c["is_subcommittee"]])
             }
-        
-        members_response.append(member_data)
     
     if members_response:
         logger.info(f"First member: {members_response[0]['first_name']} {members_response[0]['last_name']} ({members_response[0]['party']}, {members_response[0]['chamber']}, {members_response[0]['state']})")
     
+    if include_total or include_facets:
+        counts = facet_counts(
+            db,
+            select(Member.id, Member.party, Member.state, Member.chamber).where(text(filter_clause)),
+            MEMBER_FACETS if include_facets else [],
+            filter_params,
+        )
+        return {
+            "items": members_response,
+            "total": counts["total"],
+            "facets": counts["facets"] if include_facets else None,
+            "next_cursor": cursor_for_next,
+        }
+    
     return members_response
 
 @router.get("/committees", response_model=List[CommitteeResponse])
@@ -321,10 +387,14 @@ async def get_committees(
     active_only: bool = Query(True, description="Only return active committees"),
     sort_by: Optional[str] = Query("name", description="Sort by field (name, chamber)"),
     sort_order: Optional[str] = Query("asc", description="Sort order (asc/desc)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header (overrides page)"),
+    response: Response = None,
     db: Session = Depends(get_db)
 ):
     """
     Retrieve congressional committees with search, filtering, and sorting
+    
+    The cursor for the following page is returned in the X-Next-Cursor header.
     """
     query = db.query(Committee)
     
@@ -339,20 +409,31 @@ async def get_committees(
     if active_only:
         query = query.filter(Committee.is_active == True)
     
-    # Apply sorting
+    # Apply sorting (NULLs last and id as tiebreaker so keyset paging is stable)
     sort_column = getattr(Committee, sort_by, Committee.name)
-    if sort_order.lower() == "desc":
-        query = query.order_by(desc(sort_column))
+    descending = sort_order.lower() == "desc"
+    query = query.order_by(*keyset_order_by(sort_column, Committee.id, descending))
+    
+    # Apply pagination: continue after the cursor row, or fall back to offset paging
+    if cursor:
+        cursor_value, cursor_id = _decode_cursor_or_400(cursor, sort_column.key, sort_order)
+        query = query.filter(keyset_filter(sort_column, Committee.id, cursor_value, cursor_id, descending))
+        offset = 0
     else:
-        query = query.order_by(sort_column)
+        offset = (page - 1) * limit
     
-    # Apply pagination
-    offset = (page - 1) * limit
-    committees = query.offset(offset).limit(limit).all()
+    # Fetch one extra row to learn whether another page exists
+    committees = query.offset(offset).limit(limit + 1).all()
+    cursor_for_next = next_cursor(
+        committees, limit, sort_column.key, sort_order,
+        lambda row: (getattr(row, sort_column.key), row.id)
+    )
+    if cursor_for_next and response is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_for_next
     
     return [CommitteeResponse.from_orm(committee) for committee in committees]
 
-@router.get("/hearings", response_model=List[HearingResponse])
+@router.get("/hearings", response_model=Union[List[HearingResponse], HearingListResponse])
 async def get_hearings(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=200, description="Items per page"),
@@ -361,10 +442,18 @@ async def get_hearings(
     committee_id: Optional[int] = Query(None, description="Filter by committee ID"),
     sort_by: Optional[str] = Query("scheduled_date", description="Sort by field (title, scheduled_date, created_at)"),
     sort_order: Optional[str] = Query("desc", description="Sort order (asc/desc)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header (overrides page)"),
+    include_total: bool = Query(False, description="Wrap results with the total number of matches"),
+    include_facets: bool = Query(False, description="Wrap results with per-status/type/committee counts"),
+    response: Response = None,
     db: Session = Depends(get_db)
 ):
     """
     Retrieve congressional hearings with search, filtering, and sorting
+    
+    The cursor for the following page is returned in the X-Next-Cursor header.
+    With include_total or include_facets the list is wrapped in an object
+    carrying the counts, computed in one grouped query.
     """
     query = db.query(Hearing)
     
@@ -382,18 +471,43 @@ async def get_hearings(
     if committee_id:
         query = query.filter(Hearing.committee_id == committee_id)
     
-    # Apply sorting
+    # Filters without the cursor, for total and facet counts
+    filtered_statement = query.statement
+    
+    # Apply sorting (NULLs last and id as tiebreaker so keyset paging is stable)
     sort_column = getattr(Hearing, sort_by, Hearing.scheduled_date)
-    if sort_order.lower() == "desc":
-        query = query.order_by(desc(sort_column))
+    descending = sort_order.lower() == "desc"
+    query = query.order_by(*keyset_order_by(sort_column, Hearing.id, descending))
+    
+    # Apply pagination: continue after the cursor row, or fall back to offset paging
+    if cursor:
+        cursor_value, cursor_id = _decode_cursor_or_400(cursor, sort_column.key, sort_order)
+        query = query.filter(keyset_filter(sort_column, Hearing.id, cursor_value, cursor_id, descending))
+        offset = 0
     else:
-        query = query.order_by(sort_column)
+        offset = (page - 1) * limit
     
-    # Apply pagination
-    offset = (page - 1) * limit
-    hearings = query.offset(offset).limit(limit).all()
+    # Fetch one extra row to learn whether another page exists
+    hearings = query.offset(offset).limit(limit + 1).all()
+    cursor_for_next = next_cursor(
+        hearings, limit, sort_column.key, sort_order,
+        lambda row: (getattr(row, sort_column.key), row.id)
+    )
+    if cursor_for_next and response is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_for_next
+    
+    items = [HearingResponse.from_orm(hearing) for hearing in hearings]
+    
+    if include_total or include_facets:
+        counts = facet_counts(db, filtered_statement, HEARING_FACETS if include_facets else [])
+        return {
+            "items": items,
+            "total": counts["total"],
+            "facets": counts["facets"] if include_facets else None,
+            "next_cursor": cursor_for_next,
+        }
     
-    return [HearingResponse.from_orm(hearing) for hearing in hearings]
+    return items
 
 @router.get("/members/{member_id}", response_model=MemberResponse)
 async def get_member(member_id: int, db: Session = Depends(get_db)):
@@ -509,130 +623,110 @@ async def get_committee(committee_id: int, db: Session = Depends(get_db)):
     return CommitteeResponse.from_orm(committee)
 
 @router.get("/committees/{committee_id}/hierarchy", response_model=dict)
-async def get_committee_hierarchy(committee_id: int, db: Session = Depends(get_db)):
-    """
-    Get complete committee hierarchy including subcommittees and member information
+async def get_committee_hierarchy(
+    committee_id: int,
+    depth: Optional[int] = Query(None, ge=0, le=MAX_HIERARCHY_DEPTH, description="Levels of subcommittees to include (default: all)"),
+    db: Session = Depends(get_db)
+):
     """
-    from sqlalchemy import text
+    Get complete committee hierarchy including nested subcommittees and member information
     
-    # Get the main committee
-    main_committee_sql = text("""
+    The whole tree is loaded with one recursive query and the current members
+    of every committee in it with a second query.
+    """
+    from sqlalchemy import text, bindparam
+    
+    max_depth = MAX_HIERARCHY_DEPTH if depth is None else depth
+    
+    # Get the committee and all nested subcommittees
+    tree_sql = text("""
+        WITH RECURSIVE committee_tree AS (
+            SELECT id, name, chamber, committee_type, is_subcommittee, parent_committee_id, 
+                   jurisdiction, chair_member_id, ranking_member_id, is_active, 0 AS depth
+            FROM committees 
+            WHERE id = :committee_id
+            UNION ALL
+            SELECT c.id, c.name, c.chamber, c.committee_type, c.is_subcommittee, c.parent_committee_id, 
+                   c.jurisdiction, c.chair_member_id, c.ranking_member_id, c.is_active, t.depth + 1
+            FROM committees c
+            JOIN committee_tree t ON c.parent_committee_id = t.id
+            WHERE t.depth < :max_depth
+        )
         SELECT id, name, chamber, committee_type, is_subcommittee, parent_committee_id, 
-               jurisdiction, chair_member_id, ranking_member_id, is_active
-        FROM committees 
-        WHERE id = :committee_id
+               jurisdiction, chair_member_id, ranking_member_id, is_active, depth
+        FROM committee_tree
+        ORDER BY depth, name
     """)
     
-    main_result = db.execute(main_committee_sql, {"committee_id": committee_id}).fetchone()
+    tree_rows = db.execute(tree_sql, {"committee_id": committee_id, "max_depth": max_depth}).fetchall()
     
-    if not main_result:
+    if not tree_rows:
         raise HTTPException(status_code=404, detail="Committee not found")
     
-    # Get subcommittees
-    sub_sql = text("""
-        SELECT id, name, chamber, committee_type, is_subcommittee, parent_committee_id, 
-               jurisdiction, chair_member_id, ranking_member_id, is_active
-        FROM committees 
-        WHERE parent_committee_id = :committee_id
-        ORDER BY name
-    """)
-    
-    subcommittees = db.execute(sub_sql, {"committee_id": committee_id}).fetchall()
-    
-    # Get committee members
+    # Get current members of every committee in the tree
     members_sql = text("""
-        SELECT m.id, m.first_name, m.last_name, m.party, m.state, m.chamber, m.district,
+        SELECT cm.committee_id, m.id, m.first_name, m.last_name, m.party, m.state, m.chamber, m.district,
                cm.position, cm.is_current, m.official_photo_url
         FROM committee_memberships cm
         JOIN members m ON cm.member_id = m.id
-        WHERE cm.committee_id = :committee_id AND cm.is_current = true
+        WHERE cm.committee_id IN :committee_ids AND cm.is_current = true
         ORDER BY 
+            cm.committee_id,
             CASE 
                 WHEN cm.position = 'Chair' THEN 1
                 WHEN cm.position = 'Ranking Member' THEN 2
                 ELSE 3
             END,
             m.last_name
-    """)
+    """).bindparams(bindparam("committee_ids", expanding=True))
+    
+    member_rows = db.execute(members_sql, {"committee_ids": [row[0] for row in tree_rows]}).fetchall()
+    
+    members_by_committee = {}
+    for m in member_rows:
+        members_by_committee.setdefault(m[0], []).append({
+            "id": m[1],
+            "first_name": m[2],
+            "last_name": m[3],
+            "party": m[4],
+            "state": m[5],
+            "chamber": m[6],
+            "district": m[7],
+            "position": m[8],
+            "is_current": m[9],
+            "official_photo_url": m[10]
+        })
     
-    members = db.execute(members_sql, {"committee_id": committee_id}).fetchall()
+    # Build the tree; rows arrive parent level first, so parents exist before their children
+    nodes = {}
+    for row in tree_rows:
+        node_members = members_by_committee.get(row[0], [])
+        nodes[row[0]] = {
+            "id": row[0],
+            "name": row[1],
+            "chamber": row[2],
+            "committee_type": row[3],
+            "is_subcommittee": row[4],
+            "parent_committee_id": row[5],
+            "jurisdiction": row[6],
+            "chair_member_id": row[7],
+            "ranking_member_id": row[8],
+            "is_active": row[9],
+            "depth": row[10],
+            "members": node_members,
+            "member_count": len(node_members),
+            "subcommittees": []
+        }
+        if row[10] > 0 and row[5] in nodes:
+            nodes[row[5]]["subcommittees"].append(nodes[row[0]])
     
-    # Build response
+    root = nodes[committee_id]
     committee_data = {
-        "id": main_result[0],
-        "name": main_result[1],
-        "chamber": main_result[2],
-        "committee_type": main_result[3],
-        "is_subcommittee": main_result[4],
-        "parent_committee_id": main_result[5],
-        "jurisdiction": main_result[6],
-        "chair_member_id": main_result[7],
-        "ranking_member_id": main_result[8],
-        "is_active": main_result[9]
+        key: value for key, value in root.items()
+        if key not in ("depth", "members", "member_count", "subcommittees")
     }
-    
-    # Process subcommittees
-    subcommittee_data = []
-    for sub in subcommittees:
-        # Get subcommittee members
-        sub_members_sql = text("""
-            SELECT m.id, m.first_name, m.last_name, m.party, m.state, m.chamber, m.district,
-                   cm.position, cm.is_current, m.official_photo_url
-            FROM committee_memberships cm
-            JOIN members m ON cm.member_id = m.id
-            WHERE cm.committee_id = :sub_committee_id AND cm.is_current = true
-            ORDER BY 
-                CASE 
-                    WHEN cm.position = 'Chair' THEN 1
-                    WHEN cm.position = 'Ranking Member' THEN 2
-                    ELSE 3
-                END,
-                m.last_name
-        """)
-        
-        sub_members = db.execute(sub_members_sql, {"sub_committee_id": sub[0]}).fetchall()
-        
-        subcommittee_data.append({
-            "id": sub[0],
-            "name": sub[1],
-            "chamber": sub[2],
-            "committee_type": sub[3],
-            "is_subcommittee": sub[4],
-            "parent_committee_id": sub[5],
-            "jurisdiction": sub[6],
-            "chair_member_id": sub[7],
-            "ranking_member_id": sub[8],
-            "is_active": sub[9],
-            "members": [{
-                "id": m[0],
-                "first_name": m[1],
-                "last_name": m[2],
-                "party": m[3],
-                "state": m[4],
-                "chamber": m[5],
-                "district": m[6],
-                "position": m[7],
-                "is_current": m[8],
-                "official_photo_url": m[9]
-            } for m in sub_members],
-            "member_count": len(sub_members)
-        })
-    
-    # Process main committee members
-    member_data = []
-    for m in members:
-        member_data.append({
-            "id": m[0],
-            "first_name": m[1],
-            "last_name": m[2],
-            "party": m[3],
-            "state": m[4],
-            "chamber": m[5],
-            "district": m[6],
-            "position": m[7],
-            "is_current": m[8],
-            "official_photo_url": m[9]
-        })
+    member_data = root["members"]
+    descendants = [node for node in nodes.values() if node["depth"] > 0]
     
     # Calculate statistics
     party_breakdown = {}
@@ -647,13 +741,14 @@ async def get_committee_hierarchy(committee_id: int, db: Session = Depends(get_d
     return {
         "committee": committee_data,
         "members": member_data,
-        "subcommittees": subcommittee_data,
+        "subcommittees": root["subcommittees"],
         "statistics": {
             "total_members": len(member_data),
-            "total_subcommittees": len(subcommittee_data),
+            "total_subcommittees": len(descendants),
             "party_breakdown": party_breakdown,
             "leadership_positions": len(leadership_positions),
-            "total_subcommittee_members": sum(sub["member_count"] for sub in subcommittee_data)
+            "total_subcommittee_members": sum(sub["member_count"] for sub in descendants),
+            "max_depth": max(node["depth"] for node in nodes.values())
         }
     }
 
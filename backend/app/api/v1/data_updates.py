@@ -4,10 +4,12 @@ API endpoints for data updates and management.
 """
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import structlog
 from ...core.database import get_db
+from ...core.read_cache import invalidate_read_cache
 from ...services.data_processor import DataProcessor
+from ...services.quota_ledger import QuotaDeferredError
 
 logger = structlog.get_logger()
 
@@ -178,7 +180,7 @@ async def test_congress_api():
         }
         
         # Test basic API connectivity
-        members = await data_processor.congress_api.get_members(chamber="house")
+        members = await data_processor.congress_api.get_members(chamber="house", max_items=250)
         rate_limit_status = data_processor.congress_api.get_rate_limit_status()
         
         return {
@@ -241,6 +243,24 @@ async def test_scrapers():
         raise HTTPException(status_code=500, detail=f"Scrapers test failed: {str(e)}")
 
 
+@router.get("/stats/scrapers")
+async def scraper_stats():
+    """
+    Get scraped page change-detection statistics.
+    
+    Returns:
+        Pages answered from stored fingerprints (hits) versus parsed (misses)
+    """
+    try:
+        from scrapers import get_shared_page_fingerprints
+        
+        return get_shared_page_fingerprints().get_stats()
+        
+    except Exception as e:
+        logger.error("Error getting scraper stats", error=str(e))
+        raise HTTPException(status_code=500, detail=f"Failed to get scraper stats: {str(e)}")
+
+
 @router.get("/stats/database")
 async def database_stats(db: Session = Depends(get_db)):
     """
@@ -253,27 +273,46 @@ async def database_stats(db: Session = Depends(get_db)):
         Database statistics
     """
     try:
+        from sqlalchemy import select, func, case, true
         from ...models import Member, Committee, Hearing
         
+        def count_where(condition, name):
+            return func.count(case((condition, 1))).label(name)
+        
+        # One aggregate row per table, joined into a single statement
+        aggregates = {
+            "members": select(
+                func.count().label("total"),
+                count_where(Member.chamber == "House", "house"),
+                count_where(Member.chamber == "Senate", "senate"),
+                count_where(Member.is_current == True, "current"),
+            ).subquery(),
+            "committees": select(
+                func.count().label("total"),
+                count_where(Committee.chamber == "House", "house"),
+                count_where(Committee.chamber == "Senate", "senate"),
+                count_where(Committee.is_active == True, "active"),
+                count_where(Committee.is_subcommittee == True, "subcommittees"),
+            ).subquery(),
+            "hearings": select(
+                func.count().label("total"),
+                count_where(Hearing.status == "Scheduled", "scheduled"),
+                count_where(Hearing.status == "Completed", "completed"),
+            ).subquery(),
+        }
+        
+        members, committees, hearings = aggregates.values()
+        stmt = select(*[
+            column.label(f"{table}__{column.name}")
+            for table, subquery in aggregates.items()
+            for column in subquery.c
+        ]).select_from(members.join(committees, true()).join(hearings, true()))
+        
+        row = db.execute(stmt).one()._mapping
+        
         stats = {
-            "members": {
-                "total": db.query(Member).count(),
-                "house": db.query(Member).filter(Member.chamber == "House").count(),
-                "senate": db.query(Member).filter(Member.chamber == "Senate").count(),
-                "current": db.query(Member).filter(Member.is_current == True).count(),
-            },
-            "committees": {
-                "total": db.query(Committee).count(),
-                "house": db.query(Committee).filter(Committee.chamber == "House").count(),
-                "senate": db.query(Committee).filter(Committee.chamber == "Senate").count(),
-                "active": db.query(Committee).filter(Committee.is_active == True).count(),
-                "subcommittees": db.query(Committee).filter(Committee.is_subcommittee == True).count(),
-            },
-            "hearings": {
-                "total": db.query(Hearing).count(),
-                "scheduled": db.query(Hearing).filter(Hearing.status == "Scheduled").count(),
-                "completed": db.query(Hearing).filter(Hearing.status == "Completed").count(),
-            }
+            table: {column.name: row[f"{table}__{column.name}"] for column in subquery.c}
+            for table, subquery in aggregates.items()
         }
         
         return stats
@@ -349,6 +388,7 @@ async def populate_test_relationships(
         
         # Commit changes
         db.commit()
+        invalidate_read_cache()
         
         return {
             "message": "Test relationship data created successfully",
@@ -402,6 +442,79 @@ async def populate_relationships(
         raise HTTPException(status_code=500, detail="Failed to start relationship data population")
 
 
+@router.get("/failed-lookups")
+async def failed_lookups(kind: Optional[str] = None, db: Session = Depends(get_db)):
+    """
+    List Congress.gov lookups waiting in the dead-letter queue.
+    
+    Args:
+        kind: Only list this lookup kind, e.g. member_committees
+        db: Database session
+    
+    Returns:
+        Queued failures with error class, attempts and next retry time
+    """
+    from ...models import FailedLookup
+    
+    query = db.query(FailedLookup)
+    if kind:
+        query = query.filter(FailedLookup.kind == kind)
+    entries = query.order_by(FailedLookup.kind, FailedLookup.first_failed_at).all()
+    
+    return {
+        "total": len(entries),
+        "failures": [
+            {
+                "kind": entry.kind,
+                "key": entry.key,
+                "error_class": entry.error_class,
+                "error_message": entry.error_message,
+                "attempts": entry.attempts,
+                "first_failed_at": entry.first_failed_at,
+                "last_failed_at": entry.last_failed_at,
+                "next_attempt_at": entry.next_attempt_at,
+                "gave_up": entry.gave_up,
+            }
+            for entry in entries
+        ],
+    }
+
+
+@router.post("/populate/retry-failed-memberships")
+async def retry_failed_memberships(
+    include_gave_up: bool = False,
+    limit: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Re-process only the members whose committee lookup failed and is due for a retry.
+    
+    Args:
+        include_gave_up: Also retry members that reached the attempt limit
+        limit: Maximum number of members to retry
+        db: Database session
+    
+    Returns:
+        Retry statistics
+    """
+    try:
+        from ...services.relationship_data_collector import RelationshipDataCollector
+        
+        collector = RelationshipDataCollector(db)
+        stats = await collector.retry_failed_memberships(include_gave_up=include_gave_up, limit=limit)
+        
+        return {
+            "message": "Failed committee lookups retried",
+            "results": stats
+        }
+    
+    except QuotaDeferredError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        logger.error("Error retrying failed committee lookups", error=str(e))
+        raise HTTPException(status_code=500, detail="Failed to retry failed committee lookups")
+
+
 # REMOVED DUPLICATE /members, /committees, /hearings endpoints
 # These were overriding the advanced filtering endpoints in data_retrieval.py
 # Using the ones in data_retrieval.py which have proper search and filtering capabilities
\ No newline at end of file
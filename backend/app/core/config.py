@@ -2,10 +2,14 @@
 Core configuration settings for the Congressional Data Automation Service.
 """
 import os
-from typing import Optional, List
+from typing import Optional, List, Dict
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+# Local state files default to the backend directory, wherever the service is started from,
+# so the service and the root scripts open the same files
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 
 class Settings(BaseSettings):
     """Application settings."""
@@ -21,16 +25,79 @@ class Settings(BaseSettings):
     # Database
     database_url: str = Field(..., env="DATABASE_URL")
     database_echo: bool = Field(default=False, env="DATABASE_ECHO")
+    ingest_batch_size: int = 500  # rows per bulk INSERT/UPDATE statement
     
     # Congress.gov API
     congress_api_key: str = Field(..., env="CONGRESS_API_KEY")
     congress_api_base_url: str = "https://api.congress.gov/v3"
     congress_api_rate_limit: int = 5000  # requests per day
-    congress_api_request_delay: float = 1.0  # seconds between requests
+    congress_api_quota_path: str = os.path.join(BACKEND_DIR, "congress_api_quota.db")  # ledger shared by every client and script
+    congress_api_requests_per_second: float = 10.0  # sustained rate shared by all clients
+    congress_api_burst: int = 20  # requests allowed back-to-back before pacing kicks in
+    congress_api_min_requests_per_second: float = 0.2  # floor when the server budget runs low
+    congress_api_rate_smoothing: float = 0.3  # how quickly pacing follows x-ratelimit-remaining (0-1]
+    congress_api_rate_window: int = 3600  # seconds; assumed reset time when x-ratelimit-reset is absent
+    congress_api_rate_headroom: float = 0.2  # share of the server budget left below which pacing slows
+    congress_api_max_retries: int = 3  # retries after 429 Too Many Requests
+    congress_api_max_concurrency: int = 10  # in-flight requests for fan-out collections
+    congress_api_coalesce_requests: bool = True  # share one call between identical concurrent requests
+    congress_api_hedge_requests: bool = False  # duplicate requests that outlive the latency percentile
+    congress_api_hedge_percentile: float = 0.95  # per-endpoint latency percentile that triggers a hedge
+    congress_api_hedge_budget: float = 0.05  # hedges allowed per request (caps the extra quota spent)
+    congress_api_hedge_min_delay: float = 0.25  # seconds; never hedge sooner than this
+    congress_api_hedge_min_samples: int = 20  # latencies needed for an endpoint before hedging it
+    congress_api_latency_window: int = 500  # recent latencies kept per endpoint
+    congress_api_checkpoint_path: str = os.path.join(BACKEND_DIR, "congress_api_checkpoints.db")  # progress of paginated collections
+    congress_api_checkpoint_max_age: int = 24 * 3600  # seconds; older checkpoints restart from offset 0
+    congress_api_priority_reserves: Dict[str, float] = {  # share of the daily quota each class leaves unspent
+        "high": 0.0,
+        "normal": 0.1,
+        "low": 0.3,
+    }
+    congress_api_work_priorities: Dict[str, str] = {  # priority class per scheduled job
+        "hearings": "high",
+        "members": "normal",
+        "committees": "normal",
+        "relationships": "low",
+    }
+    congress_api_unscheduled_priority: str = "normal"  # class whose reserve applies to requests outside a job
+    
+    # Dead-letter retries for failed lookups
+    dead_letter_base_delay: float = 60.0  # seconds before the first retry; doubles per attempt
+    dead_letter_max_delay: float = 6 * 3600.0  # cap on the retry delay
+    dead_letter_max_attempts: int = 8  # stop retrying a key automatically after this many failures
+    
+    # Congress.gov response cache
+    congress_api_cache_mode: str = "read_write"  # off, read_write, or replay (never hit the network)
+    congress_api_cache_path: str = os.path.join(BACKEND_DIR, "congress_api_cache.db")
+    congress_api_cache_max_bytes: int = 256 * 1024 * 1024  # compressed bodies, LRU-evicted beyond this
+    congress_api_cache_default_ttl: int = 3600  # seconds
+    congress_api_cache_ttls: Dict[str, int] = {  # seconds, by first path segment
+        "member": 24 * 3600,
+        "committee": 7 * 24 * 3600,
+        "hearing": 6 * 3600,
+        "bill": 3600,
+    }
+    congress_api_timeout: float = 30.0  # seconds per request
+    congress_api_connect_timeout: float = 10.0  # seconds to establish a connection
+    congress_api_max_connections: int = 20  # pooled connections kept by the shared client
+    congress_api_max_keepalive_connections: int = 10
+    congress_api_keepalive_expiry: float = 60.0  # seconds an idle connection stays open
+    congress_api_http2: bool = True  # only used when the h2 package is installed
+    
+    # Retrieval response cache (in-process, invalidated by the update jobs)
+    read_cache_ttl: float = 300.0  # seconds; 0 disables caching
+    read_cache_max_entries: int = 1024  # least recently used responses evicted beyond this
     
     # Web scraping
-    scraping_delay: float = 1.0  # seconds between requests
+    scraping_delay: float = 1.0  # seconds between requests to the same host
     scraping_timeout: int = 30  # seconds
+    scraping_max_connections: int = 20  # pooled connections shared by every scraper
+    scraping_max_concurrency: int = 8  # pages fetched at once during a crawl
+    scraping_host_concurrency: int = 2  # requests in flight per host
+    scraping_parse_workers: int = 2  # processes parsing scraped pages; 0 parses on the event loop
+    scraping_parser: str = "html.parser"  # or lxml / selectolax (opt-in); falls back to html.parser if not installed
+    scraping_fingerprint_path: str = os.path.join(BACKEND_DIR, "scraper_pages.db")  # page hashes and validators used to skip unchanged pages
     scraping_user_agent: str = "Congressional Data Automator (https://github.com/noelmcmichael/congress-data-automator)"
     
     # Authentication
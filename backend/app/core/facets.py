@@ -0,0 +1,70 @@
+"""
+Total and facet counts for filtered listings in a single grouped query.
+"""
+from typing import Any, Dict, List, Optional
+from sqlalchemy import String, cast, func, literal, select, tuple_, union_all
+from sqlalchemy.orm import Session
+
+
+def facet_counts(db: Session, base, facet_columns: List[str],
+                 params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Count the rows matched by a filtered query, overall and per facet value.
+    
+    On PostgreSQL this is one GROUP BY GROUPING SETS query; other databases
+    (notably the SQLite test database) get the equivalent UNION ALL of
+    per-facet GROUP BYs, which is still a single statement.
+    
+    Args:
+        db: Database session
+        base: Select statement carrying the listing's filters (no ORDER BY/LIMIT)
+        facet_columns: Columns of `base` to count distinct values of
+        params: Bind parameters for text() fragments in `base`
+    
+    Returns:
+        Dictionary with "total" and "facets" ({column: {value: count}})
+    """
+    filtered = base.subquery()
+    columns = [filtered.c[name] for name in facet_columns]
+    total = 0
+    facets = {name: {} for name in facet_columns}
+    
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = select(
+            *[func.grouping(column) for column in columns],
+            *columns,
+            func.count(),
+        ).group_by(func.grouping_sets(*[tuple_(column) for column in columns], tuple_()))
+        
+        for row in db.execute(stmt, params or {}):
+            flags = row[:len(columns)]
+            values = row[len(columns):-1]
+            count = row[-1]
+            if all(flags):
+                total = count
+                continue
+            index = flags.index(0)
+            facets[facet_columns[index]][_facet_key(values[index])] = count
+    else:
+        stmt = union_all(
+            *[
+                select(literal(name).label("facet"), cast(column, String).label("value"), func.count())
+                .group_by(column)
+                for name, column in zip(facet_columns, columns)
+            ],
+            select(literal(None, String).label("facet"), literal(None, String).label("value"), func.count())
+            .select_from(filtered),
+        )
+        
+        for facet, value, count in db.execute(stmt, params or {}):
+            if facet is None:
+                total = count
+            else:
+                facets[facet][_facet_key(value)] = count
+    
+    return {"total": total, "facets": facets}
+
+
+def _facet_key(value: Any) -> str:
+    """Use a stable JSON object key for facet values, including NULL."""
+    return "unknown" if value is None else str(value)
@@ -0,0 +1,177 @@
+"""
+Opaque cursor helpers for keyset pagination.
+
+A cursor records the sort the page was produced with plus the sort value
+and id of the last row returned. The next page continues strictly after
+that (value, id) pair, so its cost does not grow with the page depth the
+way LIMIT/OFFSET does. Rows are ordered by the sort column with NULLs
+last, then by id in the same direction as a tiebreaker.
+"""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy import and_, or_
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor cannot be decoded or belongs to a different sort."""
+
+
+def _encode_value(value: Any) -> Dict[str, Any]:
+    """Encode a sort value with a type tag so it round-trips through JSON."""
+    if isinstance(value, datetime):
+        return {"t": "datetime", "v": value.isoformat()}
+    if isinstance(value, date):
+        return {"t": "date", "v": value.isoformat()}
+    return {"t": "raw", "v": value}
+
+
+def _decode_value(encoded: Dict[str, Any]) -> Any:
+    """Decode a sort value produced by _encode_value."""
+    if encoded["t"] == "datetime":
+        return datetime.fromisoformat(encoded["v"])
+    if encoded["t"] == "date":
+        return date.fromisoformat(encoded["v"])
+    if encoded["t"] == "raw":
+        return encoded["v"]
+    raise InvalidCursorError(f"Unknown cursor value type: {encoded['t']}")
+
+
+def encode_cursor(sort_by: str, sort_order: str, value: Any, row_id: int) -> str:
+    """
+    Build an opaque cursor pointing just after a row.
+    
+    Args:
+        sort_by: Sort column name
+        sort_order: Sort direction (asc/desc)
+        value: Sort column value of the last row returned
+        row_id: Id of the last row returned
+    
+    Returns:
+        URL-safe cursor string
+    """
+    payload = {"s": sort_by, "o": sort_order.lower(), "v": _encode_value(value), "i": row_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_order: str) -> Tuple[Any, int]:
+    """
+    Decode a cursor and check it matches the requested sort.
+    
+    Args:
+        cursor: Cursor from a previous response
+        sort_by: Sort column name of the current request
+        sort_order: Sort direction of the current request
+    
+    Returns:
+        Tuple of (sort value, row id) of the last row already returned
+    
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for another sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        value = _decode_value(payload["v"])
+        row_id = int(payload["i"])
+        cursor_sort, cursor_order = payload["s"], payload["o"]
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Malformed cursor") from e
+    
+    if cursor_sort != sort_by or cursor_order != sort_order.lower():
+        raise InvalidCursorError("Cursor was issued for a different sort order")
+    
+    return value, row_id
+
+
+def keyset_filter(sort_column, id_column, value: Any, row_id: int, descending: bool):
+    """
+    Build the ORM condition selecting rows after (value, row_id).
+    
+    Args:
+        sort_column: Sort column attribute
+        id_column: Primary key column attribute
+        value: Sort value of the last row returned
+        row_id: Id of the last row returned
+        descending: Whether the sort is descending
+    
+    Returns:
+        SQLAlchemy boolean expression
+    """
+    if value is None:
+        # Already inside the trailing NULL block; only the id tiebreaker remains
+        return and_(sort_column.is_(None), id_column < row_id if descending else id_column > row_id)
+    
+    if descending:
+        after = or_(sort_column < value, and_(sort_column == value, id_column < row_id))
+    else:
+        after = or_(sort_column > value, and_(sort_column == value, id_column > row_id))
+    return or_(after, sort_column.is_(None))
+
+
+def keyset_order_by(sort_column, id_column, descending: bool) -> list:
+    """
+    Build the ORDER BY matching keyset_filter.
+    
+    Args:
+        sort_column: Sort column attribute
+        id_column: Primary key column attribute
+        descending: Whether the sort is descending
+    
+    Returns:
+        List of ORDER BY clauses
+    """
+    if descending:
+        return [sort_column.desc().nulls_last(), id_column.desc()]
+    return [sort_column.asc().nulls_last(), id_column.asc()]
+
+
+def keyset_sql(column: str, value: Any, row_id: int, descending: bool) -> Tuple[str, Dict[str, Any]]:
+    """
+    Raw SQL equivalent of keyset_filter for text() queries.
+    
+    Args:
+        column: Sort column name (must already be validated against a whitelist)
+        value: Sort value of the last row returned
+        row_id: Id of the last row returned
+        descending: Whether the sort is descending
+    
+    Returns:
+        Tuple of (SQL condition, bind parameters)
+    """
+    op = "<" if descending else ">"
+    params = {"cursor_value": value, "cursor_id": row_id}
+    if value is None:
+        return f"({column} IS NULL AND id {op} :cursor_id)", params
+    return (
+        f"({column} {op} :cursor_value OR ({column} = :cursor_value AND id {op} :cursor_id) OR {column} IS NULL)",
+        params,
+    )
+
+
+def next_cursor(rows: list, limit: int, sort_by: str, sort_order: str, get_value) -> Optional[str]:
+    """
+    Build the cursor for the page after `rows`.
+    
+    Callers fetch limit + 1 rows; the extra row only signals that another
+    page exists and is dropped from `rows` in place.
+    
+    Args:
+        rows: Rows fetched with limit + 1
+        limit: Page size
+        sort_by: Sort column name
+        sort_order: Sort direction
+        get_value: Callable returning (sort value, id) for a row
+    
+    Returns:
+        Cursor string, or None on the last page
+    """
+    if len(rows) <= limit:
+        return None
+    
+    del rows[limit:]
+    value, row_id = get_value(rows[-1])
+    return encode_cursor(sort_by, sort_order, value, row_id)
@@ -0,0 +1,216 @@
+"""
+In-process response cache for read-mostly retrieval endpoints.
+
+Entries are keyed by path plus normalized query parameters and expire
+after a TTL, with the least recently used entries evicted beyond a size
+limit. Every entry also records the data version it was rendered at; the
+update jobs call invalidate_read_cache() after committing, which bumps
+the version so older entries are dropped on their next lookup. The
+version lives in process memory, so each worker process caches and
+invalidates independently.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlencode
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from .config import settings
+
+# Response headers stored alongside cached bodies
+CACHED_HEADERS = ("x-next-cursor",)
+
+
+@dataclass
+class CachedEntry:
+    """A rendered response body and its validators."""
+    body: bytes
+    media_type: Optional[str]
+    headers: Dict[str, str]
+    etag: str
+    version: int
+    expires_at: float
+
+
+class ReadCache:
+    """
+    Thread-safe TTL + LRU cache of rendered GET responses.
+    """
+    
+    def __init__(self, ttl: float, max_entries: int):
+        """
+        Args:
+            ttl: Seconds an entry stays valid (0 disables caching)
+            max_entries: Maximum number of cached responses
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.version = 0
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0, "evicted": 0}
+        self._entries: "OrderedDict[str, CachedEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @property
+    def enabled(self) -> bool:
+        """Return True if responses should be cached."""
+        return self.ttl > 0 and self.max_entries > 0
+    
+    @staticmethod
+    def make_key(path: str, query_items: Iterable[Tuple[str, str]]) -> str:
+        """
+        Build a cache key from a path and its query parameters in sorted order.
+        
+        Args:
+            path: Request path
+            query_items: Query parameter (name, value) pairs
+        
+        Returns:
+            Cache key
+        """
+        return f"{path}?{urlencode(sorted(query_items))}"
+    
+    def get(self, key: str) -> Optional[CachedEntry]:
+        """
+        Look up a response rendered at the current version.
+        
+        Args:
+            key: Cache key from make_key
+        
+        Returns:
+            Cached entry or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.version != self.version or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.stats["misses"] += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry
+    
+    def put(self, key: str, body: bytes, media_type: Optional[str],
+            headers: Dict[str, str], version: int) -> CachedEntry:
+        """
+        Store a rendered response.
+        
+        Args:
+            key: Cache key from make_key
+            body: Response body
+            media_type: Response media type
+            headers: Response headers to replay on hits
+            version: Data version the response was rendered at
+        
+        Returns:
+            The new entry (not stored if the version moved on meanwhile)
+        """
+        entry = CachedEntry(
+            body=body,
+            media_type=media_type,
+            headers=headers,
+            etag=f'"{hashlib.sha1(body).hexdigest()}"',
+            version=version,
+            expires_at=time.monotonic() + self.ttl,
+        )
+        
+        with self._lock:
+            if version != self.version:
+                return entry
+            
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evicted"] += 1
+        
+        return entry
+    
+    def invalidate(self) -> None:
+        """Bump the data version so every existing entry becomes stale."""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+            self.stats["invalidations"] += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Cache counters and size information
+        """
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "version": self.version,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                **self.stats,
+            }
+
+
+# Cache shared by every cached route in the process
+read_cache = ReadCache(ttl=settings.read_cache_ttl, max_entries=settings.read_cache_max_entries)
+
+
+def invalidate_read_cache() -> None:
+    """Drop cached retrieval responses after the underlying data changed."""
+    read_cache.invalidate()
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match covers the given ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def _render(request: Request, entry: CachedEntry, cache_status: str) -> Response:
+    """Build the response for an entry, answering 304 when the client has it."""
+    headers = {**entry.headers, "ETag": entry.etag, "X-Cache": cache_status}
+    if _etag_matches(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+
+
+class CachedRoute(APIRoute):
+    """
+    Route class serving successful GET responses from the read cache.
+    
+    Use as APIRouter(route_class=CachedRoute). Responses carry an ETag and
+    conditional requests with a matching If-None-Match get 304 Not Modified.
+    """
+    
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        
+        async def cached_handler(request: Request) -> Response:
+            if request.method != "GET" or not read_cache.enabled:
+                return await handler(request)
+            
+            key = read_cache.make_key(request.url.path, request.query_params.multi_items())
+            entry = read_cache.get(key)
+            if entry is not None:
+                return _render(request, entry, "HIT")
+            
+            version = read_cache.version
+            response = await handler(request)
+            if response.status_code != 200 or not hasattr(response, "body"):
+                return response
+            
+            headers = {
+                name: value for name, value in response.headers.items()
+                if name.lower() in CACHED_HEADERS
+            }
+            entry = read_cache.put(key, response.body, response.media_type, headers, version)
+            return _render(request, entry, "MISS")
+        
+        return cached_handler
@@ -7,7 +7,8 @@ from fastapi.responses import JSONResponse
 import structlog
 from .core.config import settings
 from .core.database import engine, Base
-from .services.congress_api import CongressApiClient
+from .core.read_cache import read_cache
+from .services.congress_api import CongressApiClient, get_http_client, close_http_client
 
 # Configure structured logging
 structlog.configure(
@@ -49,7 +50,9 @@ app.add_middleware(
 )
 
 # Import models to ensure they're registered with Base
-from .models import Member, Committee, CommitteeMembership, Hearing, Witness, HearingDocument
+from .models import (
+    Member, Committee, CommitteeMembership, Hearing, Witness, HearingDocument, SyncState, FailedLookup,
+)
 
 # Create database tables (commented out for deployment - tables already exist)
 # Base.metadata.create_all(bind=engine)
@@ -62,12 +65,30 @@ congress_api = CongressApiClient()
 async def startup_event():
     """Application startup event."""
     logger.info("Starting Congressional Data Automation Service")
+    
+    # Open the shared Congress.gov connection pool
+    get_http_client()
+    
+    # Bookkeeping tables added after the initial deployment
+    for model in (SyncState, FailedLookup):
+        try:
+            model.__table__.create(bind=engine, checkfirst=True)
+        except Exception as e:
+            logger.warning("Could not ensure bookkeeping table exists", table=model.__tablename__, error=str(e))
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown event."""
     logger.info("Shutting down Congressional Data Automation Service")
+    
+    # Release pooled Congress.gov connections
+    await close_http_client()
+    
+    # Release pooled scraper connections and parse workers (the data processor puts scrapers on the path)
+    from scrapers import close_scraper_session, shutdown_parse_pool
+    await close_scraper_session()
+    shutdown_parse_pool()
 
 
 @app.get("/")
@@ -94,6 +115,7 @@ async def api_status():
     return {
         "api_status": "active",
         "congress_api_rate_limit": rate_limit_status,
+        "read_cache": read_cache.get_stats(),
         "database_status": "connected",
         "version": settings.app_version,
     }
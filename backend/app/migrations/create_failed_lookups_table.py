@@ -0,0 +1,24 @@
+"""
+Database migration to create the failed_lookups table used as the dead-letter queue.
+"""
+import asyncio
+from sqlalchemy import create_engine
+from ..core.config import settings
+from ..models.failed_lookup import FailedLookup
+
+async def migrate_create_failed_lookups_table():
+    """
+    Create the failed_lookups table if it does not already exist.
+    """
+    engine = create_engine(settings.database_url)
+    
+    try:
+        FailedLookup.__table__.create(bind=engine, checkfirst=True)
+        print("failed_lookups table is present")
+        
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        raise
+
+if __name__ == '__main__':
+    asyncio.run(migrate_create_failed_lookups_table())
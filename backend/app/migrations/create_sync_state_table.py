@@ -0,0 +1,24 @@
+"""
+Database migration to create the sync_state table used by incremental syncs.
+"""
+import asyncio
+from sqlalchemy import create_engine
+from ..core.config import settings
+from ..models.sync_state import SyncState
+
+async def migrate_create_sync_state_table():
+    """
+    Create the sync_state table if it does not already exist.
+    """
+    engine = create_engine(settings.database_url)
+    
+    try:
+        SyncState.__table__.create(bind=engine, checkfirst=True)
+        print("sync_state table is present")
+        
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        raise
+
+if __name__ == '__main__':
+    asyncio.run(migrate_create_sync_state_table())
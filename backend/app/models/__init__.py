@@ -4,6 +4,8 @@ Database models for the Congressional Data Automation Service.
 from .member import Member
 from .committee import Committee, CommitteeMembership
 from .hearing import Hearing, Witness, HearingDocument
+from .sync_state import SyncState
+from .failed_lookup import FailedLookup
 
 __all__ = [
     "Member",
@@ -12,4 +14,6 @@ __all__ = [
     "Hearing",
     "Witness",
     "HearingDocument",
+    "SyncState",
+    "FailedLookup",
 ]
\ No newline at end of file
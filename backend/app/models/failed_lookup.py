@@ -0,0 +1,38 @@
+"""
+Database model for the dead-letter queue of failed Congress.gov lookups.
+"""
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, UniqueConstraint
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+
+class FailedLookup(Base):
+    """
+    A lookup that failed and is waiting to be retried, such as one member's committee assignments.
+    """
+    __tablename__ = "failed_lookups"
+    __table_args__ = (UniqueConstraint("kind", "key", name="uq_failed_lookups_kind_key"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    
+    # What failed: the lookup type (member_committees, ...) and its key (bioguide ID, ...)
+    kind = Column(String(50), nullable=False, index=True)
+    key = Column(String(100), nullable=False)
+    
+    # Last error seen
+    error_class = Column(String(100))
+    error_message = Column(Text)
+    
+    # Retry bookkeeping
+    attempts = Column(Integer, default=0, nullable=False)
+    first_failed_at = Column(DateTime(timezone=True))
+    last_failed_at = Column(DateTime(timezone=True))
+    next_attempt_at = Column(DateTime(timezone=True), index=True)
+    gave_up = Column(Boolean, default=False, nullable=False)  # max attempts reached
+    
+    # Metadata
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<FailedLookup {self.kind}:{self.key} ({self.attempts} attempts)>"
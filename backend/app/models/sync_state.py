@@ -0,0 +1,35 @@
+"""
+Database model for incremental synchronization state.
+"""
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+
+class SyncState(Base):
+    """
+    High-water mark and run bookkeeping for an incrementally synced resource.
+    """
+    __tablename__ = "sync_state"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    
+    # Resource being synced (members, committees, hearings, ...)
+    resource = Column(String(50), unique=True, index=True, nullable=False)
+    
+    # Latest source updateDate seen; the next delta run requests changes after this
+    high_water_mark = Column(DateTime(timezone=True))
+    
+    # Run bookkeeping
+    last_run_at = Column(DateTime(timezone=True))
+    last_full_sync_at = Column(DateTime(timezone=True))
+    last_run_mode = Column(String(20))  # full or incremental
+    records_seen = Column(Integer, default=0)
+    records_changed = Column(Integer, default=0)
+    
+    # Metadata
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<SyncState {self.resource} ({self.high_water_mark})>"
@@ -2,7 +2,7 @@
 Hearing response schemas
 """
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pydantic import BaseModel, ConfigDict
 
 class HearingResponse(BaseModel):
@@ -28,4 +28,11 @@ class HearingResponse(BaseModel):
     scraped_video_urls: Optional[List[str]] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
-    last_scraped_at: Optional[datetime] = None
\ No newline at end of file
+    last_scraped_at: Optional[datetime] = None
+
+class HearingListResponse(BaseModel):
+    """Hearing listing with optional total and facet counts."""
+    items: List[HearingResponse]
+    total: Optional[int] = None
+    facets: Optional[Dict[str, Dict[str, int]]] = None
+    next_cursor: Optional[str] = None
@@ -2,7 +2,7 @@
 Member response schemas
 """
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, ConfigDict
 
 class MemberResponse(BaseModel):
@@ -22,4 +22,11 @@ class MemberResponse(BaseModel):
     official_photo_url: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
-    last_scraped_at: Optional[datetime] = None
\ No newline at end of file
+    last_scraped_at: Optional[datetime] = None
+
+class MemberListResponse(BaseModel):
+    """Member listing with optional total and facet counts."""
+    items: List[dict]
+    total: Optional[int] = None
+    facets: Optional[Dict[str, Dict[str, int]]] = None
+    next_cursor: Optional[str] = None
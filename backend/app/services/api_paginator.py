@@ -0,0 +1,178 @@
+"""
+Async pagination over Congress.gov list endpoints.
+"""
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+PageFetcher = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+# Awaited with a page's items and the next offset (None after the last page)
+PageCallback = Callable[[List[Dict[str, Any]], Optional[int]], Awaitable[None]]
+
+# Largest page size Congress.gov accepts
+MAX_PAGE_SIZE = 250
+
+
+def next_offset(page: Dict[str, Any], offset: int, page_size: int, item_count: int) -> Optional[int]:
+    """
+    Work out the offset of the page after `page`.
+    
+    Follows pagination.next when the response has one. Responses without a
+    pagination block fall back to offsets for as long as pages come back full.
+    
+    Args:
+        page: Response body of the current page
+        offset: Offset the current page was requested at
+        page_size: Requested page size
+        item_count: Number of items on the current page
+    
+    Returns:
+        Next offset, or None on the last page
+    """
+    pagination = page.get("pagination")
+    if pagination is not None:
+        next_url = pagination.get("next")
+        if not next_url:
+            return None
+        query = parse_qs(urlparse(next_url).query)
+        if "offset" in query:
+            try:
+                following = int(query["offset"][0])
+            except ValueError:
+                following = offset + page_size
+        else:
+            following = offset + page_size
+        # Guard against a server that keeps pointing at the same page
+        return following if following > offset else None
+    
+    return offset + page_size if item_count >= page_size else None
+
+
+async def paginate(
+    fetch_page: PageFetcher,
+    items_key: str,
+    params: Optional[Dict[str, Any]] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    max_items: Optional[int] = None,
+    parallel: bool = False,
+    concurrency: int = 4,
+    start_offset: int = 0,
+    on_page: Optional[PageCallback] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield every item of a paginated list endpoint.
+    
+    The next page is requested as soon as the current one arrives, so the
+    network round trip overlaps with the caller consuming the current
+    page. With `parallel`, once the first page reports pagination.count,
+    all remaining pages are requested up front (at most `concurrency` at a
+    time) and yielded in order.
+    
+    `on_page` runs once every item of a page has been yielded, which lets
+    callers checkpoint progress and later resume from `start_offset`.
+    
+    Args:
+        fetch_page: Coroutine fetching one page for the given query parameters
+        items_key: Key of the item list in each page, e.g. "members"
+        params: Query parameters shared by every page
+        page_size: Items requested per page
+        max_items: Stop after yielding this many items
+        parallel: Fan out the remaining pages once the total count is known
+        concurrency: Maximum pages in flight when fanning out
+        start_offset: Offset of the first page to request
+        on_page: Coroutine awaited after each fully yielded page with its items and the next offset
+    
+    Yields:
+        Items in API order
+    """
+    base_params = dict(params or {})
+    page_size = min(page_size, MAX_PAGE_SIZE)
+    if max_items is not None:
+        page_size = min(page_size, max_items)
+    yielded = 0
+    
+    def fetch(offset: int) -> "asyncio.Task[Dict[str, Any]]":
+        return asyncio.ensure_future(fetch_page({**base_params, "limit": page_size, "offset": offset}))
+    
+    pending: List[asyncio.Future] = []
+    try:
+        offset = start_offset
+        current = fetch(offset)
+        pending.append(current)
+        
+        while current is not None:
+            page = await current
+            pending.remove(current)
+            items = page.get(items_key, [])
+            following = next_offset(page, offset, page_size, len(items))
+            
+            count = (page.get("pagination") or {}).get("count")
+            if parallel and offset == start_offset and following is not None and count:
+                # Total is known: request every remaining page now
+                end = count if max_items is None else min(count, max_items)
+                semaphore = asyncio.Semaphore(max(1, concurrency))
+                
+                async def bounded(page_offset: int) -> Dict[str, Any]:
+                    async with semaphore:
+                        return await fetch_page({**base_params, "limit": page_size, "offset": page_offset})
+                
+                offsets = list(range(following, end, page_size))
+                remaining = [asyncio.ensure_future(bounded(o)) for o in offsets]
+                pending.extend(remaining)
+                
+                for item in items:
+                    if max_items is not None and yielded >= max_items:
+                        return
+                    yield item
+                    yielded += 1
+                if on_page is not None:
+                    await on_page(items, following)
+                
+                for page_offset, task in zip(offsets, remaining):
+                    page = await task
+                    pending.remove(task)
+                    page_items = page.get(items_key, [])
+                    for item in page_items:
+                        if max_items is not None and yielded >= max_items:
+                            return
+                        yield item
+                        yielded += 1
+                    if on_page is not None:
+                        after = page_offset + page_size
+                        await on_page(page_items, after if after < end else None)
+                return
+            
+            # Prefetch the next page while the caller consumes this one
+            if following is not None and (max_items is None or yielded + len(items) < max_items):
+                current = fetch(following)
+                pending.append(current)
+            else:
+                current = None
+            offset = following if following is not None else offset
+            
+            for item in items:
+                if max_items is not None and yielded >= max_items:
+                    return
+                yield item
+                yielded += 1
+            if on_page is not None:
+                await on_page(items, following if items else None)
+            
+            if not items:
+                return
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def collect(pages: AsyncIterator[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Gather every item from a paginator into a list.
+    
+    Args:
+        pages: Async iterator returned by paginate
+    
+    Returns:
+        List of items
+    """
+    return [item async for item in pages]
@@ -0,0 +1,349 @@
+"""
+Compact typed records decoded from Congress.gov payloads and scraped data.
+
+Each record picks out only the fields the ingest pipeline uses, checks
+their types, and drops the rest of the JSON tree. Records are slotted
+dataclasses, so a bulk pull holds one small fixed-layout object per item
+instead of the full nested dicts returned by the API.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple, TypeVar
+import structlog
+
+logger = structlog.get_logger()
+
+R = TypeVar("R")
+
+
+class RecordError(ValueError):
+    """Raised when a payload is missing a required field or has a field of the wrong type."""
+
+
+def _text(data: Mapping[str, Any], key: str, required: bool = False) -> Optional[str]:
+    """Read a string field, treating empty strings as missing."""
+    value = data.get(key)
+    if value is None or value == "":
+        if required:
+            raise RecordError(f"Missing required field {key!r}")
+        return None
+    if not isinstance(value, str):
+        raise RecordError(f"Field {key!r} must be a string, got {type(value).__name__}")
+    return value
+
+
+def _flag(data: Mapping[str, Any], key: str) -> Optional[bool]:
+    """Read a boolean field."""
+    value = data.get(key)
+    if value is None or isinstance(value, bool):
+        return value
+    raise RecordError(f"Field {key!r} must be a boolean, got {type(value).__name__}")
+
+
+def _datetime(data: Mapping[str, Any], key: str, utc: bool = True) -> Optional[datetime]:
+    """Read a datetime or ISO 8601 string field; with `utc`, naive values are taken as UTC."""
+    value = data.get(key)
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError as e:
+            raise RecordError(f"Field {key!r} is not an ISO 8601 timestamp") from e
+    if not isinstance(value, datetime):
+        raise RecordError(f"Field {key!r} must be a timestamp, got {type(value).__name__}")
+    if utc and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _first_item(data: Mapping[str, Any], key: str) -> Mapping[str, Any]:
+    """Return the first entry of a {"item": [...]} wrapper (or a bare list)."""
+    container = data.get(key)
+    if isinstance(container, Mapping):
+        container = container.get("item")
+    if isinstance(container, list) and container and isinstance(container[0], Mapping):
+        return container[0]
+    if isinstance(container, Mapping):
+        return container
+    return {}
+
+
+@dataclass(slots=True)
+class MemberRecord:
+    """A member from the Congress.gov /member endpoints."""
+    bioguide_id: str
+    name: str
+    party: Optional[str]
+    state: Optional[str]
+    district: Optional[str]
+    chamber: Optional[str]
+    image_url: Optional[str]
+    url: Optional[str]
+    update_date: Optional[datetime]
+    
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any]) -> "MemberRecord":
+        """
+        Decode a /member list item.
+        
+        Args:
+            data: Member payload
+        
+        Returns:
+            MemberRecord
+        
+        Raises:
+            RecordError: If bioguideId is missing or a used field has the wrong type
+        """
+        district = data.get("district")
+        if district is not None and not isinstance(district, (int, str)):
+            raise RecordError(f"Field 'district' must be a number, got {type(district).__name__}")
+        depiction = data.get("depiction")
+        
+        return cls(
+            bioguide_id=_text(data, "bioguideId", required=True),
+            name=_text(data, "name") or "",
+            party=_text(data, "partyName"),
+            state=_text(data, "state"),
+            district=str(district) if district is not None else None,
+            chamber=_text(_first_item(data, "terms"), "chamber"),
+            image_url=_text(depiction, "imageUrl") if isinstance(depiction, Mapping) else None,
+            url=_text(data, "url"),
+            update_date=_datetime(data, "updateDate"),
+        )
+
+
+@dataclass(slots=True)
+class CommitteeRecord:
+    """A committee from the Congress.gov /committee endpoints or a chamber scraper."""
+    name: str
+    chamber: Optional[str]
+    congress_gov_id: Optional[str] = None
+    committee_code: Optional[str] = None
+    committee_type: Optional[str] = None
+    is_subcommittee: Optional[bool] = None
+    parent_code: Optional[str] = None
+    description: Optional[str] = None
+    jurisdiction: Optional[str] = None
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    url: Optional[str] = None
+    office_location: Optional[str] = None
+    
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any]) -> "CommitteeRecord":
+        """
+        Decode a /committee list item.
+        
+        Args:
+            data: Committee payload
+        
+        Returns:
+            CommitteeRecord
+        
+        Raises:
+            RecordError: If name is missing or a used field has the wrong type
+        """
+        system_code = _text(data, "systemCode")
+        parent = data.get("parent")
+        parent_code = _text(parent, "systemCode") if isinstance(parent, Mapping) else None
+        
+        return cls(
+            name=_text(data, "name", required=True),
+            chamber=_text(data, "chamber"),
+            congress_gov_id=system_code,
+            committee_code=system_code,
+            committee_type=_text(data, "committeeTypeCode"),
+            is_subcommittee=parent_code is not None,
+            parent_code=parent_code,
+        )
+    
+    @classmethod
+    def from_data(cls, data: Mapping[str, Any]) -> "CommitteeRecord":
+        """
+        Decode a committee dict produced by the chamber scrapers.
+        
+        Args:
+            data: Scraped committee with snake_case keys
+        
+        Returns:
+            CommitteeRecord
+        
+        Raises:
+            RecordError: If name is missing or a used field has the wrong type
+        """
+        return cls(
+            name=_text(data, "name", required=True),
+            chamber=_text(data, "chamber"),
+            congress_gov_id=_text(data, "congress_gov_id"),
+            committee_code=_text(data, "committee_code"),
+            committee_type=_text(data, "committee_type"),
+            is_subcommittee=_flag(data, "is_subcommittee"),
+            description=_text(data, "description"),
+            jurisdiction=_text(data, "jurisdiction"),
+            phone=_text(data, "phone"),
+            email=_text(data, "email"),
+            url=_text(data, "url"),
+            office_location=_text(data, "office_location"),
+        )
+
+
+@dataclass(slots=True)
+class CommitteeAssignmentRecord:
+    """A member's seat on a committee, from /member/{id}/committee-assignment."""
+    name: str
+    chamber: Optional[str]
+    congress_gov_id: Optional[str]
+    committee_code: Optional[str]
+    committee_type: Optional[str]
+    is_subcommittee: bool
+    position: str
+    is_current: bool
+    start_date: Optional[datetime]
+    end_date: Optional[datetime]
+    
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any]) -> "CommitteeAssignmentRecord":
+        """
+        Decode a committee assignment.
+        
+        Accepts the API's camelCase keys and the snake_case keys used by the
+        relationship collector's earlier payloads.
+        
+        Args:
+            data: Committee assignment payload
+        
+        Returns:
+            CommitteeAssignmentRecord
+        
+        Raises:
+            RecordError: If the committee name is missing or a used field has the wrong type
+        """
+        system_code = _text(data, "systemCode")
+        parent = data.get("parent")
+        is_subcommittee = _flag(data, "is_subcommittee")
+        if is_subcommittee is None:
+            is_subcommittee = isinstance(parent, Mapping) and bool(parent)
+        is_current = _flag(data, "is_current")
+        
+        return cls(
+            name=_text(data, "name", required=True),
+            chamber=_text(data, "chamber"),
+            congress_gov_id=system_code or _text(data, "congress_gov_id"),
+            committee_code=system_code or _text(data, "committee_code"),
+            committee_type=_text(data, "committeeTypeCode") or _text(data, "committee_type"),
+            is_subcommittee=is_subcommittee,
+            position=_text(data, "position") or _text(data, "title") or "Member",
+            is_current=True if is_current is None else is_current,
+            start_date=_datetime(data, "start_date") or _datetime(data, "startDate"),
+            end_date=_datetime(data, "end_date") or _datetime(data, "endDate"),
+        )
+
+
+@dataclass(slots=True)
+class HearingRecord:
+    """A hearing from the Congress.gov /hearing endpoints or a chamber scraper."""
+    title: str
+    congress_gov_id: Optional[str] = None
+    chamber: Optional[str] = None
+    description: Optional[str] = None
+    scheduled_date: Optional[datetime] = None
+    location: Optional[str] = None
+    hearing_type: Optional[str] = None
+    status: Optional[str] = None
+    video_url: Optional[str] = None
+    webcast_url: Optional[str] = None
+    video_urls: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any]) -> "HearingRecord":
+        """
+        Decode a /hearing list item.
+        
+        The list endpoint identifies hearings by congress, chamber and jacket
+        number; titles and dates only come with the detail endpoint.
+        
+        Args:
+            data: Hearing payload
+        
+        Returns:
+            HearingRecord
+        
+        Raises:
+            RecordError: If a used field has the wrong type
+        """
+        jacket_number = data.get("jacketNumber")
+        if jacket_number is not None and not isinstance(jacket_number, (int, str)):
+            raise RecordError(f"Field 'jacketNumber' must be a number, got {type(jacket_number).__name__}")
+        chamber = _text(data, "chamber")
+        congress = data.get("congress")
+        congress_gov_id = None
+        if jacket_number is not None and congress is not None and chamber:
+            congress_gov_id = f"{congress}-{chamber.lower()}-{jacket_number}"
+        
+        return cls(
+            title=_text(data, "title") or "",
+            congress_gov_id=congress_gov_id,
+            chamber=chamber,
+            scheduled_date=_datetime(_first_item(data, "dates"), "date", utc=False),
+        )
+    
+    @classmethod
+    def from_data(cls, data: Mapping[str, Any]) -> "HearingRecord":
+        """
+        Decode a hearing dict produced by the chamber scrapers.
+        
+        Args:
+            data: Scraped hearing with snake_case keys
+        
+        Returns:
+            HearingRecord
+        
+        Raises:
+            RecordError: If a used field has the wrong type
+        """
+        video_urls = data.get("video_urls") or ()
+        if not isinstance(video_urls, (list, tuple)) or not all(isinstance(u, str) for u in video_urls):
+            raise RecordError("Field 'video_urls' must be a list of strings")
+        
+        return cls(
+            title=_text(data, "title") or "",
+            congress_gov_id=_text(data, "congress_gov_id"),
+            chamber=_text(data, "chamber"),
+            description=_text(data, "description"),
+            scheduled_date=_datetime(data, "scheduled_date", utc=False),
+            location=_text(data, "location"),
+            hearing_type=_text(data, "hearing_type"),
+            status=_text(data, "status"),
+            video_url=_text(data, "video_url"),
+            webcast_url=_text(data, "webcast_url"),
+            video_urls=tuple(video_urls),
+        )
+
+
+def decode_records(decode: Callable[[Mapping[str, Any]], R], items: Iterable[Mapping[str, Any]],
+                   kind: str = "record") -> List[R]:
+    """
+    Decode payload items, skipping (and logging) those that fail validation.
+    
+    Args:
+        decode: Record constructor such as MemberRecord.from_api
+        items: Payload items
+        kind: Name used in the log line for skipped items
+    
+    Returns:
+        Decoded records
+    """
+    records = []
+    skipped = 0
+    for item in items:
+        try:
+            records.append(decode(item))
+        except RecordError as e:
+            skipped += 1
+            logger.warning(f"Skipping invalid {kind}", error=str(e))
+    
+    if skipped:
+        logger.warning(f"Skipped invalid {kind}s", skipped=skipped, decoded=len(records))
+    return records
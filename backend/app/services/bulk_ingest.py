@@ -0,0 +1,170 @@
+"""
+Batched write helpers for ingesting large record sets.
+
+Callers prefetch the existing rows they need in a single query, decide in
+memory what is new and what changed, and then hand the resulting row
+dictionaries to these helpers so each batch is one round trip instead of
+one SELECT plus one INSERT/UPDATE per record.
+"""
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from sqlalchemy import insert, update, select, tuple_, func
+from sqlalchemy.orm import Session
+from ..core.config import settings
+
+
+def chunked(rows: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    """
+    Split a sequence into consecutive batches.
+    
+    Args:
+        rows: Items to split
+        size: Maximum batch size
+    
+    Yields:
+        Slices of at most `size` items
+    """
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def bulk_insert(db: Session, model, rows: List[Dict[str, Any]],
+                batch_size: Optional[int] = None) -> int:
+    """
+    Insert rows in batches with executemany / multi-row VALUES.
+    
+    Args:
+        db: Database session
+        model: ORM model class
+        rows: Column dictionaries to insert
+        batch_size: Rows per statement (defaults to settings.ingest_batch_size)
+    
+    Returns:
+        Number of rows inserted
+    """
+    batch_size = batch_size or settings.ingest_batch_size
+    for batch in chunked(rows, batch_size):
+        db.execute(insert(model), list(batch))
+    return len(rows)
+
+
+def bulk_update(db: Session, model, rows: List[Dict[str, Any]],
+                batch_size: Optional[int] = None) -> int:
+    """
+    Update rows by primary key in batches.
+    
+    Each row must contain the primary key ("id") plus the columns to change.
+    
+    Args:
+        db: Database session
+        model: ORM model class
+        rows: Column dictionaries including "id"
+        batch_size: Rows per statement (defaults to settings.ingest_batch_size)
+    
+    Returns:
+        Number of rows updated
+    """
+    batch_size = batch_size or settings.ingest_batch_size
+    
+    # Rows in one executemany must share a column set
+    by_columns: Dict[tuple, List[Dict[str, Any]]] = {}
+    for row in rows:
+        by_columns.setdefault(tuple(sorted(row)), []).append(row)
+    
+    for group in by_columns.values():
+        for batch in chunked(group, batch_size):
+            db.execute(update(model), list(batch))
+    return len(rows)
+
+
+def upsert(db: Session, model, rows: List[Dict[str, Any]],
+           conflict_columns: Sequence[str], update_columns: Sequence[str],
+           batch_size: Optional[int] = None) -> int:
+    """
+    Insert rows, updating `update_columns` where `conflict_columns` already exist.
+    
+    On PostgreSQL this is INSERT ... ON CONFLICT DO UPDATE. Other databases
+    (notably the SQLite test database) resolve existing keys with one SELECT
+    per batch and then fall back to bulk_insert/bulk_update.
+    
+    Args:
+        db: Database session
+        model: ORM model class
+        rows: Full column dictionaries (all rows must share the same keys)
+        conflict_columns: Columns covered by a unique constraint
+        update_columns: Columns to overwrite on conflict
+        batch_size: Rows per statement (defaults to settings.ingest_batch_size)
+    
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+    
+    batch_size = batch_size or settings.ingest_batch_size
+    
+    # A single ON CONFLICT statement cannot touch the same key twice; last row wins
+    rows = list({tuple(row[column] for column in conflict_columns): row for row in rows}.values())
+    
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        
+        for batch in chunked(rows, batch_size):
+            stmt = pg_insert(model).values(list(batch))
+            set_ = {column: stmt.excluded[column] for column in update_columns}
+            if "updated_at" in model.__table__.c:
+                set_["updated_at"] = func.now()
+            db.execute(stmt.on_conflict_do_update(index_elements=list(conflict_columns), set_=set_))
+        return len(rows)
+    
+    # Portable fallback
+    key_columns = [getattr(model, column) for column in conflict_columns]
+    for batch in chunked(rows, batch_size):
+        keys = [tuple(row[column] for column in conflict_columns) for row in batch]
+        if len(key_columns) == 1:
+            key_filter = key_columns[0].in_([key[0] for key in keys])
+        else:
+            key_filter = tuple_(*key_columns).in_(keys)
+        existing = {
+            tuple(found[:-1]): found[-1]
+            for found in db.execute(select(*key_columns, model.id).where(key_filter))
+        }
+        
+        inserts = []
+        updates = []
+        for key, row in zip(keys, batch):
+            if key in existing:
+                updates.append({"id": existing[key], **{column: row[column] for column in update_columns}})
+            else:
+                inserts.append(row)
+        
+        bulk_insert(db, model, inserts, batch_size)
+        bulk_update(db, model, updates, batch_size)
+    
+    return len(rows)
+
+
+def index_rows(rows: Iterable[Any], *key_columns: str) -> Dict[Any, Any]:
+    """
+    Build an in-memory lookup over prefetched rows.
+    
+    Rows whose key is empty are skipped; the first row wins on duplicates.
+    
+    Args:
+        rows: Prefetched rows (mappings or objects with attributes)
+        key_columns: Column(s) forming the key; multiple columns form a tuple
+    
+    Returns:
+        Dictionary mapping key to row
+    """
+    index = {}
+    for row in rows:
+        values = tuple(
+            row[column] if isinstance(row, Mapping) else getattr(row, column)
+            for column in key_columns
+        )
+        if not all(values):
+            continue
+        key = values[0] if len(values) == 1 else values
+        index.setdefault(key, row)
+    return index
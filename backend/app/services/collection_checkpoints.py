@@ -0,0 +1,296 @@
+"""
+Resumable checkpoints for paginated Congress.gov collections.
+
+After every page a collection records the offset of the next page, the
+keys it has collected and the items themselves in a local SQLite file. If
+the process dies mid-way through a long collection or backfill, the next
+run with the same endpoint and parameters reloads the partial results and
+continues from the recorded offset instead of starting again at 0. A
+completed collection deletes its checkpoint. Checkpoints older than the
+configured age are discarded, since offsets drift as the data changes.
+
+Date window parameters such as fromDateTime are left out of the
+checkpoint name and stored with the checkpoint instead, because an
+incremental sync computes a new window on every run. A later run resumes
+the interrupted collection with its original window when that window
+covers the one requested.
+"""
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+import structlog
+from ..core.config import settings
+
+logger = structlog.get_logger()
+
+# Query parameters that bound a collection by date rather than identify it
+WINDOW_PARAMS = ("fromDateTime", "toDateTime")
+
+
+@dataclass
+class Checkpoint:
+    """Progress of one paginated collection."""
+    name: str
+    offset: int = 0
+    pages: int = 0
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    keys: List[str] = field(default_factory=list)
+    window: Dict[str, str] = field(default_factory=dict)
+    updated_at: float = 0.0
+
+
+class CheckpointStore:
+    """
+    Collection checkpoints stored in SQLite.
+    
+    Items are appended page by page, so saving a page costs one small
+    transaction no matter how much has already been collected.
+    """
+    
+    def __init__(self, path: str, max_age: float = 24 * 3600):
+        """
+        Args:
+            path: SQLite database file
+            max_age: Seconds after its last page before a checkpoint is ignored
+        """
+        self.path = path
+        self.max_age = max_age
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS collection_checkpoints (
+                name TEXT PRIMARY KEY,
+                next_offset INTEGER NOT NULL,
+                pages INTEGER NOT NULL,
+                window_params TEXT NOT NULL DEFAULT '{}',
+                updated_at REAL NOT NULL
+            )
+        """)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(collection_checkpoints)")}
+        if "window_params" not in columns:
+            self._conn.execute(
+                "ALTER TABLE collection_checkpoints ADD COLUMN window_params TEXT NOT NULL DEFAULT '{}'"
+            )
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS collection_checkpoint_items (
+                name TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                item_key TEXT,
+                item TEXT NOT NULL,
+                PRIMARY KEY (name, seq)
+            )
+        """)
+        with self._lock:
+            self._purge_stale()
+    
+    def _purge_stale(self) -> None:
+        """Delete every checkpoint older than max_age, whatever its name (caller holds the lock)."""
+        cutoff = time.time() - self.max_age
+        stale = [name for (name,) in self._conn.execute(
+            "SELECT name FROM collection_checkpoints WHERE updated_at < ?", (cutoff,)
+        )]
+        for name in stale:
+            self._delete(name)
+        if stale:
+            logger.info("Discarded stale collection checkpoints", names=stale)
+    
+    def load(self, name: str) -> Optional[Checkpoint]:
+        """
+        Get the saved progress of a collection.
+        
+        Args:
+            name: Collection name from checkpoint_name
+        
+        Returns:
+            Checkpoint, or None if there is none or it is too old (it is then deleted)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT next_offset, pages, window_params, updated_at FROM collection_checkpoints WHERE name = ?",
+                (name,),
+            ).fetchone()
+            if row is None:
+                return None
+            
+            next_offset, pages, window, updated_at = row
+            if time.time() - updated_at > self.max_age:
+                logger.info("Discarding stale collection checkpoint", name=name, pages=pages)
+                self._delete(name)
+                return None
+            
+            rows = self._conn.execute(
+                "SELECT item_key, item FROM collection_checkpoint_items WHERE name = ? ORDER BY seq", (name,)
+            ).fetchall()
+        
+        return Checkpoint(
+            name=name,
+            offset=next_offset,
+            pages=pages,
+            items=[json.loads(item) for _, item in rows],
+            keys=[key for key, _ in rows if key is not None],
+            window=json.loads(window),
+            updated_at=updated_at,
+        )
+    
+    def save_page(self, name: str, next_offset: int, items: List[Dict[str, Any]],
+                  keys: Optional[List[Optional[str]]] = None,
+                  window: Optional[Dict[str, str]] = None) -> None:
+        """
+        Record a collected page and the offset to resume from.
+        
+        Args:
+            name: Collection name from checkpoint_name
+            next_offset: Offset of the next page to fetch
+            items: Items kept from this page
+            keys: Dedupe key of each item (None entries for items without one)
+            window: Date window parameters of the collection, from checkpoint_window
+        """
+        keys = keys if keys is not None else [None] * len(items)
+        
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._purge_stale()
+                seq = self._conn.execute(
+                    "SELECT COALESCE(MAX(seq), -1) + 1 FROM collection_checkpoint_items WHERE name = ?", (name,)
+                ).fetchone()[0]
+                self._conn.executemany(
+                    "INSERT INTO collection_checkpoint_items (name, seq, item_key, item) VALUES (?, ?, ?, ?)",
+                    [(name, seq + i, key, json.dumps(item)) for i, (key, item) in enumerate(zip(keys, items))],
+                )
+                self._conn.execute(
+                    """
+                    INSERT INTO collection_checkpoints (name, next_offset, pages, window_params, updated_at)
+                    VALUES (?, ?, 1, ?, ?)
+                    ON CONFLICT (name) DO UPDATE
+                    SET next_offset = excluded.next_offset, pages = pages + 1,
+                        window_params = excluded.window_params, updated_at = excluded.updated_at
+                    """,
+                    (name, next_offset, json.dumps(window or {}, sort_keys=True), time.time()),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+    
+    def _delete(self, name: str) -> None:
+        """Delete a checkpoint and its items (caller holds the lock)."""
+        self._conn.execute("DELETE FROM collection_checkpoint_items WHERE name = ?", (name,))
+        self._conn.execute("DELETE FROM collection_checkpoints WHERE name = ?", (name,))
+    
+    def clear(self, name: str) -> None:
+        """
+        Delete a collection's checkpoint, e.g. once it has completed.
+        
+        Args:
+            name: Collection name from checkpoint_name
+        """
+        with self._lock:
+            self._delete(name)
+    
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """
+        List the collections that have unfinished progress.
+        
+        Returns:
+            Name, next offset, pages, date window and item count of each checkpoint
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT c.name, c.next_offset, c.pages, c.window_params, c.updated_at, COUNT(i.seq)
+                FROM collection_checkpoints c
+                LEFT JOIN collection_checkpoint_items i ON i.name = c.name
+                GROUP BY c.name ORDER BY c.name
+                """
+            ).fetchall()
+        
+        return [
+            {"name": name, "next_offset": offset, "pages": pages, "window": json.loads(window),
+             "items": count, "updated_at": updated_at}
+            for name, offset, pages, window, updated_at, count in rows
+        ]
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def checkpoint_name(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Name a collection by its endpoint and query parameters.
+    
+    Args:
+        endpoint: API endpoint path
+        params: Query parameters, excluding limit and offset
+    
+    Returns:
+        Stable name such as /member?currentMember=true (date window
+        parameters are left out)
+    """
+    query = "&".join(
+        f"{key}={value}" for key, value in sorted((params or {}).items()) if key not in WINDOW_PARAMS
+    )
+    return f"{endpoint}?{query}" if query else endpoint
+
+
+def checkpoint_window(params: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+    """
+    Get the date window parameters of a collection.
+    
+    Args:
+        params: Query parameters
+    
+    Returns:
+        The fromDateTime and toDateTime parameters that are set
+    """
+    return {key: str(value) for key, value in (params or {}).items() if key in WINDOW_PARAMS}
+
+
+def window_covers(saved: Dict[str, str], requested: Dict[str, str]) -> bool:
+    """
+    Check whether a checkpoint's date window includes the requested one.
+    
+    Timestamps are compared as strings, which orders the ISO 8601 values
+    a collection always formats the same way.
+    
+    Args:
+        saved: Window of the checkpoint
+        requested: Window of the new collection
+    
+    Returns:
+        True if resuming the checkpoint collects everything requested
+    """
+    start, requested_start = saved.get("fromDateTime"), requested.get("fromDateTime")
+    end, requested_end = saved.get("toDateTime"), requested.get("toDateTime")
+    starts_in_time = start is None or (requested_start is not None and start <= requested_start)
+    ends_in_time = end is None or (requested_end is not None and end >= requested_end)
+    return starts_in_time and ends_in_time
+
+
+# Store shared by every CongressApiClient instance in the process
+_shared_checkpoint_store: Optional[CheckpointStore] = None
+
+
+def get_shared_checkpoint_store() -> CheckpointStore:
+    """
+    Get the process-wide checkpoint store configured from settings.
+    
+    Returns:
+        Shared CheckpointStore
+    """
+    global _shared_checkpoint_store
+    
+    if _shared_checkpoint_store is None:
+        _shared_checkpoint_store = CheckpointStore(
+            path=settings.congress_api_checkpoint_path,
+            max_age=settings.congress_api_checkpoint_max_age,
+        )
+    
+    return _shared_checkpoint_store
@@ -2,29 +2,173 @@
 Congress.gov API client with rate limiting and error handling.
 """
 import asyncio
-import time
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from typing import AsyncIterator, Callable, Dict, List, Optional, Any
+from datetime import datetime, timezone
 import httpx
 import structlog
 from ..core.config import settings
+from .rate_limiter import AdaptiveTokenBucket, get_shared_rate_limiter, gather_bounded, parse_retry_after
+from .http_cache import ResponseCache, CacheMissError, get_shared_response_cache
+from .quota_ledger import QuotaExceededError, QuotaLedger, get_shared_quota_ledger
+from .quota_scheduler import QuotaScheduler, get_shared_quota_scheduler
+from .single_flight import SingleFlight, get_shared_single_flight
+from .hedging import RequestHedger, get_shared_hedger
+from .api_paginator import MAX_PAGE_SIZE, PageCallback, paginate, collect
+from .collection_checkpoints import (
+    CheckpointStore, checkpoint_name, checkpoint_window, get_shared_checkpoint_store, window_covers, WINDOW_PARAMS
+)
 
 logger = structlog.get_logger()
 
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Process-wide connection pool shared by every CongressApiClient instance
+_shared_http_client: Optional[httpx.AsyncClient] = None
+_shared_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """
+    Build an httpx client configured from the connection pool settings.
+    
+    Returns:
+        New AsyncClient instance
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            settings.congress_api_timeout,
+            connect=settings.congress_api_connect_timeout,
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.congress_api_max_connections,
+            max_keepalive_connections=settings.congress_api_max_keepalive_connections,
+            keepalive_expiry=settings.congress_api_keepalive_expiry,
+        ),
+        http2=settings.congress_api_http2 and HTTP2_AVAILABLE,
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared, long-lived HTTP client for Congress.gov requests.
+    
+    The client is created lazily and rebuilt if it was closed or if it was
+    created on a different event loop (pooled connections are loop-bound).
+    
+    Returns:
+        Shared AsyncClient instance
+    """
+    global _shared_http_client, _shared_http_client_loop
+    
+    loop = asyncio.get_running_loop()
+    if (
+        _shared_http_client is None
+        or _shared_http_client.is_closed
+        or _shared_http_client_loop is not loop
+    ):
+        _shared_http_client = _build_http_client()
+        _shared_http_client_loop = loop
+        logger.info(
+            "Congress API connection pool opened",
+            max_connections=settings.congress_api_max_connections,
+            http2=settings.congress_api_http2 and HTTP2_AVAILABLE,
+        )
+    
+    return _shared_http_client
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared HTTP client and release its pooled connections.
+    """
+    global _shared_http_client, _shared_http_client_loop
+    
+    if _shared_http_client is not None and not _shared_http_client.is_closed:
+        await _shared_http_client.aclose()
+        logger.info("Congress API connection pool closed")
+    
+    _shared_http_client = None
+    _shared_http_client_loop = None
+
+
+def format_api_datetime(value: datetime) -> str:
+    """
+    Format a datetime the way Congress.gov date filters expect (UTC, Z suffix).
+    
+    Args:
+        value: Naive (assumed UTC) or timezone-aware datetime
+        
+    Returns:
+        Timestamp like 2025-01-04T23:35:19Z
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def parse_api_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a Congress.gov timestamp such as updateDate into an aware UTC datetime.
+    
+    Args:
+        value: Timestamp string from the API
+        
+    Returns:
+        Parsed datetime or None if missing or malformed
+    """
+    if not value:
+        return None
+    
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
 
 class CongressApiClient:
     """
     Client for the Congress.gov API with rate limiting and error handling.
     """
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 quota_ledger: Optional[QuotaLedger] = None,
+                 rate_limiter: Optional[AdaptiveTokenBucket] = None,
+                 single_flight: Optional[SingleFlight] = None,
+                 hedger: Optional[RequestHedger] = None,
+                 checkpoints: Optional[CheckpointStore] = None,
+                 scheduler: Optional[QuotaScheduler] = None):
+        """
+        Args:
+            http_client: Optional client to use instead of the shared pool
+            response_cache: Optional cache to use instead of the shared cache
+            quota_ledger: Optional ledger to use instead of the shared quota ledger
+            rate_limiter: Optional limiter to use instead of the shared limiter
+            single_flight: Optional coalescer to use instead of the shared one
+            hedger: Optional request hedger to use instead of the shared one
+            checkpoints: Optional checkpoint store to use instead of the shared one
+            scheduler: Optional quota scheduler to use instead of the shared one
+        """
+        self.http_client = http_client
+        self.response_cache = response_cache or get_shared_response_cache()
+        self.quota_ledger = quota_ledger or get_shared_quota_ledger()
         self.base_url = settings.congress_api_base_url
         self.api_key = settings.congress_api_key
-        self.request_delay = settings.congress_api_request_delay
-        self.last_request_time = 0
-        self.daily_request_count = 0
-        self.daily_request_limit = settings.congress_api_rate_limit
-        self.request_count_reset_time = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.single_flight = single_flight or get_shared_single_flight()
+        self.hedger = hedger or get_shared_hedger()
+        self.checkpoints = checkpoints or get_shared_checkpoint_store()
+        self.scheduler = scheduler or get_shared_quota_scheduler()
+        self.max_retries = settings.congress_api_max_retries
+        self.max_concurrency = settings.congress_api_max_concurrency
         
         # Default headers
         self.headers = {
@@ -37,132 +181,305 @@ class CongressApiClient:
         """
         Make a rate-limited request to the Congress.gov API.
         
+        Identical requests already in flight (from this or any other client
+        in the process) are joined rather than sent again.
+        
         Args:
             endpoint: API endpoint path
             params: Query parameters
             
         Returns:
-            JSON response data
+            JSON response data (shared between coalesced callers; do not mutate)
             
         Raises:
-            httpx.HTTPError: If request fails
-            ValueError: If daily rate limit exceeded
-        """
-        # Check and reset daily request count
-        now = datetime.now()
-        if now >= self.request_count_reset_time + timedelta(days=1):
-            self.daily_request_count = 0
-            self.request_count_reset_time = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        # Check daily rate limit
-        if self.daily_request_count >= self.daily_request_limit:
-            raise ValueError(f"Daily rate limit of {self.daily_request_limit} requests exceeded")
-        
-        # Rate limiting - ensure minimum delay between requests
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.request_delay:
-            await asyncio.sleep(self.request_delay - time_since_last)
-        
-        # Make the request
+            httpx.HTTPError: If request fails (including 429 after all retries)
+            QuotaExceededError: If the shared daily quota is exhausted (a ValueError)
+            CacheMissError: If the cache is in replay mode and has no entry
+        """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        key = ResponseCache.make_key(url, params)
+        return await self.single_flight.run(key, lambda: self._fetch(endpoint, url, params))
+    
+    async def _fetch(self, endpoint: str, url: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Perform one request, consulting the response cache and retrying on 429.
+        
+        Args:
+            endpoint: API endpoint path (selects the cache TTL)
+            url: Full request URL
+            params: Query parameters
+            
+        Returns:
+            JSON response data
+        """
+        # Serve fresh cached responses without spending quota. The cache is SQLite,
+        # so its reads and writes run off the event loop like the quota draw below.
+        cached = None
+        cache_key = None
+        if self.response_cache:
+            cache_key = self.response_cache.make_key(url, params)
+            cached = await asyncio.to_thread(self.response_cache.get, cache_key)
+            if cached and (cached.is_fresh or self.response_cache.replay_only):
+                return cached.data
+            if self.response_cache.replay_only:
+                raise CacheMissError(f"No cached response for {url} (replay mode)")
+        
+        # Make the request, revalidating a stale cache entry if we have one
+        headers = dict(self.headers)
+        if cached:
+            headers.update(cached.conditional_headers())
+        
+        client = self.http_client or get_http_client()
+        
+        async def admit() -> None:
+            # Draw from the shared daily quota up front so concurrent callers cannot overshoot it,
+            # leaving the reserve held back for work above the current priority class. The draw
+            # may wait on another process's SQLite write lock, so it runs off the event loop.
+            reserve = self.scheduler.current_reserve(self.quota_ledger.daily_limit)
+            await asyncio.to_thread(self.quota_ledger.acquire, reserve=reserve)
+            self.scheduler.record_spend()
+            
+            # Rate limiting - wait for a token from the process-wide bucket
+            await self.rate_limiter.acquire()
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=self.headers, params=params or {})
+        async def send() -> httpx.Response:
+            response = await client.get(url, headers=headers, params=params or {})
             
-        self.last_request_time = time.time()
-        self.daily_request_count += 1
+            # Log request
+            logger.info(
+                "Congress API request",
+                url=url,
+                status_code=response.status_code,
+                rate_limit_remaining=response.headers.get("x-ratelimit-remaining"),
+            )
+            
+            # Adapt pacing to the budget the server reports
+            self.rate_limiter.update_from_headers(response.headers)
+            return response
         
-        # Log request
-        logger.info(
-            "Congress API request",
-            url=url,
-            status_code=response.status_code,
-            daily_count=self.daily_request_count,
-        )
+        for attempt in range(self.max_retries + 1):
+            # Slow attempts may be duplicated; the first response wins
+            response = await self.hedger.run(endpoint, send, admit=admit)
+            
+            if response.status_code != 429 or attempt == self.max_retries:
+                break
+            
+            wait = self.rate_limiter.backoff(parse_retry_after(response.headers.get("Retry-After")))
+            logger.warning(
+                "Congress API rate limited, backing off",
+                url=url,
+                wait_seconds=round(wait, 2),
+                attempt=attempt + 1,
+            )
+        
+        if cached and response.status_code == 304:
+            await asyncio.to_thread(
+                self.response_cache.refresh, cache_key, self.response_cache.ttl_for(endpoint)
+            )
+            return cached.data
         
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+        
+        if self.response_cache:
+            await asyncio.to_thread(
+                self.response_cache.put,
+                cache_key,
+                url,
+                response.content,
+                ttl=self.response_cache.ttl_for(endpoint),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        
+        return data
     
-    async def get_members(self, chamber: Optional[str] = None, state: Optional[str] = None, 
-                         current_only: bool = True, limit: int = 250) -> List[Dict[str, Any]]:
+    def paginate(self, endpoint: str, items_key: str, params: Optional[Dict[str, Any]] = None,
+                 page_size: int = MAX_PAGE_SIZE, max_items: Optional[int] = None,
+                 parallel: bool = False, start_offset: int = 0,
+                 on_page: Optional[PageCallback] = None) -> AsyncIterator[Dict[str, Any]]:
         """
-        Get congressional members.
+        Stream every item of a paginated list endpoint.
         
         Args:
-            chamber: Filter by chamber (house, senate)
-            state: Filter by state abbreviation
-            current_only: Only return current members
-            limit: Maximum number of members to return per request
+            endpoint: API endpoint path
+            items_key: Key of the item list in each page
+            params: Query parameters shared by every page
+            page_size: Items requested per page
+            max_items: Stop after this many items
+            parallel: Fan out the remaining pages once the total count is known
+            start_offset: Offset of the first page to request
+            on_page: Coroutine awaited after each page with its items and the next offset
             
         Returns:
-            List of member data
+            Async iterator over items
+        """
+        async def fetch_page(page_params: Dict[str, Any]) -> Dict[str, Any]:
+            return await self._make_request(endpoint, page_params)
+        
+        return paginate(
+            fetch_page,
+            items_key,
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            parallel=parallel,
+            concurrency=self.max_concurrency,
+            start_offset=start_offset,
+            on_page=on_page,
+        )
+    
+    async def collect_checkpointed(self, endpoint: str, items_key: str,
+                                   params: Optional[Dict[str, Any]] = None,
+                                   key: Optional[str] = None, page_size: int = MAX_PAGE_SIZE,
+                                   parallel: bool = False) -> List[Dict[str, Any]]:
         """
-        params = {"limit": limit}
+        Collect every item of a paginated list endpoint, resuming an interrupted run.
+        
+        Progress is checkpointed after each page. If an earlier collection
+        with the same endpoint and parameters died part-way, its items are
+        reloaded and fetching continues from the page after its last
+        checkpoint. The checkpoint is deleted once the collection completes.
+        
+        An interrupted collection whose date window covers the requested
+        one (e.g. an incremental sync from an earlier fromDateTime) is
+        resumed with its own window; otherwise it is discarded.
+        
+        Args:
+            endpoint: API endpoint path
+            items_key: Key of the item list in each page
+            params: Query parameters shared by every page
+            key: Item field to deduplicate on; items without it are skipped
+            page_size: Items requested per page
+            parallel: Fan out the remaining pages once the total count is known
+            
+        Returns:
+            List of items
+        """
+        # The checkpoint store is SQLite, so it is read and written off the event loop
+        name = checkpoint_name(endpoint, params)
+        window = checkpoint_window(params)
+        checkpoint = await asyncio.to_thread(self.checkpoints.load, name)
+        if checkpoint and not window_covers(checkpoint.window, window):
+            logger.info("Discarding checkpoint for a different date window", collection=name,
+                        saved=checkpoint.window, requested=window)
+            await asyncio.to_thread(self.checkpoints.clear, name)
+            checkpoint = None
+        
+        items = list(checkpoint.items) if checkpoint else []
+        seen = set(checkpoint.keys) if checkpoint else set()
+        if checkpoint:
+            logger.info("Resuming collection from checkpoint", collection=name,
+                        offset=checkpoint.offset, items=len(items), window=checkpoint.window)
+            # Offsets only line up with the window the collection started with
+            window = checkpoint.window
+            params = {**{k: v for k, v in (params or {}).items() if k not in WINDOW_PARAMS}, **window}
+        
+        page_items: List[Dict[str, Any]] = []
+        page_keys: List[Optional[str]] = []
+        
+        async def on_page(_: List[Dict[str, Any]], next_offset: Optional[int]) -> None:
+            if next_offset is not None:
+                await asyncio.to_thread(
+                    self.checkpoints.save_page, name, next_offset, page_items, page_keys, window
+                )
+            page_items.clear()
+            page_keys.clear()
+        
+        async for item in self.paginate(endpoint, items_key, params, page_size=page_size, parallel=parallel,
+                                        start_offset=checkpoint.offset if checkpoint else 0,
+                                        on_page=on_page):
+            item_key = item.get(key) if key else None
+            if key:
+                if not item_key or item_key in seen:
+                    continue
+                seen.add(item_key)
+            items.append(item)
+            page_items.append(item)
+            page_keys.append(item_key)
+        
+        await asyncio.to_thread(self.checkpoints.clear, name)
+        return items
+    
+    @staticmethod
+    def _member_params(chamber: Optional[str], state: Optional[str], current_only: bool,
+                       updated_since: Optional[datetime]) -> Dict[str, Any]:
+        """Build the /member query parameters shared by the member collections."""
+        params = {}
         if chamber:
             params["chamber"] = chamber.lower()
         if state:
             params["state"] = state.upper()
         if current_only:
             params["currentMember"] = "true"
+        if updated_since:
+            params["fromDateTime"] = format_api_datetime(updated_since)
+        return params
+    
+    def iter_members(self, chamber: Optional[str] = None, state: Optional[str] = None,
+                     current_only: bool = True, updated_since: Optional[datetime] = None,
+                     limit: int = MAX_PAGE_SIZE, max_items: Optional[int] = None,
+                     parallel: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream congressional members across all pages.
         
-        response = await self._make_request("/member", params)
-        return response.get("members", [])
+        Args:
+            chamber: Filter by chamber (house, senate)
+            state: Filter by state abbreviation
+            current_only: Only return current members
+            updated_since: Only return members whose record changed after this time
+            limit: Number of members to request per page
+            max_items: Stop after this many members
+            parallel: Fan out the remaining pages once the total count is known
+            
+        Returns:
+            Async iterator over member data
+        """
+        params = self._member_params(chamber, state, current_only, updated_since)
+        return self.paginate("/member", "members", params, page_size=limit,
+                             max_items=max_items, parallel=parallel)
     
-    async def get_all_members(self, current_only: bool = True) -> List[Dict[str, Any]]:
+    async def get_members(self, chamber: Optional[str] = None, state: Optional[str] = None, 
+                         current_only: bool = True, limit: int = 250,
+                         max_items: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Get all congressional members using pagination to fetch complete dataset.
+        Get congressional members.
         
         Args:
+            chamber: Filter by chamber (house, senate)
+            state: Filter by state abbreviation
             current_only: Only return current members
+            limit: Maximum number of members to return per request
+            max_items: Stop after this many members (default: all pages)
             
         Returns:
-            List of all member data
+            List of member data
         """
-        all_members = []
-        members_dict = {}
+        return await collect(self.iter_members(chamber=chamber, state=state, current_only=current_only,
+                                               limit=limit, max_items=max_items))
+    
+    async def get_all_members(self, current_only: bool = True,
+                              updated_since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Get all congressional members using pagination to fetch complete dataset.
         
-        # Use pagination to get all members
-        offset = 0
-        limit = 250
+        Pages after the first are fetched concurrently once the total is known,
+        and an interrupted collection resumes from its last checkpointed page.
         
+        Args:
+            current_only: Only return current members
+            updated_since: Only return members whose record changed after this time
+            
+        Returns:
+            List of all member data
+        """
         logger.info("Starting comprehensive member collection with pagination...")
         
-        while True:
-            # Fetch batch of members
-            params = {"limit": limit, "offset": offset}
-            if current_only:
-                params["currentMember"] = "true"
-            
-            logger.info(f"Fetching members batch (offset={offset}, limit={limit})...")
-            response = await self._make_request("/member", params)
-            batch_members = response.get("members", [])
-            
-            if not batch_members:
-                logger.info(f"No more members found at offset {offset}")
-                break
-            
-            # Add to collection and deduplicate
-            for member in batch_members:
-                bioguide_id = member.get("bioguideId")
-                if bioguide_id and bioguide_id not in members_dict:
-                    members_dict[bioguide_id] = member
-            
-            logger.info(f"Batch {offset//limit + 1}: Got {len(batch_members)} members, total unique: {len(members_dict)}")
-            
-            # If we got less than the limit, we've reached the end
-            if len(batch_members) < limit:
-                logger.info("Reached end of members data")
-                break
-            
-            offset += limit
-            
-            # Safety check to prevent infinite loops
-            if offset > 5000:  # Reasonable upper bound
-                logger.warning(f"Reached safety limit at offset {offset}")
-                break
+        params = self._member_params(None, None, current_only, updated_since)
         
-        all_members = list(members_dict.values())
+        # Deduplicate by bioguide ID
+        all_members = await self.collect_checkpointed("/member", "members", params, key="bioguideId",
+                                                      parallel=True)
         logger.info(f"Comprehensive member collection completed: {len(all_members)} unique members")
         
         return all_members
@@ -180,22 +497,35 @@ class CongressApiClient:
         response = await self._make_request(f"/member/{bioguide_id}")
         return response.get("member", {})
     
-    async def get_committees(self, chamber: Optional[str] = None) -> List[Dict[str, Any]]:
+    def iter_committees(self, chamber: Optional[str] = None,
+                        parallel: bool = False) -> AsyncIterator[Dict[str, Any]]:
         """
-        Get congressional committees.
+        Stream congressional committees across all pages.
         
         Args:
             chamber: Filter by chamber (house, senate, joint)
+            parallel: Fan out the remaining pages once the total count is known
             
         Returns:
-            List of committee data
+            Async iterator over committee data
         """
         params = {}
         if chamber:
             params["chamber"] = chamber.lower()
         
-        response = await self._make_request("/committee", params)
-        return response.get("committees", [])
+        return self.paginate("/committee", "committees", params, parallel=parallel)
+    
+    async def get_committees(self, chamber: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get congressional committees.
+        
+        Args:
+            chamber: Filter by chamber (house, senate, joint)
+            
+        Returns:
+            List of committee data
+        """
+        return await collect(self.iter_committees(chamber=chamber))
     
     async def get_committee_details(self, committee_code: str) -> Dict[str, Any]:
         """
@@ -210,6 +540,18 @@ class CongressApiClient:
         response = await self._make_request(f"/committee/{committee_code}")
         return response.get("committee", {})
     
+    def iter_committee_members(self, committee_code: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream members of a specific committee across all pages.
+        
+        Args:
+            committee_code: Committee code
+            
+        Returns:
+            Async iterator over committee members
+        """
+        return self.paginate(f"/committee/{committee_code}/member", "members")
+    
     async def get_committee_members(self, committee_code: str) -> List[Dict[str, Any]]:
         """
         Get members of a specific committee.
@@ -220,8 +562,39 @@ class CongressApiClient:
         Returns:
             List of committee members
         """
-        response = await self._make_request(f"/committee/{committee_code}/member")
-        return response.get("members", [])
+        return await collect(self.iter_committee_members(committee_code))
+    
+    @staticmethod
+    def _hearing_params(committee_code: Optional[str], start_date: Optional[datetime],
+                        end_date: Optional[datetime]) -> Dict[str, Any]:
+        """Build the /hearing query parameters shared by the hearing collections."""
+        params = {}
+        if committee_code:
+            params["committee"] = committee_code
+        if start_date:
+            params["fromDateTime"] = start_date.isoformat()
+        if end_date:
+            params["toDateTime"] = end_date.isoformat()
+        return params
+    
+    def iter_hearings(self, committee_code: Optional[str] = None,
+                      start_date: Optional[datetime] = None,
+                      end_date: Optional[datetime] = None,
+                      parallel: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream congressional hearings across all pages.
+        
+        Args:
+            committee_code: Filter by committee
+            start_date: Filter by start date
+            end_date: Filter by end date
+            parallel: Fan out the remaining pages once the total count is known
+            
+        Returns:
+            Async iterator over hearing data
+        """
+        params = self._hearing_params(committee_code, start_date, end_date)
+        return self.paginate("/hearing", "hearings", params, parallel=parallel)
     
     async def get_hearings(self, committee_code: Optional[str] = None, 
                           start_date: Optional[datetime] = None,
@@ -229,6 +602,8 @@ class CongressApiClient:
         """
         Get congressional hearings.
         
+        Long backfills resume from their last checkpointed page if interrupted.
+        
         Args:
             committee_code: Filter by committee
             start_date: Filter by start date
@@ -237,16 +612,8 @@ class CongressApiClient:
         Returns:
             List of hearing data
         """
-        params = {}
-        if committee_code:
-            params["committee"] = committee_code
-        if start_date:
-            params["fromDateTime"] = start_date.isoformat()
-        if end_date:
-            params["toDateTime"] = end_date.isoformat()
-        
-        response = await self._make_request("/hearing", params)
-        return response.get("hearings", [])
+        params = self._hearing_params(committee_code, start_date, end_date)
+        return await self.collect_checkpointed("/hearing", "hearings", params, parallel=True)
     
     async def get_member_committees(self, bioguide_id: str) -> List[Dict[str, Any]]:
         """
@@ -257,45 +624,91 @@ class CongressApiClient:
             
         Returns:
             List of committee memberships
+        
+        Raises:
+            httpx.HTTPError: If the lookup fails, so a failure is never
+                mistaken for a member without assignments
         """
-        try:
-            response = await self._make_request(f"/member/{bioguide_id}/committee-assignment")
-            return response.get("committeeAssignments", [])
-        except Exception as e:
-            logger.warning(f"Could not get committee assignments for {bioguide_id}: {e}")
-            return []
+        response = await self._make_request(f"/member/{bioguide_id}/committee-assignment")
+        return response.get("committeeAssignments", [])
     
-    async def get_all_committee_memberships(self) -> Dict[str, List[Dict[str, Any]]]:
+    async def get_all_committee_memberships(
+        self,
+        bioguide_ids: Optional[List[str]] = None,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+        on_result: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Get all committee memberships for all members.
         
+        Members whose lookup fails are left out of the result rather than
+        recorded as having no assignments. Running out of quota is not a
+        per-member failure: no further lookups are started and the error
+        is raised once the ones in flight finish.
+        
+        Args:
+            bioguide_ids: Members to fetch (default: every member)
+            on_error: Called with the bioguide ID and exception of each failed lookup
+            on_result: Called with the bioguide ID and assignments of each
+                successful lookup as soon as it completes
+        
         Returns:
             Dictionary mapping bioguide_id to list of committee memberships
+        
+        Raises:
+            QuotaExceededError: If the daily quota runs out part way through;
+                on_result has already been called for every member fetched
         """
         all_memberships = {}
+        failed = 0
+        quota_error: Optional[QuotaExceededError] = None
         
-        # First, get all members
-        members = await self.get_all_members()
+        if bioguide_ids is None:
+            # First, get all members
+            members = await self.get_all_members()
+            bioguide_ids = [member.get("bioguideId") for member in members if member.get("bioguideId")]
         
-        logger.info(f"Fetching committee memberships for {len(members)} members...")
+        logger.info(
+            f"Fetching committee memberships for {len(bioguide_ids)} members...",
+            concurrency=self.max_concurrency,
+        )
         
-        for i, member in enumerate(members):
-            bioguide_id = member.get("bioguideId")
-            if not bioguide_id:
-                continue
-            
+        async def fetch(bioguide_id: str) -> None:
+            nonlocal failed, quota_error
+            if quota_error is not None:
+                return
             try:
-                memberships = await self.get_member_committees(bioguide_id)
-                all_memberships[bioguide_id] = memberships
-                
-                if (i + 1) % 50 == 0:
-                    logger.info(f"Processed {i + 1}/{len(members)} members")
-                
+                assignments = await self.get_member_committees(bioguide_id)
+            except QuotaExceededError as e:
+                quota_error = quota_error or e
+                return
             except Exception as e:
+                failed += 1
                 logger.error(f"Error getting committees for member {bioguide_id}: {e}")
-                all_memberships[bioguide_id] = []
+                if on_error is not None:
+                    on_error(bioguide_id, e)
+                return
+            
+            all_memberships[bioguide_id] = assignments
+            if on_result is not None:
+                on_result(bioguide_id, assignments)
+            if len(all_memberships) % 50 == 0:
+                logger.info(f"Processed {len(all_memberships)}/{len(bioguide_ids)} members")
+        
+        await gather_bounded(bioguide_ids, fetch, self.max_concurrency)
+        
+        if quota_error is not None:
+            logger.warning(
+                "Committee membership collection stopped: quota exhausted",
+                fetched=len(all_memberships),
+                failed=failed,
+            )
+            raise quota_error
         
-        logger.info(f"Committee membership collection completed for {len(all_memberships)} members")
+        logger.info(
+            f"Committee membership collection completed for {len(all_memberships)} members",
+            failed=failed,
+        )
         return all_memberships
     
     async def get_committee_hierarchy(self) -> Dict[str, Any]:
@@ -352,6 +765,19 @@ class CongressApiClient:
         response = await self._make_request(f"/hearing/{hearing_id}")
         return response.get("hearing", {})
     
+    def iter_bills(self, query: str, max_items: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream bills and resolutions matching a search across all pages.
+        
+        Args:
+            query: Search query
+            max_items: Stop after this many results
+            
+        Returns:
+            Async iterator over bill data
+        """
+        return self.paginate("/bill", "bills", {"query": query}, max_items=max_items)
+    
     async def search_bills(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
         """
         Search for bills and resolutions.
@@ -363,13 +789,7 @@ class CongressApiClient:
         Returns:
             List of bill data
         """
-        params = {
-            "query": query,
-            "limit": limit,
-        }
-        
-        response = await self._make_request("/bill", params)
-        return response.get("bills", [])
+        return await collect(self.iter_bills(query, max_items=limit))
     
     def get_rate_limit_status(self) -> Dict[str, Any]:
         """
@@ -378,9 +798,17 @@ class CongressApiClient:
         Returns:
             Rate limit information
         """
+        usage = self.quota_ledger.get_usage()
         return {
-            "daily_limit": self.daily_request_limit,
-            "daily_count": self.daily_request_count,
-            "remaining": self.daily_request_limit - self.daily_request_count,
-            "reset_time": self.request_count_reset_time.isoformat(),
+            "daily_limit": usage["limit"],
+            "daily_count": usage["used"],
+            "remaining": usage["remaining"],
+            "reset_time": usage["reset_at"],
+            "by_consumer": usage["by_consumer"],
+            "limiter": self.rate_limiter.get_status(),
+            "coalescing": self.single_flight.get_stats(),
+            "hedging": self.hedger.get_stats(),
+            "cache": self.response_cache.get_stats() if self.response_cache else {"mode": "off"},
+            "checkpoints": self.checkpoints.get_stats(),
+            "scheduler": self.scheduler.get_stats(),
         }
\ No newline at end of file
@@ -2,14 +2,19 @@
 Data processing service for collecting and storing congressional data.
 """
 import asyncio
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Dict, List, Optional, Any, Mapping, Tuple
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 import structlog
 from ..core.database import SessionLocal
-from ..models import Member, Committee, CommitteeMembership, Hearing, Witness, HearingDocument
+from ..models import Member, Committee, CommitteeMembership, Hearing, Witness, HearingDocument, SyncState
 from ..core.utils import get_state_abbreviation, get_chamber_name
 from .congress_api import CongressApiClient
+from .quota_scheduler import get_shared_quota_scheduler
+from .api_records import MemberRecord, CommitteeRecord, HearingRecord, decode_records
+from ..core.read_cache import invalidate_read_cache
+from .bulk_ingest import bulk_insert, bulk_update, upsert, index_rows
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -17,6 +22,56 @@ from scrapers import HouseScraper, SenateScraper
 
 logger = structlog.get_logger()
 
+# Re-request a small window before the high-water mark to absorb clock skew
+SYNC_OVERLAP = timedelta(minutes=5)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes (e.g. read back from SQLite) as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _coerce_datetime(value: Any) -> Optional[datetime]:
+    """Accept datetimes or ISO strings (as produced by the scrapers)."""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return value
+
+
+def _hearing_key(title: Optional[str], scheduled_date: Any) -> Optional[Tuple[str, datetime]]:
+    """Build the (title, date) matching key, comparing dates as naive UTC."""
+    scheduled_date = _coerce_datetime(scheduled_date)
+    if not title or not scheduled_date:
+        return None
+    if scheduled_date.tzinfo is not None:
+        scheduled_date = scheduled_date.astimezone(timezone.utc).replace(tzinfo=None)
+    return (title, scheduled_date)
+
+
+# Member columns kept in sync with Congress.gov
+MEMBER_SYNC_COLUMNS = ("party", "chamber", "state", "district", "official_photo_url", "is_current")
+
+# Committee record fields and the columns they overwrite on update
+COMMITTEE_DATA_FIELDS = {
+    "description": "description",
+    "jurisdiction": "jurisdiction",
+    "phone": "phone",
+    "email": "email",
+    "url": "website",
+    "office_location": "office_location",
+}
+COMMITTEE_UPDATE_COLUMNS = tuple(COMMITTEE_DATA_FIELDS.values()) + ("last_scraped_at",)
+
+HEARING_UPDATE_COLUMNS = (
+    "description", "location", "status", "video_url", "webcast_url",
+    "scraped_video_urls", "last_scraped_at",
+)
+
 
 class DataProcessor:
     """
@@ -25,6 +80,7 @@ class DataProcessor:
     
     def __init__(self):
         self.congress_api = CongressApiClient()
+        self.scheduler = get_shared_quota_scheduler()
         self.house_scraper = HouseScraper()
         self.senate_scraper = SenateScraper()
     
@@ -32,49 +88,103 @@ class DataProcessor:
         """
         Update congressional members from Congress.gov API.
         
+        Runs incrementally from the stored high-water mark when one exists,
+        requesting only members whose record changed since the last run and
+        writing only rows whose content differs.
+        
         Args:
-            force_refresh: Force refresh even if recently updated
+            force_refresh: Ignore the high-water mark and pull every current member
             
         Returns:
             Update summary
         """
-        logger.info("Starting members update")
+        logger.info("Starting members update", force_refresh=force_refresh)
         
         db = SessionLocal()
         try:
-            # Get all current members from API using the comprehensive method
-            all_members = await self.congress_api.get_all_members(current_only=True)
-            logger.info("Members data collected", total_members=len(all_members))
+            sync_state = self._get_sync_state(db, "members")
+            updated_since = None
+            if not force_refresh and sync_state.high_water_mark:
+                updated_since = _as_utc(sync_state.high_water_mark) - SYNC_OVERLAP
+            mode = "incremental" if updated_since else "full"
+            
+            # Get current members from API using the comprehensive method
+            all_members = await self.scheduler.submit(
+                "members",
+                lambda: self.congress_api.get_all_members(current_only=True, updated_since=updated_since),
+            )
+            records_seen = len(all_members)
+            logger.info("Members data collected", total_members=records_seen, mode=mode)
+            
+            # Keep only the fields we sync and let the raw payloads go
+            members = decode_records(MemberRecord.from_api, all_members, kind="member")
+            del all_members
+            
+            # Prefetch the synced columns of every incoming member in one query
+            incoming_ids = [record.bioguide_id for record in members]
+            existing_members = index_rows(
+                db.execute(
+                    select(Member.bioguide_id, *[getattr(Member, c) for c in MEMBER_SYNC_COLUMNS])
+                    .where(Member.bioguide_id.in_(incoming_ids))
+                ).mappings(),
+                "bioguide_id",
+            )
             
             updated_count = 0
             created_count = 0
-            
-            for member_data in all_members:
-                # Check if member exists
-                bioguide_id = member_data.get("bioguideId")
-                if not bioguide_id:
-                    continue
+            unchanged_count = 0
+            rows_to_write = []
+            high_water_mark = _as_utc(sync_state.high_water_mark) if sync_state.high_water_mark else None
+            
+            for record in members:
+                update_date = record.update_date
+                if update_date and (high_water_mark is None or update_date > high_water_mark):
+                    high_water_mark = update_date
                 
-                existing_member = db.query(Member).filter(
-                    Member.bioguide_id == bioguide_id
-                ).first()
+                existing_member = existing_members.get(record.bioguide_id)
+                row = self._member_row_from_api(record)
                 
                 if existing_member:
-                    # Update existing member
-                    self._update_member_from_api(existing_member, member_data)
+                    # Write existing members only if something changed
+                    changes = self._member_changes(existing_member, record)
+                    if not changes:
+                        unchanged_count += 1
+                        continue
+                    row.update({column: existing_member[column] for column in MEMBER_SYNC_COLUMNS})
+                    row.update(changes)
                     updated_count += 1
                 else:
-                    # Create new member
-                    new_member = self._create_member_from_api(member_data)
-                    db.add(new_member)
                     created_count += 1
+                
+                rows_to_write.append(row)
+            
+            upsert(
+                db, Member, rows_to_write,
+                conflict_columns=["bioguide_id"],
+                update_columns=MEMBER_SYNC_COLUMNS + ("last_scraped_at",),
+            )
+            
+            now = datetime.now(timezone.utc)
+            sync_state.high_water_mark = high_water_mark
+            sync_state.last_run_at = now
+            sync_state.last_run_mode = mode
+            sync_state.records_seen = records_seen
+            sync_state.records_changed = created_count + updated_count
+            if mode == "full":
+                sync_state.last_full_sync_at = now
             
             db.commit()
+            if created_count or updated_count:
+                invalidate_read_cache()
             
             summary = {
-                "total_processed": len(all_members),
+                "mode": mode,
+                "updated_since": updated_since.isoformat() if updated_since else None,
+                "total_processed": records_seen,
                 "created": created_count,
                 "updated": updated_count,
+                "unchanged": unchanged_count,
+                "high_water_mark": high_water_mark.isoformat() if high_water_mark else None,
                 "timestamp": datetime.now().isoformat(),
             }
             
@@ -88,6 +198,23 @@ class DataProcessor:
         finally:
             db.close()
     
+    def _get_sync_state(self, db: Session, resource: str) -> SyncState:
+        """
+        Get the sync state row for a resource, creating it if needed.
+        
+        Args:
+            db: Database session
+            resource: Resource name
+            
+        Returns:
+            SyncState object (pending insert if new)
+        """
+        sync_state = db.query(SyncState).filter(SyncState.resource == resource).first()
+        if not sync_state:
+            sync_state = SyncState(resource=resource)
+            db.add(sync_state)
+        return sync_state
+    
     def _parse_member_name(self, full_name: str) -> Dict[str, str]:
         """
         Parse full name into components.
@@ -131,65 +258,75 @@ class DataProcessor:
         
         return result
     
-    def _create_member_from_api(self, member_data: Dict[str, Any]) -> Member:
+    def _member_fields_from_api(self, record: MemberRecord) -> Dict[str, Any]:
+        """
+        Extract the synced member columns from an API record.
+        
+        Args:
+            record: Decoded member from API
+            
+        Returns:
+            Dictionary of Member column values
+        """
+        return {
+            "party": record.party or "",
+            "chamber": get_chamber_name(record.chamber or ""),
+            "state": get_state_abbreviation(record.state or "") or "XX",
+            "district": record.district,
+            "official_photo_url": record.image_url,
+        }
+    
+    def _member_row_from_api(self, record: MemberRecord) -> Dict[str, Any]:
         """
-        Create Member object from API data.
+        Build a members row from an API record.
         
         Args:
-            member_data: Member data from API
+            record: Decoded member from API
             
         Returns:
-            Member object
+            Dictionary of Member column values
         """
         # Parse name from full name field
-        full_name = member_data.get("name", "")
-        name_parts = self._parse_member_name(full_name)
-        
-        # Get chamber from terms
-        chamber = ""
-        terms = member_data.get("terms", {})
-        if isinstance(terms, dict) and "item" in terms:
-            term_items = terms["item"]
-            if term_items and len(term_items) > 0:
-                chamber = term_items[0].get("chamber", "")
-        
-        # Get image URL from depiction
-        image_url = None
-        depiction = member_data.get("depiction", {})
-        if isinstance(depiction, dict):
-            image_url = depiction.get("imageUrl")
-        
-        return Member(
-            bioguide_id=member_data.get("bioguideId"),
-            congress_gov_id=member_data.get("url", "").split("/")[-1],
-            first_name=name_parts["first_name"],
-            last_name=name_parts["last_name"],
-            middle_name=name_parts["middle_name"],
-            suffix=name_parts["suffix"],
-            nickname=name_parts["nickname"],
-            party=member_data.get("partyName", ""),
-            chamber=get_chamber_name(chamber),
-            state=get_state_abbreviation(member_data.get("state", "")) or "XX",
-            district=member_data.get("district"),
-            is_current=True,
-            official_photo_url=image_url,
-            last_scraped_at=datetime.now(),
-        )
+        name_parts = self._parse_member_name(record.name)
+        
+        return {
+            "bioguide_id": record.bioguide_id,
+            "congress_gov_id": (record.url or "").split("/")[-1],
+            "first_name": name_parts["first_name"],
+            "last_name": name_parts["last_name"],
+            "middle_name": name_parts["middle_name"],
+            "suffix": name_parts["suffix"],
+            "nickname": name_parts["nickname"],
+            "is_current": True,
+            "last_scraped_at": datetime.now(),
+            **self._member_fields_from_api(record),
+        }
     
-    def _update_member_from_api(self, member: Member, member_data: Dict[str, Any]) -> None:
+    def _member_changes(self, member: Mapping[str, Any], record: MemberRecord) -> Dict[str, Any]:
         """
-        Update existing Member object with API data.
+        Compare a stored member with an API record.
         
         Args:
-            member: Existing Member object
-            member_data: Member data from API
-        """
-        member.party = member_data.get("partyName", member.party)
-        member.chamber = get_chamber_name(member_data.get("chamber", member.chamber))
-        member.state = get_state_abbreviation(member_data.get("state", member.state)) or member.state
-        member.district = member_data.get("district", member.district)
-        member.official_photo_url = member_data.get("imageUrl", member.official_photo_url)
-        member.last_scraped_at = datetime.now()
+            member: Stored member columns (at least MEMBER_SYNC_COLUMNS)
+            record: Decoded member from API
+            
+        Returns:
+            Columns whose value differs, with their new values (empty if unchanged)
+        """
+        fields = self._member_fields_from_api(record)
+        
+        # Keep stored values for anything the API record omits
+        if not fields["party"]:
+            del fields["party"]
+        if fields["chamber"] == "Unknown":
+            del fields["chamber"]
+        if fields["state"] == "XX":
+            del fields["state"]
+        if not fields["official_photo_url"]:
+            del fields["official_photo_url"]
+        fields["is_current"] = True
+        
+        return {column: value for column, value in fields.items() if member[column] != value}
     
     async def update_committees(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
@@ -206,36 +343,77 @@ class DataProcessor:
         db = SessionLocal()
         try:
             # Get committees from API
-            house_committees_api = await self.congress_api.get_committees(chamber="house")
-            senate_committees_api = await self.congress_api.get_committees(chamber="senate")
+            async def fetch_committees():
+                return (
+                    await self.congress_api.get_committees(chamber="house"),
+                    await self.congress_api.get_committees(chamber="senate"),
+                )
+            
+            house_committees_api, senate_committees_api = await self.scheduler.submit(
+                "committees", fetch_committees
+            )
             
-            # Get committees from web scraping
-            house_committees_scraped = await self.house_scraper.scrape_committees()
-            senate_committees_scraped = await self.senate_scraper.scrape_committees()
+            # Get committees from web scraping (unchanged pages are left out unless refreshing);
+            # changed pages are saved as seen only once their rows are committed
+            house_pages, senate_pages = [], []
+            house_committees_scraped = await self.house_scraper.scrape_committees(
+                changed_only=not force_refresh, force_refresh=force_refresh, pending=house_pages
+            )
+            senate_committees_scraped = await self.senate_scraper.scrape_committees(
+                changed_only=not force_refresh, force_refresh=force_refresh, pending=senate_pages
+            )
             
             all_committees = (
-                house_committees_api + senate_committees_api +
-                house_committees_scraped + senate_committees_scraped
+                decode_records(CommitteeRecord.from_api, house_committees_api + senate_committees_api,
+                               kind="committee")
+                + decode_records(CommitteeRecord.from_data, house_committees_scraped + senate_committees_scraped,
+                                 kind="scraped committee")
             )
             
+            # Prefetch existing committees once and match in memory
+            existing_committees = [
+                dict(row) for row in db.execute(
+                    select(Committee.id, Committee.congress_gov_id, Committee.committee_code,
+                           Committee.name, Committee.chamber,
+                           *[getattr(Committee, c) for c in COMMITTEE_UPDATE_COLUMNS])
+                ).mappings()
+            ]
+            indexes = {
+                "congress_gov_id": index_rows(existing_committees, "congress_gov_id"),
+                "committee_code": index_rows(existing_committees, "committee_code"),
+                "name_chamber": index_rows(existing_committees, "name", "chamber"),
+            }
+            
             updated_count = 0
             created_count = 0
+            new_rows = []
+            updated_rows = {}
             
-            for committee_data in all_committees:
-                # Try to find existing committee
-                existing_committee = self._find_existing_committee(db, committee_data)
+            for record in all_committees:
+                # Try to find existing committee (or one created earlier in this batch)
+                existing_committee = self._find_existing_committee(indexes, record)
                 
                 if existing_committee:
-                    # Update existing committee
-                    self._update_committee_from_data(existing_committee, committee_data)
+                    existing_committee.update(self._committee_updates_from_data(record))
+                    if existing_committee.get("id"):
+                        updated_rows[existing_committee["id"]] = existing_committee
                     updated_count += 1
                 else:
-                    # Create new committee
-                    new_committee = self._create_committee_from_data(committee_data)
-                    db.add(new_committee)
+                    new_row = self._committee_row_from_data(record)
+                    new_rows.append(new_row)
+                    self._index_committee(indexes, new_row)
                     created_count += 1
             
+            bulk_insert(db, Committee, new_rows)
+            bulk_update(db, Committee, [
+                {"id": committee_id, **{c: row[c] for c in COMMITTEE_UPDATE_COLUMNS}}
+                for committee_id, row in updated_rows.items()
+            ])
+            
             db.commit()
+            invalidate_read_cache()
+            self.house_scraper.save_pages(house_pages)
+            self.senate_scraper.save_pages(senate_pages)
             
             summary = {
                 "total_processed": len(all_committees),
@@ -254,90 +432,96 @@ class DataProcessor:
         finally:
             db.close()
     
-    def _find_existing_committee(self, db: Session, committee_data: Dict[str, Any]) -> Optional[Committee]:
+    def _find_existing_committee(self, indexes: Dict[str, Dict[Any, Dict[str, Any]]],
+                                 record: CommitteeRecord) -> Optional[Dict[str, Any]]:
         """
         Find existing committee by various identifiers.
         
         Args:
-            db: Database session
-            committee_data: Committee data
+            indexes: Prefetched committee rows keyed by congress_gov_id,
+                committee_code and (name, chamber)
+            record: Decoded committee
             
         Returns:
-            Existing Committee object or None
+            Existing committee row or None
         """
         # Try by congress_gov_id first
-        congress_gov_id = committee_data.get("congress_gov_id")
-        if congress_gov_id:
-            committee = db.query(Committee).filter(
-                Committee.congress_gov_id == congress_gov_id
-            ).first()
-            if committee:
-                return committee
+        if record.congress_gov_id and record.congress_gov_id in indexes["congress_gov_id"]:
+            return indexes["congress_gov_id"][record.congress_gov_id]
         
         # Try by committee code
-        committee_code = committee_data.get("committee_code")
-        if committee_code:
-            committee = db.query(Committee).filter(
-                Committee.committee_code == committee_code
-            ).first()
-            if committee:
-                return committee
+        if record.committee_code and record.committee_code in indexes["committee_code"]:
+            return indexes["committee_code"][record.committee_code]
         
         # Try by name and chamber
-        name = committee_data.get("name")
-        chamber = committee_data.get("chamber")
-        if name and chamber:
-            committee = db.query(Committee).filter(
-                Committee.name == name,
-                Committee.chamber == chamber
-            ).first()
-            if committee:
-                return committee
+        if record.name and record.chamber:
+            return indexes["name_chamber"].get((record.name, record.chamber))
         
         return None
     
-    def _create_committee_from_data(self, committee_data: Dict[str, Any]) -> Committee:
+    def _index_committee(self, indexes: Dict[str, Dict[Any, Dict[str, Any]]],
+                         row: Dict[str, Any]) -> None:
+        """
+        Register a newly created committee row so later records in the batch match it.
+        
+        Args:
+            indexes: Committee indexes used by _find_existing_committee
+            row: Committee row
+        """
+        if row.get("congress_gov_id"):
+            indexes["congress_gov_id"].setdefault(row["congress_gov_id"], row)
+        if row.get("committee_code"):
+            indexes["committee_code"].setdefault(row["committee_code"], row)
+        if row.get("name") and row.get("chamber"):
+            indexes["name_chamber"].setdefault((row["name"], row["chamber"]), row)
+    
+    def _committee_row_from_data(self, record: CommitteeRecord) -> Dict[str, Any]:
         """
-        Create Committee object from data.
+        Build a committees row from a decoded committee.
         
         Args:
-            committee_data: Committee data
+            record: Decoded committee
             
         Returns:
-            Committee object
-        """
-        return Committee(
-            congress_gov_id=committee_data.get("congress_gov_id"),
-            committee_code=committee_data.get("committee_code"),
-            name=committee_data.get("name", ""),
-            chamber=committee_data.get("chamber", ""),
-            committee_type=committee_data.get("committee_type", "Standing"),
-            is_subcommittee=committee_data.get("is_subcommittee", False),
-            description=committee_data.get("description"),
-            jurisdiction=committee_data.get("jurisdiction"),
-            phone=committee_data.get("phone"),
-            email=committee_data.get("email"),
-            website=committee_data.get("url"),
-            office_location=committee_data.get("office_location"),
-            is_active=True,
-            last_scraped_at=datetime.now(),
-        )
+            Dictionary of Committee column values
+        """
+        return {
+            "congress_gov_id": record.congress_gov_id,
+            "committee_code": record.committee_code,
+            "name": record.name,
+            "chamber": record.chamber or "",
+            "committee_type": record.committee_type or "Standing",
+            "is_subcommittee": bool(record.is_subcommittee),
+            "description": record.description,
+            "jurisdiction": record.jurisdiction,
+            "phone": record.phone,
+            "email": record.email,
+            "website": record.url,
+            "office_location": record.office_location,
+            "is_active": True,
+            "last_scraped_at": datetime.now(),
+        }
     
-    def _update_committee_from_data(self, committee: Committee, committee_data: Dict[str, Any]) -> None:
+    def _committee_updates_from_data(self, record: CommitteeRecord) -> Dict[str, Any]:
         """
-        Update existing Committee object with data.
+        Get the committee columns to overwrite from a decoded committee.
+        
+        Only fields the record carries are returned, so absent fields keep
+        their stored values.
         
         Args:
-            committee: Existing Committee object
-            committee_data: Committee data
-        """
-        committee.description = committee_data.get("description", committee.description)
-        committee.jurisdiction = committee_data.get("jurisdiction", committee.jurisdiction)
-        committee.phone = committee_data.get("phone", committee.phone)
-        committee.email = committee_data.get("email", committee.email)
-        committee.website = committee_data.get("url", committee.website)
-        committee.office_location = committee_data.get("office_location", committee.office_location)
-        committee.last_scraped_at = datetime.now()
+            record: Decoded committee
+            
+        Returns:
+            Dictionary of Committee column values
+        """
+        updates = {
+            column: getattr(record, field)
+            for field, column in COMMITTEE_DATA_FIELDS.items()
+            if getattr(record, field) is not None
+        }
+        updates["last_scraped_at"] = datetime.now()
+        return updates
     
     async def update_hearings(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
@@ -354,32 +538,68 @@ class DataProcessor:
         db = SessionLocal()
         try:
             # Get hearings from API
-            hearings_api = await self.congress_api.get_hearings()
+            hearings_api = await self.scheduler.submit("hearings", self.congress_api.get_hearings)
+            
+            # Get hearings from web scraping (unchanged pages are left out unless refreshing);
+            # changed pages are saved as seen only once their rows are committed
+            house_pages, senate_pages = [], []
+            house_hearings_scraped = await self.house_scraper.scrape_hearings(
+                changed_only=not force_refresh, force_refresh=force_refresh, pending=house_pages
+            )
+            senate_hearings_scraped = await self.senate_scraper.scrape_hearings(
+                changed_only=not force_refresh, force_refresh=force_refresh, pending=senate_pages
+            )
             
-            # Get hearings from web scraping
-            house_hearings_scraped = await self.house_scraper.scrape_hearings()
-            senate_hearings_scraped = await self.senate_scraper.scrape_hearings()
+            all_hearings = (
+                decode_records(HearingRecord.from_api, hearings_api, kind="hearing")
+                + decode_records(HearingRecord.from_data, house_hearings_scraped + senate_hearings_scraped,
+                                 kind="scraped hearing")
+            )
             
-            all_hearings = hearings_api + house_hearings_scraped + senate_hearings_scraped
+            # Prefetch existing hearings once and match in memory
+            existing_hearings = [
+                dict(row) for row in db.execute(
+                    select(Hearing.id, Hearing.congress_gov_id, Hearing.title, Hearing.scheduled_date,
+                           *[getattr(Hearing, c) for c in HEARING_UPDATE_COLUMNS])
+                ).mappings()
+            ]
+            indexes = {
+                "congress_gov_id": index_rows(existing_hearings, "congress_gov_id"),
+                "title_date": {},
+            }
+            for row in existing_hearings:
+                self._index_hearing(indexes, row, congress_gov_id=False)
             
             updated_count = 0
             created_count = 0
+            new_rows = []
+            updated_rows = {}
             
-            for hearing_data in all_hearings:
-                # Try to find existing hearing
-                existing_hearing = self._find_existing_hearing(db, hearing_data)
+            for record in all_hearings:
+                # Try to find existing hearing (or one created earlier in this batch)
+                existing_hearing = self._find_existing_hearing(indexes, record)
                 
                 if existing_hearing:
-                    # Update existing hearing
-                    self._update_hearing_from_data(existing_hearing, hearing_data)
+                    existing_hearing.update(self._hearing_updates_from_data(existing_hearing, record))
+                    if existing_hearing.get("id"):
+                        updated_rows[existing_hearing["id"]] = existing_hearing
                     updated_count += 1
                 else:
-                    # Create new hearing
-                    new_hearing = self._create_hearing_from_data(hearing_data)
-                    db.add(new_hearing)
+                    new_row = self._hearing_row_from_data(record)
+                    new_rows.append(new_row)
+                    self._index_hearing(indexes, new_row)
                     created_count += 1
             
+            bulk_insert(db, Hearing, new_rows)
+            bulk_update(db, Hearing, [
+                {"id": hearing_id, **{c: row[c] for c in HEARING_UPDATE_COLUMNS}}
+                for hearing_id, row in updated_rows.items()
+            ])
+            
             db.commit()
+            invalidate_read_cache()
+            self.house_scraper.save_pages(house_pages)
+            self.senate_scraper.save_pages(senate_pages)
             
             summary = {
                 "total_processed": len(all_hearings),
@@ -398,84 +618,93 @@ class DataProcessor:
         finally:
             db.close()
     
-    def _find_existing_hearing(self, db: Session, hearing_data: Dict[str, Any]) -> Optional[Hearing]:
+    def _find_existing_hearing(self, indexes: Dict[str, Dict[Any, Dict[str, Any]]],
+                               record: HearingRecord) -> Optional[Dict[str, Any]]:
         """
         Find existing hearing by various identifiers.
         
         Args:
-            db: Database session
-            hearing_data: Hearing data
+            indexes: Prefetched hearing rows keyed by congress_gov_id and (title, date)
+            record: Decoded hearing
             
         Returns:
-            Existing Hearing object or None
+            Existing hearing row or None
         """
         # Try by congress_gov_id first
-        congress_gov_id = hearing_data.get("congress_gov_id")
-        if congress_gov_id:
-            hearing = db.query(Hearing).filter(
-                Hearing.congress_gov_id == congress_gov_id
-            ).first()
-            if hearing:
-                return hearing
+        if record.congress_gov_id and record.congress_gov_id in indexes["congress_gov_id"]:
+            return indexes["congress_gov_id"][record.congress_gov_id]
         
         # Try by title and date
-        title = hearing_data.get("title")
-        scheduled_date = hearing_data.get("scheduled_date")
-        if title and scheduled_date:
-            hearing = db.query(Hearing).filter(
-                Hearing.title == title,
-                Hearing.scheduled_date == scheduled_date
-            ).first()
-            if hearing:
-                return hearing
+        key = _hearing_key(record.title, record.scheduled_date)
+        if key:
+            return indexes["title_date"].get(key)
         
         return None
     
-    def _create_hearing_from_data(self, hearing_data: Dict[str, Any]) -> Hearing:
+    def _index_hearing(self, indexes: Dict[str, Dict[Any, Dict[str, Any]]],
+                       row: Dict[str, Any], congress_gov_id: bool = True) -> None:
         """
-        Create Hearing object from data.
+        Register a hearing row so later records in the batch match it.
         
         Args:
-            hearing_data: Hearing data
+            indexes: Hearing indexes used by _find_existing_hearing
+            row: Hearing row
+            congress_gov_id: Also index by congress_gov_id
+        """
+        if congress_gov_id and row.get("congress_gov_id"):
+            indexes["congress_gov_id"].setdefault(row["congress_gov_id"], row)
+        key = _hearing_key(row.get("title"), row.get("scheduled_date"))
+        if key:
+            indexes["title_date"].setdefault(key, row)
+    
+    def _hearing_row_from_data(self, record: HearingRecord) -> Dict[str, Any]:
+        """
+        Build a hearings row from a decoded hearing.
+        
+        Args:
+            record: Decoded hearing
             
         Returns:
-            Hearing object
-        """
-        return Hearing(
-            congress_gov_id=hearing_data.get("congress_gov_id"),
-            title=hearing_data.get("title", ""),
-            description=hearing_data.get("description"),
-            scheduled_date=hearing_data.get("scheduled_date"),
-            location=hearing_data.get("location"),
-            hearing_type=hearing_data.get("hearing_type"),
-            status=hearing_data.get("status", "Scheduled"),
-            video_url=hearing_data.get("video_url"),
-            webcast_url=hearing_data.get("webcast_url"),
-            scraped_video_urls=hearing_data.get("video_urls", []),
-            last_scraped_at=datetime.now(),
-        )
+            Dictionary of Hearing column values
+        """
+        return {
+            "congress_gov_id": record.congress_gov_id,
+            "title": record.title,
+            "description": record.description,
+            "scheduled_date": record.scheduled_date,
+            "location": record.location,
+            "hearing_type": record.hearing_type,
+            "status": record.status or "Scheduled",
+            "video_url": record.video_url,
+            "webcast_url": record.webcast_url,
+            "scraped_video_urls": list(record.video_urls),
+            "last_scraped_at": datetime.now(),
+        }
     
-    def _update_hearing_from_data(self, hearing: Hearing, hearing_data: Dict[str, Any]) -> None:
+    def _hearing_updates_from_data(self, hearing: Dict[str, Any], record: HearingRecord) -> Dict[str, Any]:
         """
-        Update existing Hearing object with data.
+        Get the hearing columns to overwrite from a decoded hearing.
         
         Args:
-            hearing: Existing Hearing object
-            hearing_data: Hearing data
+            hearing: Existing hearing row
+            record: Decoded hearing
+            
+        Returns:
+            Dictionary of Hearing column values
         """
-        hearing.description = hearing_data.get("description", hearing.description)
-        hearing.location = hearing_data.get("location", hearing.location)
-        hearing.status = hearing_data.get("status", hearing.status)
-        hearing.video_url = hearing_data.get("video_url", hearing.video_url)
-        hearing.webcast_url = hearing_data.get("webcast_url", hearing.webcast_url)
+        updates = {
+            column: getattr(record, column)
+            for column in ("description", "location", "status", "video_url", "webcast_url")
+            if getattr(record, column) is not None
+        }
         
         # Update scraped video URLs
-        new_video_urls = hearing_data.get("video_urls", [])
-        if new_video_urls:
-            existing_urls = hearing.scraped_video_urls or []
-            hearing.scraped_video_urls = list(set(existing_urls + new_video_urls))
+        if record.video_urls:
+            existing_urls = hearing.get("scraped_video_urls") or []
+            updates["scraped_video_urls"] = list(set(existing_urls).union(record.video_urls))
         
-        hearing.last_scraped_at = datetime.now()
+        updates["last_scraped_at"] = datetime.now()
+        return updates
     
     async def full_update(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,121 @@
+"""
+Dead-letter queue for Congress.gov lookups that failed.
+
+A failed lookup is stored under its kind and key (for example
+member_committees / A000001) with the error class and attempt count, and
+is retried no sooner than an exponentially growing delay. A successful
+retry removes the entry, so the queue always holds exactly the keys whose
+data is still missing. Retry passes re-process only these keys instead of
+repeating a full collection.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from sqlalchemy.orm import Session
+import structlog
+from ..core.config import settings
+from ..models.failed_lookup import FailedLookup
+
+logger = structlog.get_logger()
+
+# Lookup kinds
+MEMBER_COMMITTEES = "member_committees"
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """
+    Get the wait before retrying a key that has failed `attempts` times.
+    
+    Args:
+        attempts: Failures so far (at least 1)
+    
+    Returns:
+        Delay doubling from dead_letter_base_delay, capped at dead_letter_max_delay
+    """
+    seconds = settings.dead_letter_base_delay * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, settings.dead_letter_max_delay))
+
+
+def record_failure(db: Session, kind: str, key: str, error: BaseException,
+                   now: Optional[datetime] = None) -> FailedLookup:
+    """
+    Add a failed lookup to the queue, or count another attempt for it.
+    
+    Args:
+        db: Database session (the caller commits)
+        kind: Lookup kind, e.g. MEMBER_COMMITTEES
+        key: Lookup key, e.g. a bioguide ID
+        error: Exception the lookup raised
+        now: Failure time (default: now)
+    
+    Returns:
+        The queue entry
+    """
+    now = now or datetime.now(timezone.utc)
+    entry = db.query(FailedLookup).filter(FailedLookup.kind == kind, FailedLookup.key == key).first()
+    if entry is None:
+        entry = FailedLookup(kind=kind, key=key, attempts=0, first_failed_at=now)
+        db.add(entry)
+    
+    entry.attempts += 1
+    entry.error_class = type(error).__name__
+    entry.error_message = str(error)[:2000]
+    entry.last_failed_at = now
+    entry.gave_up = entry.attempts >= settings.dead_letter_max_attempts
+    entry.next_attempt_at = None if entry.gave_up else now + retry_delay(entry.attempts)
+    
+    logger.warning(
+        "Lookup dead-lettered",
+        kind=kind,
+        key=key,
+        error_class=entry.error_class,
+        attempts=entry.attempts,
+        gave_up=entry.gave_up,
+    )
+    return entry
+
+
+def resolve(db: Session, kind: str, key: str) -> bool:
+    """
+    Remove a key from the queue after it succeeded.
+    
+    Args:
+        db: Database session (the caller commits)
+        kind: Lookup kind
+        key: Lookup key
+    
+    Returns:
+        True if the key was queued
+    """
+    return db.query(FailedLookup).filter(
+        FailedLookup.kind == kind, FailedLookup.key == key
+    ).delete(synchronize_session=False) > 0
+
+
+def due_keys(db: Session, kind: str, now: Optional[datetime] = None,
+             include_gave_up: bool = False, limit: Optional[int] = None) -> List[str]:
+    """
+    Get the queued keys whose backoff has elapsed.
+    
+    Args:
+        db: Database session
+        kind: Lookup kind
+        now: Reference time (default: now)
+        include_gave_up: Also return keys that reached the attempt limit
+        limit: Maximum number of keys
+    
+    Returns:
+        Keys, oldest failure first
+    """
+    now = now or datetime.now(timezone.utc)
+    due = FailedLookup.next_attempt_at <= now
+    if include_gave_up:
+        due = due | FailedLookup.gave_up.is_(True)
+    
+    query = (
+        db.query(FailedLookup.key)
+        .filter(FailedLookup.kind == kind, due)
+        .order_by(FailedLookup.first_failed_at, FailedLookup.id)
+    )
+    if limit:
+        query = query.limit(limit)
+    return [key for key, in query]
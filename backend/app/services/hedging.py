@@ -0,0 +1,261 @@
+"""
+Per-endpoint latency tracking and hedged Congress.gov requests.
+
+Every request's latency is recorded under its endpoint pattern (detail
+paths such as /member/A000001 collapse to /member/{id}). When hedging is
+enabled and a request runs past the tracked percentile for its endpoint,
+a duplicate is sent and whichever answers first wins; the other is
+cancelled. Hedges draw from a budget that grows by a fixed fraction per
+primary request, which caps the extra quota hedging can spend.
+"""
+import asyncio
+import re
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+import structlog
+from ..core.config import settings
+
+logger = structlog.get_logger()
+
+# Path segments that identify a single resource (bioguide IDs, system codes, numbers)
+_ID_SEGMENT = re.compile(r"\d")
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """
+    Collapse resource identifiers in an endpoint path into {id}.
+    
+    Args:
+        endpoint: API endpoint path, e.g. /member/A000001/committee-assignment
+    
+    Returns:
+        Endpoint pattern, e.g. /member/{id}/committee-assignment
+    """
+    segments = [
+        "{id}" if _ID_SEGMENT.search(segment) else segment
+        for segment in endpoint.strip("/").split("/")
+    ]
+    return "/" + "/".join(segments)
+
+
+class LatencyTracker:
+    """
+    Rolling window of recent request latencies per endpoint pattern.
+    """
+    
+    def __init__(self, window: int = 500):
+        """
+        Args:
+            window: Latencies kept per endpoint
+        """
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+    
+    def record(self, endpoint: str, seconds: float) -> None:
+        """
+        Record the latency of a completed request.
+        
+        Args:
+            endpoint: Endpoint pattern from normalize_endpoint
+            seconds: Time from sending the request to receiving the response
+        """
+        samples = self._samples.get(endpoint)
+        if samples is None:
+            samples = self._samples[endpoint] = deque(maxlen=self.window)
+        samples.append(seconds)
+    
+    def count(self, endpoint: str) -> int:
+        """Return the number of latencies held for an endpoint."""
+        return len(self._samples.get(endpoint, ()))
+    
+    def percentile(self, endpoint: str, fraction: float) -> Optional[float]:
+        """
+        Get a latency percentile for an endpoint.
+        
+        Args:
+            endpoint: Endpoint pattern from normalize_endpoint
+            fraction: Percentile as a fraction, e.g. 0.95
+        
+        Returns:
+            Latency in seconds, or None without samples
+        """
+        samples = self._samples.get(endpoint)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(int(fraction * len(ordered)), len(ordered) - 1)
+        return ordered[index]
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get latency percentiles for every endpoint seen.
+        
+        Returns:
+            Per-endpoint sample count and p50/p95/p99 in milliseconds
+        """
+        return {
+            endpoint: {
+                "samples": len(samples),
+                **{
+                    f"p{int(fraction * 100)}_ms": round(self.percentile(endpoint, fraction) * 1000, 1)
+                    for fraction in (0.5, 0.95, 0.99)
+                },
+            }
+            for endpoint, samples in sorted(self._samples.items())
+            if samples
+        }
+
+
+class RequestHedger:
+    """
+    Sends a duplicate of slow requests and keeps the first response.
+    """
+    
+    def __init__(self, enabled: bool = False, percentile: float = 0.95, budget: float = 0.05,
+                 min_delay: float = 0.25, min_samples: int = 20, window: int = 500):
+        """
+        Args:
+            enabled: Send hedges (latencies are tracked either way)
+            percentile: Latency percentile after which a request is hedged
+            budget: Hedges allowed per primary request, e.g. 0.05 for at most 5% extra
+            min_delay: Never hedge sooner than this many seconds
+            min_samples: Latencies needed for an endpoint before hedging it
+            window: Latencies kept per endpoint
+        """
+        self.enabled = enabled
+        self.percentile = percentile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.latency = LatencyTracker(window)
+        self.stats = {"requests": 0, "hedged": 0, "hedge_wins": 0, "over_budget": 0}
+        # Start with room for one hedge so a cold start can still cut a stall
+        self._tokens = 1.0
+    
+    def threshold(self, endpoint: str) -> Optional[float]:
+        """
+        Get the delay after which a request to an endpoint is hedged.
+        
+        Args:
+            endpoint: Endpoint pattern from normalize_endpoint
+        
+        Returns:
+            Seconds, or None while hedging is off or samples are too few
+        """
+        if not self.enabled or self.latency.count(endpoint) < self.min_samples:
+            return None
+        return max(self.latency.percentile(endpoint, self.percentile), self.min_delay)
+    
+    def _spend(self) -> bool:
+        """Take one hedge from the budget if there is one."""
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        self.stats["over_budget"] += 1
+        return False
+    
+    async def _timed(self, endpoint: str, call: Callable[[], Awaitable[Any]],
+                     admit: Optional[Callable[[], Awaitable[Any]]] = None) -> Any:
+        """Run one attempt, after admitting it, and record its latency if it succeeds."""
+        if admit is not None:
+            await admit()
+        started = time.monotonic()
+        result = await call()
+        self.latency.record(endpoint, time.monotonic() - started)
+        return result
+    
+    async def run(self, endpoint: str, call: Callable[[], Awaitable[Any]],
+                  admit: Optional[Callable[[], Awaitable[Any]]] = None) -> Any:
+        """
+        Run a request, hedging it if it outlives the endpoint's threshold.
+        
+        The threshold clock starts once the primary attempt is admitted, so
+        time spent waiting for quota or a rate-limit token never triggers a
+        hedge or counts as latency.
+        
+        Args:
+            endpoint: API endpoint path (normalized here)
+            call: Zero-argument coroutine function performing one attempt
+            admit: Coroutine function run before every attempt, e.g. to draw
+                quota and wait for a rate-limit token
+        
+        Returns:
+            Result of the first attempt to succeed
+        
+        Raises:
+            Whatever the last attempt raises if none succeeds
+        """
+        pattern = normalize_endpoint(endpoint)
+        self.stats["requests"] += 1
+        self._tokens = min(self._tokens + self.budget, 1.0 + self.budget)
+        
+        if admit is not None:
+            await admit()
+        
+        threshold = self.threshold(pattern)
+        if threshold is None:
+            return await self._timed(pattern, call)
+        
+        primary = asyncio.ensure_future(self._timed(pattern, call))
+        attempts = {primary}
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=threshold)
+            if not done and self._spend():
+                self.stats["hedged"] += 1
+                logger.info("Hedging slow Congress API request", endpoint=pattern,
+                            threshold_ms=round(threshold * 1000, 1))
+                attempts.add(asyncio.ensure_future(self._timed(pattern, call, admit)))
+            
+            while True:
+                done, _ = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    attempts.discard(attempt)
+                    if attempt.exception() is None or not attempts:
+                        if attempt is not primary and attempt.exception() is None:
+                            self.stats["hedge_wins"] += 1
+                        return attempt.result()
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hedging counters and per-endpoint latency percentiles.
+        
+        Returns:
+            Hedging statistics
+        """
+        return {
+            "enabled": self.enabled,
+            "percentile": self.percentile,
+            "budget": self.budget,
+            **self.stats,
+            "endpoints": self.latency.get_stats(),
+        }
+
+
+# Hedger shared by every CongressApiClient instance in the process
+_shared_hedger: Optional[RequestHedger] = None
+
+
+def get_shared_hedger() -> RequestHedger:
+    """
+    Get the process-wide request hedger configured from settings.
+    
+    Returns:
+        Shared RequestHedger
+    """
+    global _shared_hedger
+    
+    if _shared_hedger is None:
+        _shared_hedger = RequestHedger(
+            enabled=settings.congress_api_hedge_requests,
+            percentile=settings.congress_api_hedge_percentile,
+            budget=settings.congress_api_hedge_budget,
+            min_delay=settings.congress_api_hedge_min_delay,
+            min_samples=settings.congress_api_hedge_min_samples,
+            window=settings.congress_api_latency_window,
+        )
+    
+    return _shared_hedger
@@ -0,0 +1,283 @@
+"""
+Persistent on-disk cache for Congress.gov API responses.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+import structlog
+from ..core.config import settings
+
+logger = structlog.get_logger()
+
+CACHE_MODE_OFF = "off"
+CACHE_MODE_READ_WRITE = "read_write"
+CACHE_MODE_REPLAY = "replay"
+
+
+class CacheMissError(LookupError):
+    """Raised in replay mode when a request has no cached response."""
+
+
+@dataclass
+class CachedResponse:
+    """A cached API response and its revalidation metadata."""
+    key: str
+    data: Dict[str, Any]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    expires_at: float
+    
+    @property
+    def is_fresh(self) -> bool:
+        """Return True if the entry is still within its TTL."""
+        return time.time() < self.expires_at
+    
+    def conditional_headers(self) -> Dict[str, str]:
+        """Return headers for a conditional revalidation request."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    SQLite-backed response cache keyed by URL and query parameters.
+    
+    Bodies are stored zlib-compressed. Each entry carries a per-endpoint TTL
+    and its ETag/Last-Modified validators, and the cache is kept under a
+    byte budget by evicting the least recently used entries.
+    """
+    
+    def __init__(self, path: str, max_bytes: int, ttls: Dict[str, int],
+                 default_ttl: int, mode: str = CACHE_MODE_READ_WRITE):
+        """
+        Args:
+            path: SQLite database file
+            max_bytes: Maximum total size of compressed bodies
+            ttls: TTL in seconds per resource (first path segment)
+            default_ttl: TTL for resources without an explicit entry
+            mode: read_write or replay
+        """
+        if mode not in (CACHE_MODE_READ_WRITE, CACHE_MODE_REPLAY):
+            raise ValueError(f"Unsupported cache mode: {mode}")
+        
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = ttls
+        self.default_ttl = default_ttl
+        self.mode = mode
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "stored": 0, "evicted": 0}
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_last_accessed ON responses (last_accessed)"
+        )
+    
+    @property
+    def replay_only(self) -> bool:
+        """Return True if the cache must never fall through to the network."""
+        return self.mode == CACHE_MODE_REPLAY
+    
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build a cache key from a URL and its normalized query parameters.
+        
+        Args:
+            url: Request URL without query string
+            params: Query parameters
+        
+        Returns:
+            Hex digest identifying the request
+        """
+        query = urlencode(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return hashlib.sha256(f"{url}?{query}".encode("utf-8")).hexdigest()
+    
+    def ttl_for(self, endpoint: str) -> int:
+        """
+        Get the TTL for an endpoint based on its resource type.
+        
+        Args:
+            endpoint: API endpoint path, e.g. /committee/hsag00
+        
+        Returns:
+            TTL in seconds
+        """
+        resource = endpoint.strip("/").split("/", 1)[0]
+        return self.ttls.get(resource, self.default_ttl)
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up a cached response, fresh or stale.
+        
+        Args:
+            key: Cache key from make_key
+        
+        Returns:
+            Cached response or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, fetched_at, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            
+            self._conn.execute(
+                "UPDATE responses SET last_accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        
+        self.stats["hits"] += 1
+        body, etag, last_modified, fetched_at, expires_at = row
+        return CachedResponse(
+            key=key,
+            data=json.loads(zlib.decompress(body)),
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=fetched_at,
+            expires_at=expires_at,
+        )
+    
+    def put(self, key: str, url: str, content: bytes, ttl: int,
+            etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Store a response body and its validators.
+        
+        Args:
+            key: Cache key from make_key
+            url: Request URL (kept for debugging)
+            content: Raw JSON response body
+            ttl: Time to live in seconds
+            etag: ETag response header
+            last_modified: Last-Modified response header
+        """
+        body = zlib.compress(content)
+        now = time.time()
+        
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses
+                    (key, url, body, size, etag, last_modified, fetched_at, expires_at, last_accessed)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, url, body, len(body), etag, last_modified, now, now + ttl, now),
+            )
+            self.stats["stored"] += 1
+            self._evict()
+    
+    def refresh(self, key: str, ttl: int) -> None:
+        """
+        Extend an entry's lifetime after a 304 Not Modified revalidation.
+        
+        Args:
+            key: Cache key from make_key
+            ttl: Time to live in seconds
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ?, expires_at = ?, last_accessed = ? WHERE key = ?",
+                (now, now + ttl, now, key),
+            )
+        self.stats["revalidated"] += 1
+    
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits its byte budget."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_accessed ASC"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.stats["evicted"] += len(evicted)
+        logger.info("Congress API cache eviction", evicted=len(evicted), total_bytes=total)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Cache counters and size information
+        """
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        
+        return {
+            "mode": self.mode,
+            "entries": entries,
+            "total_bytes": total,
+            "max_bytes": self.max_bytes,
+            **self.stats,
+        }
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Cache shared by every CongressApiClient instance in the process
+_shared_response_cache: Optional[ResponseCache] = None
+
+
+def get_shared_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the process-wide response cache configured from settings.
+    
+    Returns:
+        Shared ResponseCache, or None if caching is turned off
+    """
+    global _shared_response_cache
+    
+    if settings.congress_api_cache_mode == CACHE_MODE_OFF:
+        return None
+    
+    if _shared_response_cache is None:
+        _shared_response_cache = ResponseCache(
+            path=settings.congress_api_cache_path,
+            max_bytes=settings.congress_api_cache_max_bytes,
+            ttls=settings.congress_api_cache_ttls,
+            default_ttl=settings.congress_api_cache_default_ttl,
+            mode=settings.congress_api_cache_mode,
+        )
+    
+    return _shared_response_cache
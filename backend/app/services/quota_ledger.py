@@ -0,0 +1,165 @@
+"""
+Persistent ledger of Congress.gov API requests spent against the daily quota.
+
+Every CongressApiClient instance, background job and root collection
+script records its requests in the same SQLite file, so the count
+survives restarts and is shared across processes. Each draw runs in a
+BEGIN IMMEDIATE transaction, which takes SQLite's write lock before the
+limit check, so concurrent processes cannot overrun the key between
+reading and updating the count.
+"""
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+import structlog
+
+logger = structlog.get_logger()
+
+
+class QuotaExceededError(ValueError):
+    """Raised when drawing from the ledger would exceed the daily quota."""
+
+
+class QuotaDeferredError(QuotaExceededError):
+    """Raised when a draw would eat into quota reserved for higher-priority work."""
+
+
+class QuotaLedger:
+    """
+    Daily request counter stored in SQLite, broken down by consumer.
+    
+    Days roll over at midnight UTC.
+    """
+    
+    def __init__(self, path: str, daily_limit: int):
+        """
+        Args:
+            path: SQLite database file shared by every consumer
+            daily_limit: Requests allowed per UTC day across all consumers
+        """
+        self.path = path
+        self.daily_limit = daily_limit
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS quota_usage (
+                day TEXT NOT NULL,
+                consumer TEXT NOT NULL,
+                used INTEGER NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (day, consumer)
+            )
+        """)
+    
+    @staticmethod
+    def _today() -> str:
+        """Return the current UTC day as an ISO date string."""
+        return datetime.now(timezone.utc).date().isoformat()
+    
+    def acquire(self, count: int = 1, consumer: str = "backend", reserve: int = 0) -> int:
+        """
+        Record requests against today's quota.
+        
+        Args:
+            count: Number of requests about to be made
+            consumer: Name of the client drawing from the quota
+            reserve: Requests that must remain afterwards, held back for
+                higher-priority work
+        
+        Returns:
+            Total requests used today, including these
+        
+        Raises:
+            QuotaExceededError: If the draw would exceed the daily limit
+            QuotaDeferredError: If the draw would leave less than `reserve`
+        """
+        day = self._today()
+        
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                used = self._conn.execute(
+                    "SELECT COALESCE(SUM(used), 0) FROM quota_usage WHERE day = ?", (day,)
+                ).fetchone()[0]
+                if used + count > self.daily_limit:
+                    logger.warning("Congress API daily quota exhausted", used=used, limit=self.daily_limit, consumer=consumer)
+                    raise QuotaExceededError(
+                        f"Daily rate limit of {self.daily_limit} requests exceeded"
+                    )
+                if reserve and used + count > self.daily_limit - reserve:
+                    raise QuotaDeferredError(
+                        f"{self.daily_limit - used} requests left today, {reserve} reserved for higher-priority work"
+                    )
+                
+                self._conn.execute(
+                    """
+                    INSERT INTO quota_usage (day, consumer, used, updated_at) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (day, consumer) DO UPDATE
+                    SET used = used + excluded.used, updated_at = excluded.updated_at
+                    """,
+                    (day, consumer, count, time.time()),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        
+        return used + count
+    
+    def get_usage(self) -> Dict[str, Any]:
+        """
+        Get today's quota usage.
+        
+        Returns:
+            Usage totals, per-consumer breakdown and reset time
+        """
+        day = self._today()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT consumer, used FROM quota_usage WHERE day = ? ORDER BY consumer", (day,)
+            ).fetchall()
+        
+        used = sum(count for _, count in rows)
+        reset_at = datetime.fromisoformat(day).replace(tzinfo=timezone.utc) + timedelta(days=1)
+        return {
+            "day": day,
+            "limit": self.daily_limit,
+            "used": used,
+            "remaining": max(self.daily_limit - used, 0),
+            "reset_at": reset_at.isoformat(),
+            "by_consumer": dict(rows),
+        }
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Ledger shared by every CongressApiClient instance in the process
+_shared_quota_ledger: Optional[QuotaLedger] = None
+
+
+def get_shared_quota_ledger() -> QuotaLedger:
+    """
+    Get the process-wide quota ledger configured from settings.
+    
+    Returns:
+        Shared QuotaLedger
+    """
+    global _shared_quota_ledger
+    
+    if _shared_quota_ledger is None:
+        # Imported here so root scripts can use QuotaLedger without the app settings
+        from ..core.config import settings
+        
+        _shared_quota_ledger = QuotaLedger(
+            path=settings.congress_api_quota_path,
+            daily_limit=settings.congress_api_rate_limit,
+        )
+    
+    return _shared_quota_ledger
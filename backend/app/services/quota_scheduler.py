@@ -0,0 +1,229 @@
+"""
+Priority classes for work that spends the Congress.gov daily quota.
+
+Jobs such as the hearings refresh, the members pass and the relationship
+population run as named work items with a priority class. Each class
+keeps a share of the daily quota in reserve for the classes above it:
+a low-priority item is deferred before it starts if its planned spend
+would dip into that reserve, and every request it makes is drawn with
+the reserve enforced, so it also stops part-way once the remaining quota
+falls to the threshold. Planned and actual spend are tracked per item
+and per class. Requests made outside any work item (ad hoc endpoints,
+retries) are held to the normal class's reserve, so they cannot drain
+the quota kept back for high-priority work.
+"""
+import asyncio
+import contextvars
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+import structlog
+from ..core.config import settings
+from .quota_ledger import QuotaLedger, QuotaDeferredError, get_shared_quota_ledger
+
+logger = structlog.get_logger()
+
+# Priority classes, highest first
+PRIORITIES = ("high", "normal", "low")
+
+
+@dataclass
+class WorkItem:
+    """One unit of scheduled Congress.gov work and what it spent."""
+    name: str
+    priority: str
+    planned: int
+    spent: int = 0
+    status: str = "pending"  # running, completed, deferred or failed
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+
+# Work item the current task belongs to (inherited by the tasks it spawns)
+_current_work: contextvars.ContextVar[Optional[WorkItem]] = contextvars.ContextVar(
+    "congress_api_work_item", default=None
+)
+
+
+class QuotaScheduler:
+    """
+    Runs prioritized work items against the shared quota ledger.
+    """
+    
+    def __init__(self, ledger: QuotaLedger, reserves: Dict[str, float],
+                 priorities: Optional[Dict[str, str]] = None, history: int = 50,
+                 unscheduled_priority: str = "normal"):
+        """
+        Args:
+            ledger: Quota ledger the work draws from
+            reserves: Fraction of the daily limit each priority class must leave
+                unspent, e.g. {"high": 0.0, "normal": 0.1, "low": 0.3}
+            priorities: Default priority class per work name
+            history: Finished work items kept for reporting
+            unscheduled_priority: Priority class whose reserve applies to
+                requests made outside a work item
+        """
+        if unscheduled_priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority class: {unscheduled_priority}")
+        self.ledger = ledger
+        self.reserves = reserves
+        self.priorities = priorities or {}
+        self.unscheduled_priority = unscheduled_priority
+        self._history: Deque[WorkItem] = deque(maxlen=history)
+        self._running: Dict[int, WorkItem] = {}
+        self._last_spend: Dict[str, int] = {}
+        self._totals = {priority: {"planned": 0, "spent": 0, "deferred": 0} for priority in PRIORITIES}
+        self._unscheduled = 0
+    
+    def reserve_for(self, priority: str, daily_limit: Optional[int] = None) -> int:
+        """
+        Get the requests a priority class must leave in the daily quota.
+        
+        Args:
+            priority: Priority class
+            daily_limit: Limit of the ledger being drawn from (default: the scheduler's)
+        
+        Returns:
+            Reserved requests
+        """
+        daily_limit = self.ledger.daily_limit if daily_limit is None else daily_limit
+        return int(self.reserves.get(priority, 0.0) * daily_limit)
+    
+    def current_reserve(self, daily_limit: Optional[int] = None) -> int:
+        """
+        Get the reserve that applies to a request made by the current task.
+        
+        Args:
+            daily_limit: Limit of the ledger being drawn from (default: the scheduler's)
+        
+        Returns:
+            Reserve of the current work item's class, or of the unscheduled
+            priority class outside a work item
+        """
+        item = _current_work.get()
+        priority = item.priority if item is not None else self.unscheduled_priority
+        return self.reserve_for(priority, daily_limit)
+    
+    def record_spend(self, count: int = 1) -> None:
+        """
+        Charge requests that were just drawn from the ledger to the current work item.
+        
+        Args:
+            count: Requests drawn
+        """
+        item = _current_work.get()
+        if item is None:
+            self._unscheduled += count
+        else:
+            item.spent += count
+            self._totals[item.priority]["spent"] += count
+    
+    async def submit(self, name: str, call: Callable[[], Awaitable[Any]],
+                     priority: Optional[str] = None, planned: Optional[int] = None) -> Any:
+        """
+        Run a work item if the quota its priority class may use allows it.
+        
+        Args:
+            name: Work name, e.g. "hearings"
+            call: Zero-argument coroutine function doing the work
+            priority: Priority class (default: configured for `name`, else normal)
+            planned: Requests the work is expected to spend (default: what
+                the last run of `name` spent)
+        
+        Returns:
+            Result of `call`
+        
+        Raises:
+            QuotaDeferredError: If the work would eat into a higher class's reserve,
+                either up front or part-way through
+        """
+        priority = priority or self.priorities.get(name, "normal")
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority class: {priority}")
+        planned = planned if planned is not None else self._last_spend.get(name, 0)
+        item = WorkItem(name=name, priority=priority, planned=planned)
+        self._totals[priority]["planned"] += planned
+        
+        # The ledger is SQLite shared with other processes, so it is read off the event loop
+        remaining = (await asyncio.to_thread(self.ledger.get_usage))["remaining"]
+        reserve = self.reserve_for(priority)
+        if remaining - max(planned, 1) < reserve:
+            self._finish(item, "deferred")
+            logger.warning("Deferring Congress API work", work=name, priority=priority,
+                           planned=planned, remaining=remaining, reserve=reserve)
+            raise QuotaDeferredError(
+                f"Deferred {name}: {remaining} requests left today, {reserve} reserved above {priority} priority"
+            )
+        
+        item.status = "running"
+        item.started_at = time.time()
+        self._running[id(item)] = item
+        token = _current_work.set(item)
+        try:
+            result = await call()
+        except QuotaDeferredError:
+            self._finish(item, "deferred")
+            logger.warning("Congress API work deferred part-way", work=name, priority=priority, spent=item.spent)
+            raise
+        except BaseException:
+            self._finish(item, "failed")
+            raise
+        finally:
+            _current_work.reset(token)
+        
+        self._finish(item, "completed")
+        logger.info("Congress API work completed", work=name, priority=priority,
+                    planned=planned, spent=item.spent)
+        return result
+    
+    def _finish(self, item: WorkItem, status: str) -> None:
+        """Move a work item to the history with its final status."""
+        item.status = status
+        item.finished_at = time.time()
+        self._running.pop(id(item), None)
+        self._history.append(item)
+        if status == "deferred":
+            self._totals[item.priority]["deferred"] += 1
+        if status == "completed":
+            self._last_spend[item.name] = item.spent
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get reserves and planned versus actual spend.
+        
+        Returns:
+            Scheduler statistics
+        """
+        return {
+            "reserves": {priority: self.reserve_for(priority) for priority in PRIORITIES},
+            "by_priority": {priority: dict(totals) for priority, totals in self._totals.items()},
+            "unscheduled_priority": self.unscheduled_priority,
+            "unscheduled_spent": self._unscheduled,
+            "running": [asdict(item) for item in self._running.values()],
+            "recent": [asdict(item) for item in reversed(self._history)],
+        }
+
+
+# Scheduler shared by every CongressApiClient instance in the process
+_shared_quota_scheduler: Optional[QuotaScheduler] = None
+
+
+def get_shared_quota_scheduler() -> QuotaScheduler:
+    """
+    Get the process-wide quota scheduler configured from settings.
+    
+    Returns:
+        Shared QuotaScheduler
+    """
+    global _shared_quota_scheduler
+    
+    if _shared_quota_scheduler is None:
+        _shared_quota_scheduler = QuotaScheduler(
+            ledger=get_shared_quota_ledger(),
+            reserves=settings.congress_api_priority_reserves,
+            priorities=settings.congress_api_work_priorities,
+            unscheduled_priority=settings.congress_api_unscheduled_priority,
+        )
+    
+    return _shared_quota_scheduler
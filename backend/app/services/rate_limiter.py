@@ -0,0 +1,296 @@
+"""
+Async token-bucket rate limiting for outbound API requests.
+"""
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, TypeVar
+import structlog
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class TokenBucket:
+    """
+    Token bucket allowing short bursts while enforcing a sustained rate.
+    
+    Tokens are reserved synchronously, so concurrent callers queue up in
+    the order they arrive without needing a loop-bound asyncio.Lock. A
+    caller that finds the bucket empty takes on "debt" and sleeps until its
+    token would have been refilled.
+    """
+    
+    def __init__(self, rate: float, capacity: int):
+        """
+        Args:
+            rate: Sustained rate in tokens per second
+            capacity: Maximum burst size
+        """
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+        if capacity < 1:
+            raise ValueError("Token bucket capacity must be at least 1")
+        
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.total_acquired = 0
+        self.total_wait_seconds = 0.0
+    
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update."""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+    
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Reserve tokens and return how long the caller must wait to use them.
+        
+        Args:
+            tokens: Number of tokens to reserve
+        
+        Returns:
+            Seconds to wait before proceeding (0 if tokens were available)
+        """
+        self._refill(time.monotonic())
+        self.tokens -= tokens
+        self.total_acquired += tokens
+        
+        if self.tokens >= 0:
+            return 0.0
+        
+        wait = -self.tokens / self.rate
+        self.total_wait_seconds += wait
+        return wait
+    
+    async def acquire(self, tokens: int = 1) -> None:
+        """
+        Wait until the requested number of tokens is available.
+        
+        Args:
+            tokens: Number of tokens to acquire
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get current limiter state.
+        
+        Returns:
+            Limiter information
+        """
+        self._refill(time.monotonic())
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.capacity,
+            "available_tokens": round(max(self.tokens, 0.0), 2),
+            "total_acquired": self.total_acquired,
+            "total_wait_seconds": round(self.total_wait_seconds, 2),
+        }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds or as an HTTP date.
+    
+    Args:
+        value: Header value
+    
+    Returns:
+        Seconds to wait, or None if missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """
+    Token bucket whose rate follows the budget the server reports.
+    
+    The bucket runs at max_rate while more than the `headroom` fraction of
+    the server's budget (x-ratelimit-remaining out of x-ratelimit-limit) is
+    left. Below that it slows in proportion to the budget left, down to
+    min_rate when it is spent, but never below the rate that would spend
+    the remaining budget exactly by the time the window resets
+    (x-ratelimit-reset, or window_seconds if the server does not say). The
+    rate moves part of the way towards its target after each response. A
+    429 halves the rate and puts the bucket into debt for the Retry-After
+    period.
+    """
+    
+    def __init__(self, rate: float, capacity: int, min_rate: float,
+                 smoothing: float, window_seconds: float, headroom: float = 0.2):
+        """
+        Args:
+            rate: Maximum sustained rate in tokens per second
+            capacity: Maximum burst size
+            min_rate: Slowest rate the bucket adapts down to
+            smoothing: Fraction of the gap to the target rate closed per response (0-1]
+            window_seconds: Assumed time to reset when the server does not report one
+            headroom: Fraction of the budget left below which the bucket slows down
+        """
+        super().__init__(rate, capacity)
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.smoothing = smoothing
+        self.window_seconds = window_seconds
+        self.headroom = headroom
+        self.server_limit: Optional[int] = None
+        self.server_remaining: Optional[int] = None
+        self.server_reset_in: Optional[float] = None
+        self.backoffs = 0
+    
+    def _set_rate(self, rate: float) -> None:
+        """Change the rate, crediting tokens accrued at the old rate first."""
+        self._refill(time.monotonic())
+        self.rate = min(self.max_rate, max(self.min_rate, rate))
+    
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Adapt the rate to the server-reported remaining budget.
+        
+        Args:
+            headers: Response headers (x-ratelimit-remaining, x-ratelimit-limit,
+                x-ratelimit-reset)
+        """
+        remaining = headers.get("x-ratelimit-remaining")
+        if remaining is None:
+            return
+        try:
+            remaining = int(remaining)
+        except ValueError:
+            return
+        
+        # Size of the budget; without a limit header, the most we have seen remaining
+        limit = self.server_limit or 0
+        try:
+            limit = int(headers.get("x-ratelimit-limit", ""))
+        except ValueError:
+            pass
+        self.server_limit = max(limit, remaining)
+        
+        reset_in = None
+        reset = headers.get("x-ratelimit-reset")
+        if reset:
+            try:
+                reset = float(reset)
+                # Either an epoch timestamp or seconds until reset
+                reset_in = max(reset - time.time() if reset > 1_000_000_000 else reset, 1.0)
+            except ValueError:
+                pass
+        
+        self.server_remaining = remaining
+        self.server_reset_in = reset_in if reset_in is not None else self.window_seconds
+        
+        left = remaining / self.server_limit if self.server_limit else 0.0
+        target = self.max_rate
+        if left < self.headroom:
+            # Slow down with the budget, but never below the pace that spends it by the reset
+            target = max(self.max_rate * left / self.headroom, remaining / self.server_reset_in)
+        self._set_rate(self.rate + self.smoothing * (target - self.rate))
+    
+    def backoff(self, retry_after: Optional[float]) -> float:
+        """
+        Slow down after a 429 Too Many Requests.
+        
+        Args:
+            retry_after: Seconds the server asked us to wait, if given
+        
+        Returns:
+            Seconds the next request will wait
+        """
+        self.backoffs += 1
+        self._set_rate(self.rate / 2)
+        wait = retry_after if retry_after is not None else 1.0 / self.rate
+        
+        # Go into debt so every caller waits out the Retry-After period
+        self.tokens = min(self.tokens, -wait * self.rate)
+        return wait
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get current limiter state.
+        
+        Returns:
+            Limiter information
+        """
+        return {
+            **super().get_status(),
+            "rate_per_second": round(self.rate, 3),
+            "max_rate_per_second": self.max_rate,
+            "server_limit": self.server_limit,
+            "min_rate_per_second": self.min_rate,
+            "server_remaining": self.server_remaining,
+            "server_reset_in": round(self.server_reset_in, 1) if self.server_reset_in is not None else None,
+            "backoffs": self.backoffs,
+        }
+
+
+# Limiter shared by every CongressApiClient instance in the process
+_shared_rate_limiter: Optional[AdaptiveTokenBucket] = None
+
+
+def get_shared_rate_limiter() -> AdaptiveTokenBucket:
+    """
+    Get the process-wide Congress.gov rate limiter.
+    
+    Returns:
+        Shared AdaptiveTokenBucket configured from settings
+    """
+    global _shared_rate_limiter
+    
+    if _shared_rate_limiter is None:
+        # Imported here so root scripts can use the limiter classes without the app settings
+        from ..core.config import settings
+        
+        _shared_rate_limiter = AdaptiveTokenBucket(
+            rate=settings.congress_api_requests_per_second,
+            capacity=settings.congress_api_burst,
+            min_rate=settings.congress_api_min_requests_per_second,
+            smoothing=settings.congress_api_rate_smoothing,
+            window_seconds=settings.congress_api_rate_window,
+            headroom=settings.congress_api_rate_headroom,
+        )
+    
+    return _shared_rate_limiter
+
+
+async def gather_bounded(
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[R]],
+    concurrency: int,
+) -> List[R]:
+    """
+    Run a coroutine for every item with at most `concurrency` in flight.
+    
+    Args:
+        items: Items to process
+        worker: Coroutine function called once per item
+        concurrency: Maximum number of concurrent workers
+    
+    Returns:
+        Results in the same order as the input items
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await worker(item)
+    
+    return await asyncio.gather(*(run(item) for item in items))
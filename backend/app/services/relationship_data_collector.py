@@ -2,14 +2,18 @@
 Service for collecting and populating relationship data between members, committees, and hearings.
 """
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Optional, Tuple
 from sqlalchemy.orm import Session
 from ..models.member import Member
 from ..models.committee import Committee, CommitteeMembership
 from ..models.hearing import Hearing
 from ..services.congress_api import CongressApiClient
+from ..services.api_records import CommitteeAssignmentRecord, decode_records
+from ..services.dead_letters import MEMBER_COMMITTEES, record_failure, resolve, due_keys
+from ..services.quota_ledger import QuotaExceededError, QuotaDeferredError
+from ..services.quota_scheduler import get_shared_quota_scheduler
 from ..core.database import get_db
-import asyncio
+from ..core.read_cache import invalidate_read_cache
 
 logger = logging.getLogger(__name__)
 
@@ -19,12 +23,20 @@ class RelationshipDataCollector:
     def __init__(self, db: Session):
         self.db = db
         self.congress_client = CongressApiClient()
+        self.scheduler = get_shared_quota_scheduler()
         self.logger = logging.getLogger(__name__)
     
-    async def populate_committee_memberships(self) -> Dict[str, int]:
+    async def populate_committee_memberships(self, bioguide_ids: Optional[List[str]] = None) -> Dict[str, int]:
         """
         Populate committee membership data for all members.
         
+        Members whose Congress.gov lookup fails are added to the dead-letter
+        queue for a later retry; members that succeed are removed from it.
+        
+        Args:
+            bioguide_ids: Only process these members, current or not
+                (default: every current member)
+        
         Returns:
             Dictionary with statistics about memberships created.
         """
@@ -32,16 +44,29 @@ class RelationshipDataCollector:
             "members_processed": 0,
             "memberships_created": 0,
             "memberships_updated": 0,
-            "errors": 0
+            "errors": 0,
+            "dead_lettered": 0
         }
         
-        # Get all current members
-        members = self.db.query(Member).filter(Member.is_current == True).all()
+        if bioguide_ids is None:
+            # Get all current members
+            members = self.db.query(Member).filter(Member.is_current == True).all()
+        else:
+            members = self.db.query(Member).filter(Member.bioguide_id.in_(bioguide_ids)).all()
+        
+        members_by_id = {member.bioguide_id: member for member in members}
+        
+        def on_error(bioguide_id: str, error: Exception) -> None:
+            record_failure(self.db, MEMBER_COMMITTEES, bioguide_id, error)
+            stats["errors"] += 1
+            stats["dead_lettered"] += 1
         
-        for member in members:
+        def on_result(bioguide_id: str, assignments: List[Dict[str, Any]]) -> None:
+            member = members_by_id[bioguide_id]
             try:
-                # Get committee memberships from Congress.gov API
-                memberships = await self.congress_client.get_member_committees(member.bioguide_id)
+                memberships = decode_records(
+                    CommitteeAssignmentRecord.from_api, assignments, kind="committee assignment"
+                )
                 
                 for membership_data in memberships:
                     # Find or create committee
@@ -55,44 +80,78 @@ class RelationshipDataCollector:
                     if membership:
                         stats["memberships_created"] += 1
                 
+                resolve(self.db, MEMBER_COMMITTEES, bioguide_id)
                 stats["members_processed"] += 1
                 
-                # Rate limiting
-                await asyncio.sleep(0.1)
-                
             except Exception as e:
-                self.logger.error(f"Error processing member {member.bioguide_id}: {e}")
+                self.logger.error(f"Error processing member {bioguide_id}: {e}")
                 stats["errors"] += 1
         
+        try:
+            # Lookups run concurrently; each result is stored as it arrives
+            await self.congress_client.get_all_committee_memberships(
+                bioguide_ids=list(members_by_id), on_error=on_error, on_result=on_result
+            )
+        except QuotaExceededError:
+            # Out of quota for this priority class: keep what was collected and stop
+            self.db.commit()
+            invalidate_read_cache()
+            raise
+        
         self.db.commit()
+        invalidate_read_cache()
         return stats
     
-    def _find_or_create_committee(self, membership_data: Dict) -> Committee:
+    async def retry_failed_memberships(self, include_gave_up: bool = False,
+                                       limit: Optional[int] = None) -> Dict[str, int]:
+        """
+        Re-process only the members whose committee lookup failed earlier.
+        
+        Args:
+            include_gave_up: Also retry members that reached the attempt limit
+            limit: Maximum number of members to retry
+        
+        Returns:
+            Statistics from populate_committee_memberships plus the number retried
+        """
+        bioguide_ids = due_keys(self.db, MEMBER_COMMITTEES, include_gave_up=include_gave_up, limit=limit)
+        if not bioguide_ids:
+            return {"retried": 0, "members_processed": 0, "memberships_created": 0,
+                    "memberships_updated": 0, "errors": 0, "dead_lettered": 0}
+        
+        self.logger.info(f"Retrying committee lookups for {len(bioguide_ids)} members")
+        stats = await self.scheduler.submit(
+            "relationships",
+            lambda: self.populate_committee_memberships(bioguide_ids=bioguide_ids),
+            planned=len(bioguide_ids),
+        )
+        return {"retried": len(bioguide_ids), **stats}
+    
+    def _find_or_create_committee(self, membership_data: CommitteeAssignmentRecord) -> Committee:
         """Find existing committee or create new one."""
         # Try to find by congress_gov_id first
         committee = None
-        if membership_data.get("congress_gov_id"):
+        if membership_data.congress_gov_id:
             committee = self.db.query(Committee).filter(
-                Committee.congress_gov_id == membership_data["congress_gov_id"]
+                Committee.congress_gov_id == membership_data.congress_gov_id
             ).first()
         
         # Try to find by name and chamber
         if not committee:
             committee = self.db.query(Committee).filter(
-                Committee.name == membership_data["name"],
-                Committee.chamber == membership_data["chamber"]
+                Committee.name == membership_data.name,
+                Committee.chamber == membership_data.chamber
             ).first()
         
         # Create new committee if not found
         if not committee:
             committee = Committee(
-                name=membership_data["name"],
-                chamber=membership_data["chamber"],
-                congress_gov_id=membership_data.get("congress_gov_id"),
-                committee_code=membership_data.get("committee_code"),
-                committee_type=membership_data.get("committee_type", "Standing"),
-                is_subcommittee=membership_data.get("is_subcommittee", False),
-                parent_committee_id=membership_data.get("parent_committee_id"),
+                name=membership_data.name,
+                chamber=membership_data.chamber,
+                congress_gov_id=membership_data.congress_gov_id,
+                committee_code=membership_data.committee_code,
+                committee_type=membership_data.committee_type or "Standing",
+                is_subcommittee=membership_data.is_subcommittee,
                 is_active=True
             )
             self.db.add(committee)
@@ -101,7 +160,7 @@ class RelationshipDataCollector:
         return committee
     
     def _create_or_update_membership(
-        self, member: Member, committee: Committee, membership_data: Dict
+        self, member: Member, committee: Committee, membership_data: CommitteeAssignmentRecord
     ) -> Optional[CommitteeMembership]:
         """Create or update committee membership."""
         # Check if membership already exists
@@ -112,18 +171,18 @@ class RelationshipDataCollector:
         
         if existing:
             # Update existing membership
-            existing.position = membership_data.get("position", "Member")
-            existing.is_current = membership_data.get("is_current", True)
+            existing.position = membership_data.position
+            existing.is_current = membership_data.is_current
             return existing
         
         # Create new membership
         membership = CommitteeMembership(
             member_id=member.id,
             committee_id=committee.id,
-            position=membership_data.get("position", "Member"),
-            is_current=membership_data.get("is_current", True),
-            start_date=membership_data.get("start_date"),
-            end_date=membership_data.get("end_date")
+            position=membership_data.position,
+            is_current=membership_data.is_current,
+            start_date=membership_data.start_date,
+            end_date=membership_data.end_date
         )
         
         self.db.add(membership)
@@ -167,6 +226,7 @@ class RelationshipDataCollector:
                 stats["errors"] += 1
         
         self.db.commit()
+        invalidate_read_cache()
         return stats
     
     def _is_subcommittee(self, committee_name: str) -> bool:
@@ -255,6 +315,7 @@ class RelationshipDataCollector:
                 stats["errors"] += 1
         
         self.db.commit()
+        invalidate_read_cache()
         return stats
     
     def _match_hearing_to_committee(self, hearing: Hearing) -> Optional[Committee]:
@@ -293,8 +354,16 @@ async def populate_all_relationship_data(db: Session) -> Dict[str, Any]:
     """
     collector = RelationshipDataCollector(db)
     
-    # Step 1: Populate committee memberships
-    membership_stats = await collector.populate_committee_memberships()
+    # Step 1: Populate committee memberships (one request per current member, low priority)
+    try:
+        membership_stats = await collector.scheduler.submit(
+            "relationships",
+            collector.populate_committee_memberships,
+            planned=db.query(Member).filter(Member.is_current == True).count(),
+        )
+    except QuotaDeferredError as e:
+        logger.warning(f"Committee membership population deferred: {e}")
+        membership_stats = {"memberships_created": 0, "deferred": str(e)}
     
     # Step 2: Fix committee hierarchies
     hierarchy_stats = await collector.fix_committee_hierarchies()
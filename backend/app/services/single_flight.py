@@ -0,0 +1,106 @@
+"""
+Single-flight coalescing of identical concurrent requests.
+
+When several jobs ask for the same Congress.gov URL at the same moment,
+only the first caller performs the request; the others await its result
+instead of spending quota on duplicates. Nothing is kept once the call
+finishes, so this only deduplicates requests that overlap in time - the
+response cache covers repeats.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+import structlog
+from ..core.config import settings
+
+logger = structlog.get_logger()
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call between concurrent callers with the same key.
+    
+    The call runs as its own task, so a caller being cancelled does not
+    cancel the request for the others still waiting on it. Results are
+    shared by reference and must not be mutated by callers.
+    """
+    
+    def __init__(self, enabled: bool = True):
+        """
+        Args:
+            enabled: Coalesce calls (False runs every call independently)
+        """
+        self.enabled = enabled
+        self.stats = {"calls": 0, "coalesced": 0}
+        self._in_flight: Dict[str, asyncio.Task] = {}
+    
+    async def run(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `call`, or join the identical call already in flight.
+        
+        Args:
+            key: Identity of the call, e.g. URL plus normalized query parameters
+            call: Zero-argument coroutine function performing the request
+        
+        Returns:
+            Result of the shared call
+        
+        Raises:
+            Whatever the shared call raises, re-raised in every waiting caller
+        """
+        if not self.enabled:
+            self.stats["calls"] += 1
+            return await call()
+        
+        task = self._in_flight.get(key)
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            self.stats["coalesced"] += 1
+            logger.debug("Coalesced Congress API request", key=key)
+        else:
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            self.stats["calls"] += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+        
+        return await asyncio.shield(task)
+    
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        """Forget a completed call and mark its exception as retrieved."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Every waiter may have been cancelled; avoid "exception was never retrieved"
+            task.exception()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+        
+        Returns:
+            Counts of calls made, calls coalesced and calls in flight
+        """
+        total = self.stats["calls"] + self.stats["coalesced"]
+        return {
+            "enabled": self.enabled,
+            "in_flight": len(self._in_flight),
+            **self.stats,
+            "coalesced_ratio": round(self.stats["coalesced"] / total, 3) if total else 0.0,
+        }
+
+
+# Coalescer shared by every CongressApiClient instance in the process
+_shared_single_flight: Optional[SingleFlight] = None
+
+
+def get_shared_single_flight() -> SingleFlight:
+    """
+    Get the process-wide request coalescer configured from settings.
+    
+    Returns:
+        Shared SingleFlight
+    """
+    global _shared_single_flight
+    
+    if _shared_single_flight is None:
+        _shared_single_flight = SingleFlight(enabled=settings.congress_api_coalesce_requests)
+    
+    return _shared_single_flight
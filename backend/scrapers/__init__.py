@@ -1,12 +1,31 @@
 """
 Web scrapers for congressional websites.
 """
-from .base_scraper import BaseScraper
+from .base_scraper import (
+    BaseScraper, HostThrottle, get_scraper_session, close_scraper_session, get_shared_page_fingerprints
+)
+from .extraction import PageIndex, Selector, compile_selectors
+from .page_fingerprints import FetchedPage, PageFingerprintStore
+from .parse_pool import shutdown_parse_pool
+from .parsers import PARSERS, available_parsers, parse_page
 from .house_scraper import HouseScraper
 from .senate_scraper import SenateScraper
 
 __all__ = [
     "BaseScraper",
+    "HostThrottle",
+    "get_scraper_session",
+    "close_scraper_session",
+    "get_shared_page_fingerprints",
+    "PageIndex",
+    "Selector",
+    "compile_selectors",
+    "FetchedPage",
+    "PageFingerprintStore",
+    "shutdown_parse_pool",
+    "PARSERS",
+    "available_parsers",
+    "parse_page",
     "HouseScraper", 
     "SenateScraper",
 ]
\ No newline at end of file
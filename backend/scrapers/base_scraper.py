@@ -3,30 +3,178 @@ Base scraper class with common functionality.
 """
 import asyncio
 import time
-from typing import Dict, List, Optional, Any, Union
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Any, Tuple, TypeVar, Union
 from urllib.parse import urljoin, urlparse
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 import structlog
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'app'))
 from core.config import settings
+from .extraction import PageIndex, Selector, compile_selectors
+from .page_fingerprints import FetchedPage, PageFingerprintStore, content_hash
+from .parse_pool import run_parser
+from .parsers import parse_page
 
 logger = structlog.get_logger()
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Embedded media looked up by find_video_urls
+VIDEO_SELECTOR, SOURCE_SELECTOR, IFRAME_SELECTOR, EMBED_SELECTOR = compile_selectors(
+    "video", "source", "iframe", "object, embed"
+)
+
+
+@dataclass
+class _HostState:
+    """Politeness bookkeeping for one host."""
+    semaphore: asyncio.Semaphore
+    next_start: float = 0.0
+
+
+class HostThrottle:
+    """
+    Per-host politeness for scraper requests.
+    
+    Each host gets its own limit on requests in flight, and request starts
+    to the same host are spaced `delay` seconds apart. Requests to
+    different hosts (the House committees each have their own subdomain)
+    never wait on each other.
+    """
+    
+    def __init__(self, delay: float, concurrency: int):
+        """
+        Args:
+            delay: Seconds between request starts to the same host
+            concurrency: Requests in flight per host
+        """
+        self.delay = delay
+        self.concurrency = max(1, concurrency)
+        self._hosts: Dict[str, _HostState] = {}
+    
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """
+        Wait for a turn to request a URL and hold it for the request.
+        
+        Args:
+            url: URL about to be requested
+        """
+        host = urlparse(url).netloc.lower()
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(asyncio.Semaphore(self.concurrency))
+        
+        async with state.semaphore:
+            # Claim the next start time before sleeping so waiters queue up in order
+            now = time.monotonic()
+            start = max(now, state.next_start)
+            state.next_start = start + self.delay
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+
+# Pooled client and throttle shared by every scraper, bound to the event loop that created them
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_throttle: Optional[HostThrottle] = None
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_scraper_session() -> Tuple[httpx.AsyncClient, HostThrottle]:
+    """
+    Get the shared scraper HTTP client and host throttle.
+    
+    Both are rebuilt if the client was closed or the event loop changed
+    (pooled connections and semaphores are loop-bound).
+    
+    Returns:
+        Shared AsyncClient and HostThrottle
+    """
+    global _shared_client, _shared_throttle, _shared_loop
+    
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_loop is not loop:
+        _shared_client = httpx.AsyncClient(
+            timeout=settings.scraping_timeout,
+            limits=httpx.Limits(
+                max_connections=settings.scraping_max_connections,
+                max_keepalive_connections=settings.scraping_max_connections,
+            ),
+        )
+        _shared_throttle = HostThrottle(settings.scraping_delay, settings.scraping_host_concurrency)
+        _shared_loop = loop
+    
+    return _shared_client, _shared_throttle
+
+
+async def close_scraper_session() -> None:
+    """
+    Close the shared scraper client and release its pooled connections.
+    """
+    global _shared_client, _shared_throttle, _shared_loop
+    
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    
+    _shared_client = None
+    _shared_throttle = None
+    _shared_loop = None
+
+
+# Page fingerprints shared by every scraper in the process
+_shared_page_fingerprints: Optional[PageFingerprintStore] = None
+
+
+def get_shared_page_fingerprints() -> PageFingerprintStore:
+    """
+    Get the process-wide page fingerprint store configured from settings.
+    
+    Returns:
+        Shared PageFingerprintStore
+    """
+    global _shared_page_fingerprints
+    
+    if _shared_page_fingerprints is None:
+        _shared_page_fingerprints = PageFingerprintStore(settings.scraping_fingerprint_path)
+    
+    return _shared_page_fingerprints
+
 
 class BaseScraper:
     """
     Base class for web scrapers with rate limiting and error handling.
     """
     
-    def __init__(self, base_url: str, name: str):
+    # Containers each extraction method reads, by method name; pages handed
+    # to that method through fetch_and_parse are parsed only inside them
+    parse_only: Dict[str, Tuple[Selector, ...]] = {}
+    
+    def __init__(self, base_url: str, name: str, http_client: Optional[httpx.AsyncClient] = None,
+                 throttle: Optional[HostThrottle] = None,
+                 fingerprints: Optional[PageFingerprintStore] = None):
+        """
+        Args:
+            base_url: Site root used to resolve relative links
+            name: Scraper name for logging
+            http_client: Optional client to use instead of the shared pool
+            throttle: Optional host throttle to use instead of the shared one
+            fingerprints: Optional page fingerprint store to use instead of the shared one
+        """
         self.base_url = base_url
         self.name = name
-        self.last_request_time = 0
-        self.request_delay = settings.scraping_delay
+        self.http_client = http_client
+        self.throttle = throttle
+        self.fingerprints = fingerprints
         self.timeout = settings.scraping_timeout
+        self.max_concurrency = settings.scraping_max_concurrency
+        self.parse_workers = settings.scraping_parse_workers
+        self.parser = settings.scraping_parser
         
         # Default headers
         self.headers = {
@@ -38,35 +186,35 @@ class BaseScraper:
             "Upgrade-Insecure-Requests": "1",
         }
     
-    async def _make_request(self, url: str, **kwargs) -> httpx.Response:
+    async def _make_request(self, url: str, headers: Optional[Dict[str, str]] = None,
+                            **kwargs) -> httpx.Response:
         """
         Make a rate-limited HTTP request.
         
+        Requests go through the shared connection pool and wait for their
+        host's politeness slot, so pages on different hosts load in parallel.
+        
         Args:
             url: URL to request
-            **kwargs: Additional arguments for httpx.get
+            headers: Headers to send on top of the defaults
+            **kwargs: Additional arguments for httpx.AsyncClient.get
             
         Returns:
-            HTTP response
+            HTTP response (304 Not Modified is returned, not raised)
             
         Raises:
             httpx.HTTPError: If request fails
         """
-        # Rate limiting
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.request_delay:
-            await asyncio.sleep(self.request_delay - time_since_last)
-        
-        # Make the request
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
-            headers=self.headers,
-            **kwargs
-        ) as client:
-            response = await client.get(url)
-            
-        self.last_request_time = time.time()
+        client, throttle = self.http_client, self.throttle
+        if client is None or throttle is None:
+            shared_client, shared_throttle = get_scraper_session()
+            client = client or shared_client
+            throttle = throttle or shared_throttle
+        
+        # Rate limiting - per host, shared by every scraper
+        async with throttle.slot(url):
+            response = await client.get(url, headers={**self.headers, **(headers or {})},
+                                        timeout=self.timeout, **kwargs)
         
         # Log request
         logger.info(
@@ -77,21 +225,139 @@ class BaseScraper:
             content_length=len(response.content),
         )
         
-        response.raise_for_status()
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            response.raise_for_status()
         return response
     
-    async def fetch_page(self, url: str) -> BeautifulSoup:
+    async def fetch_page(self, url: str) -> Any:
         """
-        Fetch a web page and return BeautifulSoup object.
+        Fetch a web page and parse it with the configured parser.
         
         Args:
             url: URL to fetch
             
         Returns:
-            BeautifulSoup object
+            BeautifulSoup object (SelectolaxPage with the selectolax parser)
         """
         response = await self._make_request(url)
-        return BeautifulSoup(response.content, 'html.parser')
+        return parse_page(response.content, self.parser)
+    
+    async def fetch_and_parse(self, url: str, method: str, *args: Any) -> Any:
+        """
+        Fetch a page and run an extraction method on it in the parse pool.
+        
+        Only the method's result crosses back to the event loop, so the
+        method must return plain data (dicts, lists, strings), not soup
+        elements.
+        
+        Args:
+            url: URL to fetch
+            method: Name of a method taking the parsed page, e.g. "parse_hearings"
+            *args: Extra arguments for the method
+            
+        Returns:
+            Result of the extraction method
+        """
+        response = await self._make_request(url)
+        return await run_parser(self.parse_workers, type(self), method, response.content, self.parser, *args)
+    
+    async def fetch_changes(self, url: str, method: str, *args: Any,
+                            force_refresh: bool = False) -> FetchedPage:
+        """
+        Fetch a page and run an extraction method on it unless it is unchanged.
+        
+        The request is a conditional GET carrying the ETag and Last-Modified
+        the page was last saved with. If the server answers 304, or the
+        body hashes the same as last time, the method's stored result is
+        returned without parsing the page.
+        
+        Nothing is saved here: pass changed pages to keep_page once the
+        data built from them has been stored.
+        
+        Args:
+            url: URL to fetch
+            method: Name of a method taking the parsed page, e.g. "parse_hearings"
+            *args: Extra arguments for the method
+            force_refresh: Fetch unconditionally and parse even if unchanged
+            
+        Returns:
+            The page's hash, validators, method result and whether it
+            changed since it was last saved
+        """
+        fingerprints = self.fingerprints or get_shared_page_fingerprints()
+        previous = None if force_refresh else fingerprints.load(url, method, args)
+        
+        headers = {}
+        if previous is not None and previous.has_result:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
+        
+        response = await self._make_request(url, headers=headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED and headers:
+            fingerprints.record("not_modified")
+            return FetchedPage(url, method, args, previous.content_hash, previous.etag,
+                               previous.last_modified, previous.result, changed=False)
+        
+        page_hash = content_hash(response.content)
+        if previous is not None and previous.has_result and previous.content_hash == page_hash:
+            fingerprints.record("unchanged")
+            return FetchedPage(url, method, args, page_hash, previous.etag,
+                               previous.last_modified, previous.result, changed=False)
+        
+        result = await run_parser(self.parse_workers, type(self), method, response.content, self.parser, *args)
+        fingerprints.record("changed")
+        return FetchedPage(url, method, args, page_hash, response.headers.get("etag"),
+                           response.headers.get("last-modified"), result, changed=True)
+    
+    def keep_page(self, page: FetchedPage, pending: Optional[List[FetchedPage]]) -> None:
+        """
+        Save a changed page, or hold it for the caller to save later.
+        
+        Args:
+            page: Page from fetch_changes
+            pending: The caller's list of pages to save once its data is
+                stored; None saves the page right away
+        """
+        if not page.changed:
+            return
+        if pending is None:
+            self.save_pages([page])
+        else:
+            pending.append(page)
+    
+    def save_pages(self, pages: List[FetchedPage]) -> None:
+        """
+        Save pages so later fetches of them are skipped while unchanged.
+        
+        Args:
+            pages: Changed pages from fetch_changes
+        """
+        (self.fingerprints or get_shared_page_fingerprints()).save(pages)
+    
+    async def crawl(self, items: Iterable[T], worker: Callable[[T], Awaitable[R]],
+                    concurrency: Optional[int] = None) -> List[R]:
+        """
+        Run a worker over items with bounded concurrency, preserving order.
+        
+        Per-host politeness still applies to every request the workers make.
+        
+        Args:
+            items: Items to process, e.g. page URLs
+            worker: Coroutine function called once per item
+            concurrency: Workers running at once (default: scraping_max_concurrency)
+            
+        Returns:
+            Worker results in item order
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.max_concurrency))
+        
+        async def bounded(item: T) -> R:
+            async with semaphore:
+                return await worker(item)
+        
+        return list(await asyncio.gather(*(bounded(item) for item in items)))
     
     def make_absolute_url(self, url: str) -> str:
         """
@@ -149,32 +415,37 @@ class BaseScraper:
         
         return links
     
-    def find_video_urls(self, soup: BeautifulSoup) -> List[str]:
+    def find_video_urls(self, page: Union[BeautifulSoup, Tag, PageIndex],
+                        within: Optional[Tag] = None) -> List[str]:
         """
         Find video URLs in page content.
         
         Args:
-            soup: BeautifulSoup object
+            page: BeautifulSoup object or element, or the PageIndex of a page
+            within: Element of an indexed page to search below (default: the whole page)
             
         Returns:
-            List of video URLs
+            List of video URLs in page order
         """
+        if not isinstance(page, PageIndex):
+            page = PageIndex(page)
+        
         video_urls = []
         
         # Check for video tags
-        for video in soup.find_all("video"):
+        for video in page.select(VIDEO_SELECTOR, within):
             src = video.get("src")
             if src:
                 video_urls.append(self.make_absolute_url(src))
             
             # Check for source tags within video
-            for source in video.find_all("source"):
+            for source in page.select(SOURCE_SELECTOR, video):
                 src = source.get("src")
                 if src:
                     video_urls.append(self.make_absolute_url(src))
         
         # Check for iframe embeds
-        for iframe in soup.find_all("iframe"):
+        for iframe in page.select(IFRAME_SELECTOR, within):
             src = iframe.get("src")
             if src and any(domain in src for domain in [
                 "youtube.com", "youtu.be", "vimeo.com", "house.gov", "senate.gov"
@@ -182,33 +453,34 @@ class BaseScraper:
                 video_urls.append(src)
         
         # Check for object/embed tags
-        for obj in soup.find_all(["object", "embed"]):
+        for obj in page.select(EMBED_SELECTOR, within):
             src = obj.get("src") or obj.get("data")
             if src:
                 video_urls.append(self.make_absolute_url(src))
         
-        return list(set(video_urls))  # Remove duplicates
+        return list(dict.fromkeys(video_urls))  # Remove duplicates
     
-    def extract_committee_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def extract_committee_info(self, page: PageIndex) -> Dict[str, Any]:
         """
         Extract committee information from page.
         Override in subclasses for site-specific extraction.
         
         Args:
-            soup: BeautifulSoup object
+            page: Index of the parsed page
             
         Returns:
             Committee information dictionary
         """
         return {}
     
-    def extract_hearing_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def extract_hearing_info(self, page: PageIndex, element: Tag) -> Dict[str, Any]:
         """
-        Extract hearing information from page.
+        Extract hearing information from a hearing element.
         Override in subclasses for site-specific extraction.
         
         Args:
-            soup: BeautifulSoup object
+            page: Index of the parsed page
+            element: Element containing hearing information
             
         Returns:
             Hearing information dictionary
@@ -0,0 +1,401 @@
+"""
+Single-pass extraction index for scraped pages.
+
+The extraction methods used to run every CSS selector, regex and video
+lookup as its own traversal of the parsed page: each `:contains` selector
+re-collected the text of every element, the contact regexes called
+`get_text()` on the whole page once each, and the video lookup ran four
+`find_all` sweeps. PageIndex walks the tree once and records, for every
+element, its position in document order, where its subtree ends, and
+where its text sits in the concatenated page text. Selectors are compiled
+once per scraper and evaluated against that index, so a `:contains` test
+is a substring search over a slice of one string and a scoped lookup is a
+range check.
+
+Only the selector forms the scrapers use are supported (tag, `*`,
+`.class`, `[attr*='value']`, `:contains('text')`, compounds of those and
+comma-separated groups), with the same matches, in the same order, as
+soupsieve gives for them.
+
+The index is built from a stream of walk events, so trees from other
+parser backends (see parsers.py) can be indexed without BeautifulSoup.
+"""
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+from bs4 import BeautifulSoup, CData, Comment, Declaration, Doctype, NavigableString, ProcessingInstruction, Tag
+import soupsieve
+
+# Strings Tag.get_text() returns for ordinary elements
+_TEXT_TYPES = (NavigableString, CData)
+
+# Strings soupsieve leaves out of the text :contains searches
+_SPECIAL_STRINGS = (Comment, Declaration, CData, ProcessingInstruction, Doctype)
+
+_COMPOUND = re.compile(
+    r"""
+    (?P<tag>\*|[a-zA-Z][\w-]*)?
+    (?P<classes>(?:\.[\w-]+)*)
+    (?:\[(?P<attr>[\w-]+)\*=(?P<aq>['"])(?P<value>.*?)(?P=aq)\])?
+    (?::contains\((?P<cq>['"])(?P<text>.*?)(?P=cq)\))?
+    """,
+    re.VERBOSE,
+)
+
+# Kinds of page walk events
+START, END, STRING = 0, 1, 2
+
+# Contact details, searched in the page text
+PHONE_PATTERN = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+
+@dataclass(frozen=True)
+class _Compound:
+    """One compound selector such as a[href*='hearing'] or p:contains('committee')."""
+    tag: Optional[str]
+    classes: Tuple[str, ...]
+    attr: Optional[str]
+    value: Optional[str]
+    text: Optional[str]
+
+
+class Selector:
+    """
+    A CSS selector compiled for evaluation against a PageIndex.
+    """
+    
+    def __init__(self, css: str):
+        """
+        Args:
+            css: Selector text, e.g. "*:contains('Ranking Member')"
+        
+        Raises:
+            ValueError: If the selector uses syntax the index does not support
+        """
+        self.css = css
+        self.parts = tuple(self._compile(part.strip()) for part in css.split(","))
+    
+    def _compile(self, css: str) -> _Compound:
+        """Parse one compound selector."""
+        match = _COMPOUND.fullmatch(css)
+        if not css or match is None:
+            raise ValueError(f"Unsupported selector: {self.css!r}")
+        
+        tag = match.group("tag")
+        return _Compound(
+            tag=None if tag in (None, "*") else tag.lower(),
+            classes=tuple(cls for cls in match.group("classes").split(".") if cls),
+            attr=match.group("attr").lower() if match.group("attr") else None,
+            value=match.group("value"),
+            text=match.group("text"),
+        )
+    
+    def matches_tag(self, name: str, attrs: Mapping[str, Any]) -> bool:
+        """
+        Check a start tag against the selector before its element is built.
+        
+        Used to decide which containers a partial parse keeps.
+        
+        Args:
+            name: Tag name
+            attrs: Raw attributes (values may be strings or lists)
+        
+        Returns:
+            True if any part of the selector matches
+        
+        Raises:
+            ValueError: If the selector needs element text (:contains)
+        """
+        for part in self.parts:
+            if part.text is not None:
+                raise ValueError(f"Selector needs element text: {self.css!r}")
+            if part.tag is not None and name.lower() != part.tag:
+                continue
+            if part.classes:
+                classes = attrs.get("class") or ""
+                classes = classes.split() if isinstance(classes, str) else classes
+                if any(cls not in classes for cls in part.classes):
+                    continue
+            if part.attr is not None:
+                value = attrs.get(part.attr)
+                if isinstance(value, list):
+                    value = " ".join(value)
+                if value is None or not part.value or part.value not in value:
+                    continue
+            return True
+        return False
+    
+    def __repr__(self) -> str:
+        return f"Selector({self.css!r})"
+
+
+def compile_selectors(*css: str) -> Tuple[Selector, ...]:
+    """
+    Compile selectors that are tried in order.
+    
+    Args:
+        *css: Selector texts
+    
+    Returns:
+        Compiled selectors
+    """
+    return tuple(Selector(text) for text in css)
+
+
+def soup_events(root: Union[BeautifulSoup, Tag]) -> Iterator[Tuple[int, Any, bool, bool]]:
+    """
+    Walk a BeautifulSoup tree below `root` in document order.
+    
+    Args:
+        root: Parsed page or element
+    
+    Yields:
+        (START, element, keeps_own_strings, False) as an element opens,
+        (END, None, False, False) as it closes and
+        (STRING, text, in_get_text, in_contains) for each string
+    """
+    stack = [iter(root.contents)]
+    while stack:
+        node = next(stack[-1], None)
+        if node is None:
+            stack.pop()
+            # Every iterator but the root's belongs to an element
+            if stack:
+                yield END, None, False, False
+        elif isinstance(node, Tag):
+            yield START, node, node.interesting_string_types != _TEXT_TYPES, False
+            stack.append(iter(node.contents))
+        elif isinstance(node, NavigableString):
+            yield STRING, node, type(node) in _TEXT_TYPES, not isinstance(node, _SPECIAL_STRINGS)
+
+
+class PageIndex:
+    """
+    Element, class and text index of a parsed page, built in one walk.
+    """
+    
+    def __init__(self, root: Any):
+        """
+        Args:
+            root: Parsed page, or an element to index on its own. Anything
+                other than a BeautifulSoup tree must provide events() yielding
+                the same walk events as soup_events, with elements offering
+                name, get, get_attribute_list and get_text like a Tag.
+        """
+        self.root = root
+        self.elements: List[Tag] = []
+        self._positions: Dict[int, int] = {}
+        self._by_name: Dict[str, List[int]] = {}
+        self._by_class: Dict[str, List[int]] = {}
+        # Per element: position after its last descendant
+        self._ends: List[int] = []
+        # Per element: its slice of the get_text() text and of the :contains text
+        self._text_spans: List[Tuple[int, int]] = []
+        self._content_spans: List[Tuple[int, int]] = []
+        # Per element: whether it is inside an iframe, and whether iframe content is below it
+        self._in_iframe: List[bool] = []
+        self._has_iframe: List[bool] = []
+        # Per element: whether get_text() collects other string types (script, style, ...)
+        self._own_strings: List[bool] = []
+        self._walk(soup_events(root) if isinstance(root, Tag) else root.events())
+    
+    def _walk(self, events: Iterator[Tuple[int, Any, bool, bool]]) -> None:
+        """Index every element and string below the root in document order."""
+        text_chunks: List[str] = []
+        content_chunks: List[str] = []
+        text_length = content_length = 0
+        open_elements: List[int] = []
+        iframe_depth = 0
+        
+        for kind, node, first_flag, second_flag in events:
+            if kind == STRING:
+                if first_flag:
+                    text_chunks.append(node)
+                    text_length += len(node)
+                if second_flag and iframe_depth == 0:
+                    content_chunks.append(node)
+                    content_length += len(node)
+            elif kind == START:
+                position = len(self.elements)
+                self.elements.append(node)
+                self._positions[id(node)] = position
+                self._by_name.setdefault(node.name, []).append(position)
+                for cls in node.get_attribute_list("class"):
+                    if cls:
+                        self._by_class.setdefault(cls, []).append(position)
+                self._ends.append(position + 1)
+                self._text_spans.append((text_length, text_length))
+                self._content_spans.append((content_length, content_length))
+                self._in_iframe.append(iframe_depth > 0)
+                self._has_iframe.append(False)
+                self._own_strings.append(first_flag)
+                if node.name == "iframe":
+                    iframe_depth += 1
+                open_elements.append(position)
+            else:
+                position = open_elements.pop()
+                self._ends[position] = len(self.elements)
+                self._text_spans[position] = (self._text_spans[position][0], text_length)
+                self._content_spans[position] = (self._content_spans[position][0], content_length)
+                if self.elements[position].name == "iframe":
+                    iframe_depth -= 1
+                    self._has_iframe[position] = True
+                    for ancestor in open_elements:
+                        self._has_iframe[ancestor] = True
+        
+        self._text = "".join(text_chunks)
+        self._content = "".join(content_chunks)
+    
+    def _range(self, within: Optional[Tag]) -> Tuple[int, int]:
+        """Positions of the elements below `within` (the whole page for None or the root)."""
+        if within is None or within is self.root:
+            return 0, len(self.elements)
+        position = self._positions[id(within)]
+        return position + 1, self._ends[position]
+    
+    def _contains(self, position: int, text: str) -> bool:
+        """Whether an element's :contains text includes `text`."""
+        start, end = self._content_spans[position]
+        return self._content.find(text, start, end) != -1
+    
+    def _matches(self, part: _Compound, position: int) -> bool:
+        """Whether the element at `position` matches a compound selector."""
+        element = self.elements[position]
+        if part.tag is not None and element.name.lower() != part.tag:
+            return False
+        if part.classes:
+            classes = element.get_attribute_list("class")
+            if any(cls not in classes for cls in part.classes):
+                return False
+        if part.attr is not None:
+            value = element.get(part.attr)
+            if isinstance(value, list):
+                value = " ".join(value)
+            if value is None or not part.value or part.value not in value:
+                return False
+        if part.text is not None:
+            if self._in_iframe[position] and isinstance(element, Tag):
+                # Text inside iframes is left out of the index; defer to soupsieve
+                return soupsieve.match(f":contains({part.text!r})", element)
+            return self._contains(position, part.text)
+        return True
+    
+    def _select_part(self, part: _Compound, start: int, end: int, limit: Optional[int]) -> List[int]:
+        """Positions in [start, end) matching one compound selector, in document order."""
+        if part.classes or part.tag is not None:
+            candidates = self._by_class.get(part.classes[0], []) if part.classes else self._by_name.get(part.tag, [])
+            found = []
+            for position in candidates[bisect_left(candidates, start):bisect_left(candidates, end)]:
+                if self._matches(part, position):
+                    found.append(position)
+                    if limit is not None and len(found) >= limit:
+                        break
+            return found
+        
+        found = []
+        position = start
+        while position < end:
+            if (part.text is not None and not self._in_iframe[position]
+                    and not self._has_iframe[position] and not self._contains(position, part.text)):
+                # Nothing below an element can contain text the element lacks
+                position = self._ends[position]
+                continue
+            if self._matches(part, position):
+                found.append(position)
+                if limit is not None and len(found) >= limit:
+                    break
+            position += 1
+        return found
+    
+    def _select(self, selector: Selector, within: Optional[Tag], limit: Optional[int]) -> List[Tag]:
+        """Elements matching any part of a selector, in document order."""
+        start, end = self._range(within)
+        if len(selector.parts) == 1:
+            positions = self._select_part(selector.parts[0], start, end, limit)
+        else:
+            positions = sorted({
+                position for part in selector.parts for position in self._select_part(part, start, end, limit)
+            })[:limit]
+        return [self.elements[position] for position in positions]
+    
+    def select(self, selector: Selector, within: Optional[Tag] = None) -> List[Tag]:
+        """
+        Find every element matching a selector, like Tag.select.
+        
+        Args:
+            selector: Compiled selector
+            within: Element to search below (default: the whole page)
+        
+        Returns:
+            Matching elements in document order
+        """
+        return self._select(selector, within, None)
+    
+    def select_one(self, selector: Selector, within: Optional[Tag] = None) -> Optional[Tag]:
+        """
+        Find the first element matching a selector, like Tag.select_one.
+        
+        Args:
+            selector: Compiled selector
+            within: Element to search below (default: the whole page)
+        
+        Returns:
+            First matching element or None
+        """
+        found = self._select(selector, within, 1)
+        return found[0] if found else None
+    
+    def first(self, selectors: Tuple[Selector, ...], within: Optional[Tag] = None) -> Optional[Tag]:
+        """
+        Find the first match of the first selector that matches anything.
+        
+        Args:
+            selectors: Selectors in priority order
+            within: Element to search below (default: the whole page)
+        
+        Returns:
+            Matching element or None
+        """
+        for selector in selectors:
+            element = self.select_one(selector, within)
+            if element is not None:
+                return element
+        return None
+    
+    def text(self, element: Optional[Tag] = None, strip: bool = True) -> str:
+        """
+        Get an element's text, like Tag.get_text, without walking it again.
+        
+        Args:
+            element: Indexed element (default: the whole page)
+            strip: Whether to strip whitespace
+        
+        Returns:
+            Text of the element
+        """
+        if element is None or element is self.root:
+            text = self._text
+        else:
+            position = self._positions[id(element)]
+            if self._own_strings[position]:
+                # script, style and similar elements report their own string types
+                text = element.get_text()
+            else:
+                start, end = self._text_spans[position]
+                text = self._text[start:end]
+        return text.strip() if strip else text
+    
+    def search(self, pattern: re.Pattern, element: Optional[Tag] = None) -> Optional[re.Match]:
+        """
+        Search an element's text with a compiled regex.
+        
+        Args:
+            pattern: Compiled pattern
+            element: Indexed element (default: the whole page)
+        
+        Returns:
+            First match or None
+        """
+        return pattern.search(self.text(element, strip=False))
@@ -1,70 +1,103 @@
 """
 Web scraper for House.gov websites.
 """
-import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+import httpx
 import structlog
-import sys
-import os
-sys.path.append(os.path.dirname(__file__))
-from base_scraper import BaseScraper
+from .base_scraper import BaseScraper, HostThrottle
+from .extraction import EMAIL_PATTERN, PHONE_PATTERN, PageIndex, Selector, compile_selectors
+from .page_fingerprints import FetchedPage, PageFingerprintStore
 
 logger = structlog.get_logger()
 
+# Selectors are compiled once; each list is tried in order against a page's index
+COMMITTEE_LINK_SELECTOR = Selector("a[href*='/committees/']")
+SUBCOMMITTEE_LINK_SELECTOR = Selector("a[href*='subcommittee']")
+DESCRIPTION_SELECTORS = compile_selectors(
+    ".committee-description", ".committee-about", ".description", "p:contains('committee')"
+)
+JURISDICTION_SELECTORS = compile_selectors(".jurisdiction", ".committee-jurisdiction", "*:contains('jurisdiction')")
+CHAIR_SELECTORS = compile_selectors(".chair", ".committee-chair", "*:contains('Chair')", "*:contains('Chairman')")
+RANKING_SELECTORS = compile_selectors(
+    ".ranking-member", ".committee-ranking-member", "*:contains('Ranking Member')"
+)
+OFFICE_SELECTORS = compile_selectors(".office", ".location", "*:contains('Room')", "*:contains('Office')")
+HEARINGS_LINK_SELECTORS = compile_selectors("a[href*='hearing']", "a[href*='schedule']", "a[href*='calendar']")
+HEARING_SELECTORS = compile_selectors(".hearing", ".event", ".committee-hearing", "*[class*='hearing']")
+HEARING_TITLE_SELECTORS = compile_selectors(".title", ".hearing-title", "h1", "h2", "h3")
+HEARING_DATE_SELECTORS = compile_selectors(".date", ".hearing-date", "*[class*='date']")
+HEARING_LOCATION_SELECTORS = compile_selectors(".location", ".hearing-location", ".room")
+HEARING_DESCRIPTION_SELECTORS = compile_selectors(".description", ".hearing-description", "p")
+
 
 class HouseScraper(BaseScraper):
     """
     Scraper for House.gov websites.
     """
     
-    def __init__(self):
-        super().__init__("https://www.house.gov", "HouseScraper")
+    # List and calendar pages are parsed only inside the elements read from them
+    parse_only = {
+        "parse_committee_list": (COMMITTEE_LINK_SELECTOR,),
+        "parse_hearings": HEARING_SELECTORS,
+    }
+    
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None,
+                 throttle: Optional[HostThrottle] = None,
+                 fingerprints: Optional[PageFingerprintStore] = None):
+        super().__init__("https://www.house.gov", "HouseScraper", http_client=http_client, throttle=throttle,
+                         fingerprints=fingerprints)
         
         # Common House.gov URL patterns
         self.committee_list_url = "https://www.house.gov/committees"
         self.hearing_calendar_url = "https://www.house.gov/legislative-activity/committee-hearings"
     
-    async def scrape_committees(self) -> List[Dict[str, Any]]:
+    async def scrape_committees(self, changed_only: bool = False, force_refresh: bool = False,
+                                pending: Optional[List[FetchedPage]] = None) -> List[Dict[str, Any]]:
         """
         Scrape House committees from the committees page.
         
+        Args:
+            changed_only: Leave out committees whose list entry and page are
+                unchanged since they were last scraped
+            force_refresh: Parse every page even if unchanged
+            pending: Collects the changed pages for the caller to save once
+                the committees are stored (default: saved right away)
+            
         Returns:
             List of committee information dictionaries
         """
         try:
-            soup = await self.fetch_page(self.committee_list_url)
-            committees = []
+            committee_list = await self.fetch_changes(
+                self.committee_list_url, "parse_committee_list", force_refresh=force_refresh
+            )
+            
+            async def add_details(committee_info: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+                # Try to get detailed information; the list entry itself is
+                # left untouched since it is saved as the list page's result
+                try:
+                    details = await self.fetch_changes(
+                        committee_info["url"], "parse_committee_details", force_refresh=force_refresh
+                    )
+                    self.keep_page(details, pending)
+                    return {**committee_info, **details.result}, details.changed
+                except Exception as e:
+                    logger.warning(
+                        "Could not scrape committee details",
+                        committee=committee_info["name"],
+                        url=committee_info["url"],
+                        error=str(e)
+                    )
+                    return dict(committee_info), False
             
-            # Find committee links
-            committee_links = soup.select("a[href*='/committees/']")
+            # Committee pages are fetched concurrently, politely per host
+            detailed = await self.crawl(committee_list.result, add_details)
             
-            for link in committee_links:
-                committee_url = self.make_absolute_url(link.get("href"))
-                committee_name = self.extract_text(link)
-                
-                if committee_name and committee_url:
-                    committee_info = {
-                        "name": committee_name,
-                        "url": committee_url,
-                        "chamber": "House",
-                        "source": "house.gov",
-                    }
-                    
-                    # Try to get detailed information
-                    try:
-                        committee_details = await self.scrape_committee_details(committee_url)
-                        committee_info.update(committee_details)
-                    except Exception as e:
-                        logger.warning(
-                            "Could not scrape committee details",
-                            committee=committee_name,
-                            url=committee_url,
-                            error=str(e)
-                        )
-                    
-                    committees.append(committee_info)
+            self.keep_page(committee_list, pending)
+            committees = [committee for committee, _ in detailed]
+            if changed_only and not committee_list.changed:
+                committees = [committee for committee, changed in detailed if changed]
             
             logger.info(f"Scraped {len(committees)} House committees")
             return committees
@@ -73,6 +106,36 @@ class HouseScraper(BaseScraper):
             logger.error("Error scraping House committees", error=str(e))
             return []
     
+    def parse_committee_list(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """
+        Extract committee names and links from the committees page.
+        
+        Args:
+            soup: BeautifulSoup object
+            
+        Returns:
+            List of committee dictionaries without details
+        """
+        committees = []
+        page = PageIndex(soup)
+        
+        # Find committee links
+        committee_links = page.select(COMMITTEE_LINK_SELECTOR)
+        
+        for link in committee_links:
+            committee_url = self.make_absolute_url(link.get("href"))
+            committee_name = page.text(link)
+            
+            if committee_name and committee_url:
+                committees.append({
+                    "name": committee_name,
+                    "url": committee_url,
+                    "chamber": "House",
+                    "source": "house.gov",
+                })
+        
+        return committees
+    
     async def scrape_committee_details(self, committee_url: str) -> Dict[str, Any]:
         """
         Scrape detailed information for a specific committee.
@@ -83,19 +146,31 @@ class HouseScraper(BaseScraper):
         Returns:
             Committee details dictionary
         """
-        soup = await self.fetch_page(committee_url)
+        return await self.fetch_and_parse(committee_url, "parse_committee_details")
+    
+    def parse_committee_details(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        Extract House committee details from a committee page.
+        
+        Args:
+            soup: BeautifulSoup object
+            
+        Returns:
+            Committee details dictionary
+        """
         details = {}
+        page = PageIndex(soup)
         
         # Extract committee information
-        details.update(self.extract_committee_info(soup))
+        details.update(self.extract_committee_info(page))
         
         # Look for subcommittees
         subcommittees = []
-        subcommittee_links = soup.select("a[href*='subcommittee']")
+        subcommittee_links = page.select(SUBCOMMITTEE_LINK_SELECTOR)
         
         for link in subcommittee_links:
             subcommittee_url = self.make_absolute_url(link.get("href"))
-            subcommittee_name = self.extract_text(link)
+            subcommittee_name = page.text(link)
             
             if subcommittee_name and subcommittee_url:
                 subcommittees.append({
@@ -107,19 +182,19 @@ class HouseScraper(BaseScraper):
         details["subcommittees"] = subcommittees
         
         # Extract contact information
-        details.update(self.extract_contact_info(soup))
+        details.update(self.extract_contact_info(page))
         
         # Look for hearing information
-        details["hearings_url"] = self.find_hearings_url(soup)
+        details["hearings_url"] = self.find_hearings_url(page)
         
         return details
     
-    def extract_committee_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def extract_committee_info(self, page: PageIndex) -> Dict[str, Any]:
         """
         Extract committee information from committee page.
         
         Args:
-            soup: BeautifulSoup object
+            page: Index of the committee page
             
         Returns:
             Committee information dictionary
@@ -127,45 +202,28 @@ class HouseScraper(BaseScraper):
         info = {}
         
         # Try to find committee description
-        description_selectors = [
-            ".committee-description",
-            ".committee-about",
-            ".description",
-            "p:contains('committee')",
-        ]
-        
-        for selector in description_selectors:
-            description_elem = soup.select_one(selector)
-            if description_elem:
-                info["description"] = self.extract_text(description_elem)
-                break
+        description_elem = page.first(DESCRIPTION_SELECTORS)
+        if description_elem:
+            info["description"] = page.text(description_elem)
         
         # Try to find jurisdiction information
-        jurisdiction_selectors = [
-            ".jurisdiction",
-            ".committee-jurisdiction",
-            "*:contains('jurisdiction')",
-        ]
-        
-        for selector in jurisdiction_selectors:
-            jurisdiction_elem = soup.select_one(selector)
-            if jurisdiction_elem:
-                info["jurisdiction"] = self.extract_text(jurisdiction_elem)
-                break
+        jurisdiction_elem = page.first(JURISDICTION_SELECTORS)
+        if jurisdiction_elem:
+            info["jurisdiction"] = page.text(jurisdiction_elem)
         
         # Try to find leadership information
-        leadership = self.extract_leadership(soup)
+        leadership = self.extract_leadership(page)
         if leadership:
             info.update(leadership)
         
         return info
     
-    def extract_leadership(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def extract_leadership(self, page: PageIndex) -> Dict[str, Any]:
         """
         Extract committee leadership information.
         
         Args:
-            soup: BeautifulSoup object
+            page: Index of the committee page
             
         Returns:
             Leadership information dictionary
@@ -173,42 +231,23 @@ class HouseScraper(BaseScraper):
         leadership = {}
         
         # Look for chair information
-        chair_selectors = [
-            ".chair",
-            ".committee-chair",
-            "*:contains('Chair')",
-            "*:contains('Chairman')",
-        ]
-        
-        for selector in chair_selectors:
-            chair_elem = soup.select_one(selector)
-            if chair_elem:
-                chair_text = self.extract_text(chair_elem)
-                leadership["chair_info"] = chair_text
-                break
+        chair_elem = page.first(CHAIR_SELECTORS)
+        if chair_elem:
+            leadership["chair_info"] = page.text(chair_elem)
         
         # Look for ranking member information
-        ranking_selectors = [
-            ".ranking-member",
-            ".committee-ranking-member",
-            "*:contains('Ranking Member')",
-        ]
-        
-        for selector in ranking_selectors:
-            ranking_elem = soup.select_one(selector)
-            if ranking_elem:
-                ranking_text = self.extract_text(ranking_elem)
-                leadership["ranking_member_info"] = ranking_text
-                break
+        ranking_elem = page.first(RANKING_SELECTORS)
+        if ranking_elem:
+            leadership["ranking_member_info"] = page.text(ranking_elem)
         
         return leadership
     
-    def extract_contact_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def extract_contact_info(self, page: PageIndex) -> Dict[str, Any]:
         """
         Extract contact information from page.
         
         Args:
-            soup: BeautifulSoup object
+            page: Index of the page
             
         Returns:
             Contact information dictionary
@@ -216,97 +255,69 @@ class HouseScraper(BaseScraper):
         contact = {}
         
         # Look for phone numbers
-        phone_pattern = r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phone_matches = re.findall(phone_pattern, soup.get_text())
-        if phone_matches:
-            contact["phone"] = phone_matches[0]
+        phone_match = page.search(PHONE_PATTERN)
+        if phone_match:
+            contact["phone"] = phone_match.group()
         
         # Look for email addresses
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_matches = re.findall(email_pattern, soup.get_text())
-        if email_matches:
-            contact["email"] = email_matches[0]
+        email_match = page.search(EMAIL_PATTERN)
+        if email_match:
+            contact["email"] = email_match.group()
         
         # Look for office location
-        office_selectors = [
-            ".office",
-            ".location",
-            "*:contains('Room')",
-            "*:contains('Office')",
-        ]
-        
-        for selector in office_selectors:
-            office_elem = soup.select_one(selector)
+        for selector in OFFICE_SELECTORS:
+            office_elem = page.select_one(selector)
             if office_elem:
-                office_text = self.extract_text(office_elem)
+                office_text = page.text(office_elem)
                 if "room" in office_text.lower() or "office" in office_text.lower():
                     contact["office_location"] = office_text
                     break
         
         return contact
     
-    def find_hearings_url(self, soup: BeautifulSoup) -> Optional[str]:
+    def find_hearings_url(self, page: PageIndex) -> Optional[str]:
         """
         Find URL for committee hearings page.
         
         Args:
-            soup: BeautifulSoup object
+            page: Index of the committee page
             
         Returns:
             Hearings URL or None
         """
-        hearing_selectors = [
-            "a[href*='hearing']",
-            "a[href*='schedule']",
-            "a[href*='calendar']",
-        ]
-        
-        for selector in hearing_selectors:
-            hearing_link = soup.select_one(selector)
-            if hearing_link:
-                return self.make_absolute_url(hearing_link.get("href"))
+        hearing_link = page.first(HEARINGS_LINK_SELECTORS)
+        if hearing_link:
+            return self.make_absolute_url(hearing_link.get("href"))
         
         return None
     
-    async def scrape_hearings(self, committee_url: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def scrape_hearings(self, committee_url: Optional[str] = None, changed_only: bool = False,
+                              force_refresh: bool = False,
+                              pending: Optional[List[FetchedPage]] = None) -> List[Dict[str, Any]]:
         """
         Scrape hearing information from House calendar or committee page.
         
         Args:
             committee_url: Specific committee URL to scrape hearings from
+            changed_only: Return nothing if the page is unchanged since it was last scraped
+            force_refresh: Parse the page even if unchanged
+            pending: Collects the page if it changed, for the caller to save
+                once the hearings are stored (default: saved right away)
             
         Returns:
             List of hearing information dictionaries
         """
-        hearings = []
-        
         # If no specific committee URL provided, scrape general calendar
         if not committee_url:
             committee_url = self.hearing_calendar_url
         
         try:
-            soup = await self.fetch_page(committee_url)
-            
-            # Look for hearing entries
-            hearing_selectors = [
-                ".hearing",
-                ".event",
-                ".committee-hearing",
-                "*[class*='hearing']",
-            ]
-            
-            for selector in hearing_selectors:
-                hearing_elements = soup.select(selector)
-                
-                for element in hearing_elements:
-                    hearing_info = self.extract_hearing_info(element)
-                    if hearing_info:
-                        # Find video URLs
-                        video_urls = self.find_video_urls(element)
-                        if video_urls:
-                            hearing_info["video_urls"] = video_urls
-                        
-                        hearings.append(hearing_info)
+            page = await self.fetch_changes(committee_url, "parse_hearings", force_refresh=force_refresh)
+            hearings = page.result
+            self.keep_page(page, pending)
+            if changed_only and not page.changed:
+                logger.info("House hearings page unchanged", url=committee_url)
+                return []
             
             logger.info(f"Scraped {len(hearings)} House hearings")
             return hearings
@@ -315,12 +326,42 @@ class HouseScraper(BaseScraper):
             logger.error("Error scraping House hearings", error=str(e))
             return []
     
-    def extract_hearing_info(self, element) -> Dict[str, Any]:
+    def parse_hearings(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """
+        Extract hearings from a House calendar or committee page.
+        
+        Args:
+            soup: BeautifulSoup object
+            
+        Returns:
+            List of hearing information dictionaries
+        """
+        hearings = []
+        page = PageIndex(soup)
+        
+        # Look for hearing entries
+        for selector in HEARING_SELECTORS:
+            hearing_elements = page.select(selector)
+            
+            for element in hearing_elements:
+                hearing_info = self.extract_hearing_info(page, element)
+                if hearing_info:
+                    # Find video URLs
+                    video_urls = self.find_video_urls(page, element)
+                    if video_urls:
+                        hearing_info["video_urls"] = video_urls
+                    
+                    hearings.append(hearing_info)
+        
+        return hearings
+    
+    def extract_hearing_info(self, page: PageIndex, element: Tag) -> Dict[str, Any]:
         """
         Extract hearing information from a hearing element.
         
         Args:
-            element: BeautifulSoup element containing hearing information
+            page: Index of the page the element is on
+            element: Element containing hearing information
             
         Returns:
             Hearing information dictionary
@@ -328,63 +369,33 @@ class HouseScraper(BaseScraper):
         info = {}
         
         # Extract title
-        title_selectors = [
-            ".title",
-            ".hearing-title",
-            "h1", "h2", "h3",
-        ]
-        
-        for selector in title_selectors:
-            title_elem = element.select_one(selector)
-            if title_elem:
-                info["title"] = self.extract_text(title_elem)
-                break
+        title_elem = page.first(HEARING_TITLE_SELECTORS, element)
+        if title_elem:
+            info["title"] = page.text(title_elem)
         
         # Extract date and time
-        date_selectors = [
-            ".date",
-            ".hearing-date",
-            "*[class*='date']",
-        ]
-        
-        for selector in date_selectors:
-            date_elem = element.select_one(selector)
-            if date_elem:
-                date_text = self.extract_text(date_elem)
-                info["date_text"] = date_text
-                # Try to parse date
-                try:
-                    parsed_date = self.parse_date(date_text)
-                    if parsed_date:
-                        info["scheduled_date"] = parsed_date.isoformat()
-                except:
-                    pass
-                break
+        date_elem = page.first(HEARING_DATE_SELECTORS, element)
+        if date_elem:
+            date_text = page.text(date_elem)
+            info["date_text"] = date_text
+            # Try to parse date
+            try:
+                parsed_date = self.parse_date(date_text)
+                if parsed_date:
+                    info["scheduled_date"] = parsed_date.isoformat()
+            except:
+                pass
         
         # Extract location
-        location_selectors = [
-            ".location",
-            ".hearing-location",
-            ".room",
-        ]
-        
-        for selector in location_selectors:
-            location_elem = element.select_one(selector)
-            if location_elem:
-                info["location"] = self.extract_text(location_elem)
-                break
+        location_elem = page.first(HEARING_LOCATION_SELECTORS, element)
+        if location_elem:
+            info["location"] = page.text(location_elem)
         
         # Extract description
-        description_selectors = [
-            ".description",
-            ".hearing-description",
-            "p",
-        ]
-        
-        for selector in description_selectors:
-            desc_elem = element.select_one(selector)
+        for selector in HEARING_DESCRIPTION_SELECTORS:
+            desc_elem = page.select_one(selector, element)
             if desc_elem:
-                desc_text = self.extract_text(desc_elem)
+                desc_text = page.text(desc_elem)
                 if len(desc_text) > 20:  # Only use substantial descriptions
                     info["description"] = desc_text
                     break
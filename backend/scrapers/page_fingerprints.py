@@ -0,0 +1,212 @@
+"""
+Change detection for scraped pages.
+
+Every fetched page is recorded with a SHA-256 hash of its body and the
+ETag and Last-Modified validators the server sent, together with the
+result of each extraction method run on it. The next fetch of the page
+is a conditional GET; when the server answers 304 Not Modified, or sends
+a body with the same hash, the stored result is reused and the page is
+neither parsed nor written to the database again.
+
+A changed page is only saved once whatever was built from it is safely
+stored: a job collects the FetchedPage entries of the pages it parsed and
+saves them after its database transaction commits, or drops them if it
+fails, so the next run parses those pages again.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+import structlog
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class PageFingerprint:
+    """Last seen version of a page and one extraction result for it."""
+    url: str
+    content_hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    result: Any = None
+    has_result: bool = False
+
+
+@dataclass
+class FetchedPage:
+    """A page as just fetched, with the result of the method run on it."""
+    url: str
+    method: str
+    args: Tuple[Any, ...]
+    content_hash: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    result: Any
+    changed: bool
+
+
+def content_hash(content: bytes) -> str:
+    """Return the SHA-256 hex digest of a page body."""
+    return hashlib.sha256(content).hexdigest()
+
+
+class PageFingerprintStore:
+    """
+    Page hashes, validators and extraction results stored in SQLite.
+    
+    Counts, per process, how many fetches were answered from the store
+    (by a 304 or by an unchanged hash) and how many had to be parsed.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS scraped_pages (
+                url TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS scraped_page_results (
+                url TEXT NOT NULL,
+                method TEXT NOT NULL,
+                args TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                result TEXT NOT NULL,
+                PRIMARY KEY (url, method, args)
+            )
+        """)
+        self._counters = {"not_modified": 0, "unchanged": 0, "changed": 0}
+    
+    def load(self, url: str, method: str, args: Sequence[Any] = ()) -> Optional[PageFingerprint]:
+        """
+        Get the last seen version of a page and the method's result for it.
+        
+        Args:
+            url: Page URL
+            method: Extraction method name
+            args: Extra arguments the method was called with
+        
+        Returns:
+            Fingerprint (has_result is False if the method has not run on
+            that version), or None if the page has not been fetched
+        """
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT p.content_hash, p.etag, p.last_modified, r.result
+                FROM scraped_pages p
+                LEFT JOIN scraped_page_results r
+                    ON r.url = p.url AND r.method = ? AND r.args = ? AND r.content_hash = p.content_hash
+                WHERE p.url = ?
+                """,
+                (method, json.dumps(list(args)), url),
+            ).fetchone()
+        
+        if row is None:
+            return None
+        
+        page_hash, etag, last_modified, result = row
+        return PageFingerprint(
+            url=url,
+            content_hash=page_hash,
+            etag=etag,
+            last_modified=last_modified,
+            result=json.loads(result) if result is not None else None,
+            has_result=result is not None,
+        )
+    
+    def save(self, pages: Iterable[FetchedPage]) -> None:
+        """
+        Record fetched pages and the results of the methods run on them.
+        
+        Call this once the data built from the pages has been stored; a
+        saved page is skipped as unchanged from then on.
+        
+        Args:
+            pages: Pages from BaseScraper.fetch_changes (results must be JSON-serializable)
+        """
+        pages = list(pages)
+        if not pages:
+            return
+        
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    """
+                    INSERT INTO scraped_pages (url, content_hash, etag, last_modified, fetched_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (url) DO UPDATE
+                    SET content_hash = excluded.content_hash, etag = excluded.etag,
+                        last_modified = excluded.last_modified, fetched_at = excluded.fetched_at
+                    """,
+                    [(page.url, page.content_hash, page.etag, page.last_modified, now) for page in pages],
+                )
+                self._conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO scraped_page_results (url, method, args, content_hash, result)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (page.url, page.method, json.dumps(list(page.args)), page.content_hash,
+                         json.dumps(page.result))
+                        for page in pages
+                    ],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+    
+    def record(self, outcome: str) -> None:
+        """
+        Count the outcome of one fetch.
+        
+        Args:
+            outcome: not_modified (304), unchanged (same hash) or changed (parsed)
+        """
+        with self._lock:
+            self._counters[outcome] += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the fetch counters and the number of pages tracked.
+        
+        Returns:
+            Hits (not_modified plus unchanged), misses, hit rate and page count
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            pages = self._conn.execute("SELECT COUNT(*) FROM scraped_pages").fetchone()[0]
+        
+        hits = counters["not_modified"] + counters["unchanged"]
+        misses = counters["changed"]
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            **counters,
+            "pages": pages,
+        }
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,104 @@
+"""
+Process pool for parsing scraped pages off the event loop.
+
+BeautifulSoup parsing and the selector scans in the extraction methods are
+CPU-bound; run on the event loop they stall every API request the same
+process is serving while a scrape runs. Pages are instead parsed in
+worker processes, which rebuild the scraper and return only the plain
+result dicts and lists.
+"""
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Type
+from .parsers import parse_page
+
+# Scraper instances reused by each worker process, by class
+_worker_scrapers: Dict[type, Any] = {}
+
+# Pool shared by every scraper in the process
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def parse_with(scraper_cls: Type, method: str, html: bytes, parser: str, *args: Any) -> Any:
+    """
+    Parse a page and run one of a scraper's extraction methods on it.
+    
+    Runs inside a worker process (or inline when the pool is disabled).
+    Only the containers the scraper lists for the method in parse_only
+    are parsed.
+    
+    Args:
+        scraper_cls: Scraper class, constructible without arguments
+        method: Name of a method taking the parsed page, e.g. "parse_hearings"
+        html: Raw page content
+        parser: HTML parser backend, one of parsers.PARSERS
+        *args: Extra arguments for the method
+    
+    Returns:
+        Whatever the method returns (plain data)
+    """
+    scraper = _worker_scrapers.get(scraper_cls)
+    if scraper is None:
+        scraper = _worker_scrapers[scraper_cls] = scraper_cls()
+    page = parse_page(html, parser, scraper.parse_only.get(method))
+    return getattr(scraper, method)(page, *args)
+
+
+def get_parse_pool(workers: int) -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared parse pool, creating it on first use.
+    
+    Args:
+        workers: Worker processes; 0 disables the pool
+    
+    Returns:
+        Process pool, or None when parsing runs inline
+    """
+    global _pool
+    
+    if workers <= 0:
+        return None
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=workers)
+    return _pool
+
+
+async def run_parser(workers: int, scraper_cls: Type, method: str, html: bytes, parser: str,
+                     *args: Any) -> Any:
+    """
+    Run parse_with in the parse pool without blocking the event loop.
+    
+    Args:
+        workers: Worker processes; 0 parses inline on the event loop
+        scraper_cls: Scraper class, constructible without arguments
+        method: Name of the extraction method
+        html: Raw page content
+        parser: HTML parser backend
+        *args: Extra arguments for the method
+    
+    Returns:
+        Result of the extraction method
+    """
+    pool = get_parse_pool(workers)
+    if pool is None:
+        return parse_with(scraper_cls, method, html, parser, *args)
+    
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, parse_with, scraper_cls, method, html, parser, *args)
+    except BrokenProcessPool:
+        # A worker died; start a fresh pool for the next page
+        shutdown_parse_pool()
+        raise
+
+
+def shutdown_parse_pool() -> None:
+    """
+    Stop the parse pool's worker processes.
+    """
+    global _pool
+    
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+    _pool = None
@@ -0,0 +1,223 @@
+"""
+HTML parser backends for scraped pages.
+
+The parser is chosen with the scraping_parser setting:
+
+- html.parser: Python's built-in parser; always available, slowest. The
+  default, since the other backends can build a different tree from
+  malformed markup.
+- lxml: libxml2 through BeautifulSoup; several times faster
+- selectolax: the lexbor HTML5 engine; fastest. Pages come back as a
+  SelectolaxPage that PageIndex walks directly, without building a
+  BeautifulSoup tree.
+
+A backend that is not installed falls back to html.parser with a warning.
+selectolax is an optional dependency (requirements-optional.txt).
+
+Extraction methods can also declare the containers they read, for
+example the hearing entries of a calendar page. Only those elements and
+what is inside them are built, the same way a BeautifulSoup
+SoupStrainer works, which skips the navigation, scripts and footers that
+make up most of a page.
+"""
+from typing import Any, Iterator, List, Optional, Sequence, Set, Tuple
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+import structlog
+from .extraction import END, START, STRING, Selector
+
+logger = structlog.get_logger()
+
+PARSERS = ("html.parser", "lxml", "selectolax")
+
+# Elements whose strings BeautifulSoup gives their own string type (left out of get_text)
+_STRING_CONTAINERS = frozenset({"script", "style", "template", "rt", "rp"})
+
+# Elements inside which BeautifulSoup keeps whitespace-only strings as they are
+_PRESERVE_WHITESPACE = frozenset({"pre", "textarea"})
+
+# Characters BeautifulSoup treats as whitespace when collapsing strings
+_ASCII_SPACES = str.maketrans("", "", "\x20\x0a\x09\x0c\x0d")
+
+# Backends already reported as missing
+_missing_reported: Set[str] = set()
+
+
+def _report_missing(parser: str) -> None:
+    """Warn once per process that a parser backend is unavailable."""
+    if parser not in _missing_reported:
+        _missing_reported.add(parser)
+        logger.warning("HTML parser not installed, using html.parser", parser=parser)
+
+
+def _selectolax_parser() -> Optional[type]:
+    """Import the selectolax parser class, or return None if it is not installed."""
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        return None
+    return LexborHTMLParser
+
+
+def available_parsers() -> List[str]:
+    """
+    List the parser backends installed in this environment.
+    
+    Returns:
+        Parser names, in PARSERS order
+    """
+    available = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+        available.append("lxml")
+    except ImportError:
+        pass
+    if _selectolax_parser() is not None:
+        available.append("selectolax")
+    return available
+
+
+def strainer_for(selectors: Sequence[Selector]) -> SoupStrainer:
+    """
+    Build a SoupStrainer keeping the elements that match any selector.
+    
+    Args:
+        selectors: Container selectors (no :contains)
+    
+    Returns:
+        Strainer for BeautifulSoup's parse_only
+    """
+    def keep(name: str, attrs: Any) -> bool:
+        return any(selector.matches_tag(name, attrs) for selector in selectors)
+    
+    return SoupStrainer(keep)
+
+
+class SelectolaxElement:
+    """
+    Read-only Tag-like view of a selectolax element node.
+    """
+    
+    __slots__ = ("node", "name", "attrs")
+    
+    def __init__(self, node: Any):
+        self.node = node
+        self.name = node.tag
+        # Valueless attributes come back as None; BeautifulSoup gives ""
+        self.attrs = {key: "" if value is None else value for key, value in node.attributes.items()}
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get an attribute value, like Tag.get."""
+        return self.attrs.get(key, default)
+    
+    def get_attribute_list(self, key: str) -> list:
+        """Get an attribute as a list, splitting class into its names."""
+        value = self.attrs.get(key)
+        if value is None:
+            return []
+        return value.split() if key == "class" else [value]
+    
+    def get_text(self) -> str:
+        """Get the element's text, like Tag.get_text."""
+        return self.node.text(deep=True)
+    
+    def __repr__(self) -> str:
+        return f"<{self.name}>"
+
+
+class SelectolaxPage:
+    """
+    A page parsed by selectolax, indexable by PageIndex.
+    """
+    
+    def __init__(self, tree: Any, only: Optional[Sequence[Selector]] = None):
+        """
+        Args:
+            tree: Parsed selectolax tree
+            only: Container selectors; elements outside them are not indexed
+        """
+        self.tree = tree
+        self.only = only
+    
+    def events(self) -> Iterator[Tuple[int, Any, bool, bool]]:
+        """
+        Walk the tree in document order.
+        
+        Yields:
+            The walk events described in extraction.soup_events
+        """
+        keep_all = self.only is None
+        # Open elements: (node, yielded, string container, preserves whitespace); counts of each kind
+        stack = []
+        kept = containers = preserving = 0
+        node = self.tree.root
+        
+        while node is not None or stack:
+            if node is None:
+                node, yielded, container, preserve = stack.pop()
+                if yielded:
+                    kept -= 1
+                    yield END, None, False, False
+                containers -= container
+                preserving -= preserve
+                node = node.next
+                continue
+            
+            tag = node.tag
+            if tag == "-text":
+                if keep_all or kept:
+                    text = node.text(deep=False)
+                    if not preserving and not text.translate(_ASCII_SPACES):
+                        # Collapse whitespace-only strings the way BeautifulSoup does
+                        text = "\n" if "\n" in text else " "
+                    yield STRING, text, containers == 0, True
+            elif tag and tag[0].isalpha():
+                element = SelectolaxElement(node)
+                yielded = keep_all or kept > 0 or any(
+                    selector.matches_tag(element.name, element.attrs) for selector in self.only
+                )
+                if yielded:
+                    kept += 1
+                    yield START, element, element.name in _STRING_CONTAINERS, False
+                container = element.name in _STRING_CONTAINERS
+                preserve = element.name in _PRESERVE_WHITESPACE
+                containers += container
+                preserving += preserve
+                stack.append((node, yielded, container, preserve))
+                node = node.child
+                continue
+            
+            # Text is done and comments and doctypes are skipped; move on to the next sibling
+            node = node.next
+
+
+def parse_page(html: bytes, parser: str = "html.parser", only: Optional[Sequence[Selector]] = None) -> Any:
+    """
+    Parse a page with the configured backend.
+    
+    Args:
+        html: Raw page content
+        parser: One of PARSERS
+        only: Container selectors to keep; everything else is skipped
+    
+    Returns:
+        BeautifulSoup object, or SelectolaxPage for the selectolax backend
+    
+    Raises:
+        ValueError: If the parser is unknown
+    """
+    if parser not in PARSERS:
+        raise ValueError(f"Unknown HTML parser: {parser}")
+    
+    if parser == "selectolax":
+        parser_cls = _selectolax_parser()
+        if parser_cls is not None:
+            return SelectolaxPage(parser_cls(html), only)
+        _report_missing(parser)
+        parser = "html.parser"
+    
+    parse_only = strainer_for(only) if only else None
+    try:
+        return BeautifulSoup(html, parser, parse_only=parse_only)
+    except FeatureNotFound:
+        _report_missing(parser)
+        return BeautifulSoup(html, "html.parser", parse_only=parse_only)
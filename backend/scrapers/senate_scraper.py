@@ -2,69 +2,112 @@
 Web scraper for Senate.gov websites.
 """
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+import httpx
 import structlog
-import sys
-import os
-sys.path.append(os.path.dirname(__file__))
-from base_scraper import BaseScraper
+from .base_scraper import BaseScraper, HostThrottle
+from .extraction import EMAIL_PATTERN, PHONE_PATTERN, PageIndex, Selector, compile_selectors
+from .page_fingerprints import FetchedPage, PageFingerprintStore
 
 logger = structlog.get_logger()
 
+# Selectors and patterns are compiled once; each list is tried in order against a page's index
+COMMITTEE_LINK_SELECTOR = Selector("a[href*='committee']")
+SUBCOMMITTEE_SELECTORS = compile_selectors("a[href*='subcommittee']", "*:contains('Subcommittee')")
+DESCRIPTION_SELECTORS = compile_selectors(".committee-description", ".about", ".description", "p")
+HEARINGS_LINK_SELECTORS = compile_selectors(
+    "a[href*='hearing']", "a[href*='schedule']", "a[href*='calendar']", "a[href*='meeting']"
+)
+TABLE_SELECTOR, ROW_SELECTOR, CELL_SELECTOR = compile_selectors("table", "tr", "td")
+HEARING_SELECTORS = compile_selectors(".hearing", ".event", ".committee-hearing", "*[class*='hearing']")
+HEARING_TITLE_SELECTORS = compile_selectors(".title", ".hearing-title", "h1", "h2", "h3", "h4")
+HEARING_DATE_SELECTORS = compile_selectors(".date", ".hearing-date", "*[class*='date']")
+HEARING_LOCATION_SELECTORS = compile_selectors(".location", ".hearing-location", ".room")
+HEARING_DESCRIPTION_SELECTORS = compile_selectors(".description", ".hearing-description", "p")
+
+JURISDICTION_PATTERN = re.compile(r'jurisdiction[:\s]*(.*?)(?:\n|\.|\|)', re.IGNORECASE | re.DOTALL)
+CHAIR_PATTERNS = [
+    re.compile(r'(?:chair|chairman|chairwoman)[:\s]*(.*?)(?:\n|,|\|)', re.IGNORECASE),
+    re.compile(r'(.*?)\s+\(chair\)', re.IGNORECASE),
+]
+RANKING_PATTERNS = [
+    re.compile(r'ranking member[:\s]*(.*?)(?:\n|,|\|)', re.IGNORECASE),
+    re.compile(r'(.*?)\s+\(ranking member\)', re.IGNORECASE),
+]
+OFFICE_PATTERNS = [
+    re.compile(r'(?:room|office|suite)\s+([A-Z]?\d+[A-Z]?)', re.IGNORECASE),
+    re.compile(r'(\d+\s+[A-Z][a-z]+\s+building)', re.IGNORECASE),
+]
+
 
 class SenateScraper(BaseScraper):
     """
     Scraper for Senate.gov websites.
     """
     
-    def __init__(self):
-        super().__init__("https://www.senate.gov", "SenateScraper")
+    # List and calendar pages are parsed only inside the elements read from them
+    parse_only = {
+        "parse_committee_list": (COMMITTEE_LINK_SELECTOR,),
+        "parse_hearings": (TABLE_SELECTOR,) + HEARING_SELECTORS,
+    }
+    
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None,
+                 throttle: Optional[HostThrottle] = None,
+                 fingerprints: Optional[PageFingerprintStore] = None):
+        super().__init__("https://www.senate.gov", "SenateScraper", http_client=http_client, throttle=throttle,
+                         fingerprints=fingerprints)
         
         # Common Senate.gov URL patterns
         self.committee_list_url = "https://www.senate.gov/committees/committees_home.htm"
         self.hearing_calendar_url = "https://www.senate.gov/committees/hearings_meetings.htm"
     
-    async def scrape_committees(self) -> List[Dict[str, Any]]:
+    async def scrape_committees(self, changed_only: bool = False, force_refresh: bool = False,
+                                pending: Optional[List[FetchedPage]] = None) -> List[Dict[str, Any]]:
         """
         Scrape Senate committees from the committees page.
         
+        Args:
+            changed_only: Leave out committees whose list entry and page are
+                unchanged since they were last scraped
+            force_refresh: Parse every page even if unchanged
+            pending: Collects the changed pages for the caller to save once
+                the committees are stored (default: saved right away)
+            
         Returns:
             List of committee information dictionaries
         """
         try:
-            soup = await self.fetch_page(self.committee_list_url)
-            committees = []
+            committee_list = await self.fetch_changes(
+                self.committee_list_url, "parse_committee_list", force_refresh=force_refresh
+            )
             
-            # Find committee links - Senate uses different structure
-            committee_links = soup.select("a[href*='committee']")
+            async def add_details(committee_info: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+                # Try to get detailed information; the list entry itself is
+                # left untouched since it is saved as the list page's result
+                try:
+                    details = await self.fetch_changes(
+                        committee_info["url"], "parse_committee_details", force_refresh=force_refresh
+                    )
+                    self.keep_page(details, pending)
+                    return {**committee_info, **details.result}, details.changed
+                except Exception as e:
+                    logger.warning(
+                        "Could not scrape Senate committee details",
+                        committee=committee_info["name"],
+                        url=committee_info["url"],
+                        error=str(e)
+                    )
+                    return dict(committee_info), False
             
-            for link in committee_links:
-                committee_url = self.make_absolute_url(link.get("href"))
-                committee_name = self.extract_text(link)
-                
-                if committee_name and committee_url and len(committee_name) > 3:
-                    committee_info = {
-                        "name": committee_name,
-                        "url": committee_url,
-                        "chamber": "Senate",
-                        "source": "senate.gov",
-                    }
-                    
-                    # Try to get detailed information
-                    try:
-                        committee_details = await self.scrape_committee_details(committee_url)
-                        committee_info.update(committee_details)
-                    except Exception as e:
-                        logger.warning(
-                            "Could not scrape Senate committee details",
-                            committee=committee_name,
-                            url=committee_url,
-                            error=str(e)
-                        )
-                    
-                    committees.append(committee_info)
+            # Committee pages are fetched concurrently, politely per host
+            detailed = await self.crawl(committee_list.result, add_details)
+            
+            self.keep_page(committee_list, pending)
+            committees = [committee for committee, _ in detailed]
+            if changed_only and not committee_list.changed:
+                committees = [committee for committee, changed in detailed if changed]
             
             logger.info(f"Scraped {len(committees)} Senate committees")
             return committees
@@ -73,6 +116,36 @@ class SenateScraper(BaseScraper):
             logger.error("Error scraping Senate committees", error=str(e))
             return []
     
+    def parse_committee_list(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """
+        Extract committee names and links from the committees page.
+        
+        Args:
+            soup: BeautifulSoup object
+            
+        Returns:
+            List of committee dictionaries without details
+        """
+        committees = []
+        page = PageIndex(soup)
+        
+        # Find committee links - Senate uses different structure
+        committee_links = page.select(COMMITTEE_LINK_SELECTOR)
+        
+        for link in committee_links:
+            committee_url = self.make_absolute_url(link.get("href"))
+            committee_name = page.text(link)
+            
+            if committee_name and committee_url and len(committee_name) > 3:
+                committees.append({
+                    "name": committee_name,
+                    "url": committee_url,
+                    "chamber": "Senate",
+                    "source": "senate.gov",
+                })
+        
+        return committees
+    
     async def scrape_committee_details(self, committee_url: str) -> Dict[str, Any]:
         """
         Scrape detailed information for a specific Senate committee.
@@ -83,28 +156,36 @@ class SenateScraper(BaseScraper):
         Returns:
             Committee details dictionary
         """
-        soup = await self.fetch_page(committee_url)
+        return await self.fetch_and_parse(committee_url, "parse_committee_details")
+    
+    def parse_committee_details(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        Extract Senate committee details from a committee page.
+        
+        Args:
+            soup: BeautifulSoup object
+            
+        Returns:
+            Committee details dictionary
+        """
         details = {}
+        page = PageIndex(soup)
         
         # Extract committee information
-        details.update(self.extract_committee_info(soup))
+        details.update(self.extract_committee_info(page))
         
         # Look for subcommittees
         subcommittees = []
-        subcommittee_selectors = [
-            "a[href*='subcommittee']",
-            "*:contains('Subcommittee')",
-        ]
         
-        for selector in subcommittee_selectors:
-            subcommittee_elements = soup.select(selector)
+        for selector in SUBCOMMITTEE_SELECTORS:
+            subcommittee_elements = page.select(selector)
             
             for elem in subcommittee_elements:
                 if elem.name == "a":
                     subcommittee_url = self.make_absolute_url(elem.get("href"))
-                    subcommittee_name = self.extract_text(elem)
+                    subcommittee_name = page.text(elem)
                 else:
-                    subcommittee_name = self.extract_text(elem)
+                    subcommittee_name = page.text(elem)
                     subcommittee_url = None
                 
                 if subcommittee_name and "subcommittee" in subcommittee_name.lower():
@@ -117,19 +198,19 @@ class SenateScraper(BaseScraper):
         details["subcommittees"] = subcommittees
         
         # Extract contact information
-        details.update(self.extract_contact_info(soup))
+        details.update(self.extract_contact_info(page))
         
         # Look for hearing information
-        details["hearings_url"] = self.find_hearings_url(soup)
+        details["hearings_url"] = self.find_hearings_url(page)
         
         return details
     
-    def extract_committee_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def extract_committee_info(self, page: PageIndex) -> Dict[str, Any]:
         """
         Extract committee information from committee page.
         
         Args:
-            soup: BeautifulSoup object
+            page: Index of the committee page
             
         Returns:
             Committee information dictionary
@@ -137,46 +218,34 @@ class SenateScraper(BaseScraper):
         info = {}
         
         # Try to find committee description
-        description_selectors = [
-            ".committee-description",
-            ".about",
-            ".description",
-            "p",
-        ]
-        
-        for selector in description_selectors:
-            description_elem = soup.select_one(selector)
+        for selector in DESCRIPTION_SELECTORS:
+            description_elem = page.select_one(selector)
             if description_elem:
-                desc_text = self.extract_text(description_elem)
+                desc_text = page.text(description_elem)
                 if len(desc_text) > 50:  # Only use substantial descriptions
                     info["description"] = desc_text
                     break
         
         # Try to find jurisdiction information
-        jurisdiction_text = soup.get_text()
-        if "jurisdiction" in jurisdiction_text.lower():
+        if "jurisdiction" in page.text().lower():
             # Extract text around "jurisdiction"
-            jurisdiction_match = re.search(
-                r'jurisdiction[:\s]*(.*?)(?:\n|\.|\|)', 
-                jurisdiction_text, 
-                re.IGNORECASE | re.DOTALL
-            )
+            jurisdiction_match = page.search(JURISDICTION_PATTERN)
             if jurisdiction_match:
                 info["jurisdiction"] = jurisdiction_match.group(1).strip()
         
         # Try to find leadership information
-        leadership = self.extract_leadership(soup)
+        leadership = self.extract_leadership(page)
         if leadership:
             info.update(leadership)
         
         return info
     
-    def extract_leadership(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def extract_leadership(self, page: PageIndex) -> Dict[str, Any]:
         """
         Extract Senate committee leadership information.
         
         Args:
-            soup: BeautifulSoup object
+            page: Index of the committee page
             
         Returns:
             Leadership information dictionary
@@ -184,38 +253,27 @@ class SenateScraper(BaseScraper):
         leadership = {}
         
         # Look for chair information
-        chair_patterns = [
-            r'(?:chair|chairman|chairwoman)[:\s]*(.*?)(?:\n|,|\|)',
-            r'(.*?)\s+\(chair\)',
-        ]
-        
-        page_text = soup.get_text()
-        for pattern in chair_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+        for pattern in CHAIR_PATTERNS:
+            match = page.search(pattern)
             if match:
                 leadership["chair_info"] = match.group(1).strip()
                 break
         
         # Look for ranking member information
-        ranking_patterns = [
-            r'ranking member[:\s]*(.*?)(?:\n|,|\|)',
-            r'(.*?)\s+\(ranking member\)',
-        ]
-        
-        for pattern in ranking_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+        for pattern in RANKING_PATTERNS:
+            match = page.search(pattern)
             if match:
                 leadership["ranking_member_info"] = match.group(1).strip()
                 break
         
         return leadership
     
-    def extract_contact_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def extract_contact_info(self, page: PageIndex) -> Dict[str, Any]:
         """
         Extract contact information from page.
         
         Args:
-            soup: BeautifulSoup object
+            page: Index of the page
             
         Returns:
             Contact information dictionary
@@ -223,126 +281,128 @@ class SenateScraper(BaseScraper):
         contact = {}
         
         # Look for phone numbers
-        phone_pattern = r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phone_matches = re.findall(phone_pattern, soup.get_text())
-        if phone_matches:
-            contact["phone"] = phone_matches[0]
+        phone_match = page.search(PHONE_PATTERN)
+        if phone_match:
+            contact["phone"] = phone_match.group()
         
         # Look for email addresses
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_matches = re.findall(email_pattern, soup.get_text())
-        if email_matches:
-            contact["email"] = email_matches[0]
+        email_match = page.search(EMAIL_PATTERN)
+        if email_match:
+            contact["email"] = email_match.group()
         
         # Look for office location
-        office_patterns = [
-            r'(?:room|office|suite)\s+([A-Z]?\d+[A-Z]?)',
-            r'(\d+\s+[A-Z][a-z]+\s+building)',
-        ]
-        
-        page_text = soup.get_text()
-        for pattern in office_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+        for pattern in OFFICE_PATTERNS:
+            match = page.search(pattern)
             if match:
                 contact["office_location"] = match.group(1).strip()
                 break
         
         return contact
     
-    def find_hearings_url(self, soup: BeautifulSoup) -> Optional[str]:
+    def find_hearings_url(self, page: PageIndex) -> Optional[str]:
         """
         Find URL for committee hearings page.
         
         Args:
-            soup: BeautifulSoup object
+            page: Index of the committee page
             
         Returns:
             Hearings URL or None
         """
-        hearing_selectors = [
-            "a[href*='hearing']",
-            "a[href*='schedule']",
-            "a[href*='calendar']",
-            "a[href*='meeting']",
-        ]
-        
-        for selector in hearing_selectors:
-            hearing_link = soup.select_one(selector)
-            if hearing_link:
-                return self.make_absolute_url(hearing_link.get("href"))
+        hearing_link = page.first(HEARINGS_LINK_SELECTORS)
+        if hearing_link:
+            return self.make_absolute_url(hearing_link.get("href"))
         
         return None
     
-    async def scrape_hearings(self, committee_url: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def scrape_hearings(self, committee_url: Optional[str] = None, changed_only: bool = False,
+                              force_refresh: bool = False,
+                              pending: Optional[List[FetchedPage]] = None) -> List[Dict[str, Any]]:
         """
         Scrape hearing information from Senate calendar or committee page.
         
         Args:
             committee_url: Specific committee URL to scrape hearings from
+            changed_only: Return nothing if the page is unchanged since it was last scraped
+            force_refresh: Parse the page even if unchanged
+            pending: Collects the page if it changed, for the caller to save
+                once the hearings are stored (default: saved right away)
             
         Returns:
             List of hearing information dictionaries
         """
-        hearings = []
-        
         # If no specific committee URL provided, scrape general calendar
         if not committee_url:
             committee_url = self.hearing_calendar_url
         
         try:
-            soup = await self.fetch_page(committee_url)
+            page = await self.fetch_changes(committee_url, "parse_hearings", force_refresh=force_refresh)
+            hearings = page.result
+            self.keep_page(page, pending)
+            if changed_only and not page.changed:
+                logger.info("Senate hearings page unchanged", url=committee_url)
+                return []
             
-            # Senate uses table structure for hearings
-            hearing_tables = soup.select("table")
+            logger.info(f"Scraped {len(hearings)} Senate hearings")
+            return hearings
             
-            for table in hearing_tables:
-                rows = table.select("tr")
-                
-                for row in rows:
-                    cells = row.select("td")
-                    if len(cells) >= 2:  # At least date and description
-                        hearing_info = self.extract_hearing_from_row(cells)
-                        if hearing_info:
-                            # Find video URLs
-                            video_urls = self.find_video_urls(row)
-                            if video_urls:
-                                hearing_info["video_urls"] = video_urls
-                            
-                            hearings.append(hearing_info)
+        except Exception as e:
+            logger.error("Error scraping Senate hearings", error=str(e))
+            return []
+    
+    def parse_hearings(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """
+        Extract hearings from a Senate calendar or committee page.
+        
+        Args:
+            soup: BeautifulSoup object
             
-            # Also look for individual hearing entries
-            hearing_selectors = [
-                ".hearing",
-                ".event",
-                ".committee-hearing",
-                "*[class*='hearing']",
-            ]
+        Returns:
+            List of hearing information dictionaries
+        """
+        hearings = []
+        page = PageIndex(soup)
+        
+        # Senate uses table structure for hearings
+        hearing_tables = page.select(TABLE_SELECTOR)
+        
+        for table in hearing_tables:
+            rows = page.select(ROW_SELECTOR, table)
             
-            for selector in hearing_selectors:
-                hearing_elements = soup.select(selector)
-                
-                for element in hearing_elements:
-                    hearing_info = self.extract_hearing_info(element)
+            for row in rows:
+                cells = page.select(CELL_SELECTOR, row)
+                if len(cells) >= 2:  # At least date and description
+                    hearing_info = self.extract_hearing_from_row(page, cells)
                     if hearing_info:
                         # Find video URLs
-                        video_urls = self.find_video_urls(element)
+                        video_urls = self.find_video_urls(page, row)
                         if video_urls:
                             hearing_info["video_urls"] = video_urls
                         
                         hearings.append(hearing_info)
+        
+        # Also look for individual hearing entries
+        for selector in HEARING_SELECTORS:
+            hearing_elements = page.select(selector)
             
-            logger.info(f"Scraped {len(hearings)} Senate hearings")
-            return hearings
-            
-        except Exception as e:
-            logger.error("Error scraping Senate hearings", error=str(e))
-            return []
+            for element in hearing_elements:
+                hearing_info = self.extract_hearing_info(page, element)
+                if hearing_info:
+                    # Find video URLs
+                    video_urls = self.find_video_urls(page, element)
+                    if video_urls:
+                        hearing_info["video_urls"] = video_urls
+                    
+                    hearings.append(hearing_info)
+        
+        return hearings
     
-    def extract_hearing_from_row(self, cells: List) -> Dict[str, Any]:
+    def extract_hearing_from_row(self, page: PageIndex, cells: List[Tag]) -> Dict[str, Any]:
         """
         Extract hearing information from table row cells.
         
         Args:
+            page: Index of the page the row is on
             cells: List of table cells
             
         Returns:
@@ -352,7 +412,7 @@ class SenateScraper(BaseScraper):
         
         if len(cells) >= 2:
             # First cell usually contains date
-            date_text = self.extract_text(cells[0])
+            date_text = page.text(cells[0])
             if date_text:
                 info["date_text"] = date_text
                 # Try to parse date
@@ -364,13 +424,13 @@ class SenateScraper(BaseScraper):
                     pass
             
             # Second cell usually contains title/description
-            title_text = self.extract_text(cells[1])
+            title_text = page.text(cells[1])
             if title_text and len(title_text) > 10:
                 info["title"] = title_text
             
             # Third cell might contain location
             if len(cells) >= 3:
-                location_text = self.extract_text(cells[2])
+                location_text = page.text(cells[2])
                 if location_text:
                     info["location"] = location_text
         
@@ -380,12 +440,13 @@ class SenateScraper(BaseScraper):
         
         return info if info.get("title") else {}
     
-    def extract_hearing_info(self, element) -> Dict[str, Any]:
+    def extract_hearing_info(self, page: PageIndex, element: Tag) -> Dict[str, Any]:
         """
         Extract hearing information from a hearing element.
         
         Args:
-            element: BeautifulSoup element containing hearing information
+            page: Index of the page the element is on
+            element: Element containing hearing information
             
         Returns:
             Hearing information dictionary
@@ -393,63 +454,33 @@ class SenateScraper(BaseScraper):
         info = {}
         
         # Extract title
-        title_selectors = [
-            ".title",
-            ".hearing-title",
-            "h1", "h2", "h3", "h4",
-        ]
-        
-        for selector in title_selectors:
-            title_elem = element.select_one(selector)
-            if title_elem:
-                info["title"] = self.extract_text(title_elem)
-                break
+        title_elem = page.first(HEARING_TITLE_SELECTORS, element)
+        if title_elem:
+            info["title"] = page.text(title_elem)
         
         # Extract date and time
-        date_selectors = [
-            ".date",
-            ".hearing-date",
-            "*[class*='date']",
-        ]
-        
-        for selector in date_selectors:
-            date_elem = element.select_one(selector)
-            if date_elem:
-                date_text = self.extract_text(date_elem)
-                info["date_text"] = date_text
-                # Try to parse date
-                try:
-                    parsed_date = self.parse_date(date_text)
-                    if parsed_date:
-                        info["scheduled_date"] = parsed_date.isoformat()
-                except:
-                    pass
-                break
+        date_elem = page.first(HEARING_DATE_SELECTORS, element)
+        if date_elem:
+            date_text = page.text(date_elem)
+            info["date_text"] = date_text
+            # Try to parse date
+            try:
+                parsed_date = self.parse_date(date_text)
+                if parsed_date:
+                    info["scheduled_date"] = parsed_date.isoformat()
+            except:
+                pass
         
         # Extract location
-        location_selectors = [
-            ".location",
-            ".hearing-location",
-            ".room",
-        ]
-        
-        for selector in location_selectors:
-            location_elem = element.select_one(selector)
-            if location_elem:
-                info["location"] = self.extract_text(location_elem)
-                break
+        location_elem = page.first(HEARING_LOCATION_SELECTORS, element)
+        if location_elem:
+            info["location"] = page.text(location_elem)
         
         # Extract description
-        description_selectors = [
-            ".description",
-            ".hearing-description",
-            "p",
-        ]
-        
-        for selector in description_selectors:
-            desc_elem = element.select_one(selector)
+        for selector in HEARING_DESCRIPTION_SELECTORS:
+            desc_elem = page.select_one(selector, element)
             if desc_elem:
-                desc_text = self.extract_text(desc_elem)
+                desc_text = page.text(desc_elem)
                 if len(desc_text) > 20:  # Only use substantial descriptions
                     info["description"] = desc_text
                     break
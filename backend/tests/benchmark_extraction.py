@@ -0,0 +1,145 @@
+"""
+Parse-time benchmark for the scrapers on saved House and Senate pages.
+
+Runs each scraper extraction method on the HTML fixtures in
+tests/fixtures/scraper_pages and prints, per page and parser backend,
+the median time to parse the HTML (keeping only the containers the
+method reads, as the scrapers do) and to run the extraction. Backends
+that are not installed are skipped. With --compare the extraction also
+runs with every selector, text and regex lookup answered by soupsieve
+and get_text() on an html.parser soup, which is how the scrapers worked
+before the index, and all results are checked to be identical:
+
+    python -m tests.benchmark_extraction --repeat 50 --compare
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+from unittest import mock
+
+# Configure an isolated environment BEFORE importing app modules
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("CONGRESS_API_KEY", "benchmark")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("GCP_PROJECT_ID", "benchmark")
+
+from bs4 import BeautifulSoup
+from scrapers import HouseScraper, SenateScraper, base_scraper, house_scraper, senate_scraper
+from scrapers.parsers import PARSERS, available_parsers, parse_page
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "scraper_pages"
+
+# Fixture page and the extraction method that handles it
+PAGES = [
+    ("house_committees.html", HouseScraper, "parse_committee_list"),
+    ("house_committee.html", HouseScraper, "parse_committee_details"),
+    ("house_hearings.html", HouseScraper, "parse_hearings"),
+    ("senate_committees.html", SenateScraper, "parse_committee_list"),
+    ("senate_committee.html", SenateScraper, "parse_committee_details"),
+    ("senate_hearings.html", SenateScraper, "parse_hearings"),
+]
+
+
+class SoupsievePage:
+    """
+    PageIndex stand-in that answers every lookup with a fresh traversal.
+    """
+    
+    def __init__(self, root):
+        self.root = root
+    
+    def select(self, selector, within=None):
+        return (self.root if within is None else within).select(selector.css)
+    
+    def select_one(self, selector, within=None):
+        return (self.root if within is None else within).select_one(selector.css)
+    
+    def first(self, selectors, within=None):
+        for selector in selectors:
+            element = self.select_one(selector, within)
+            if element is not None:
+                return element
+        return None
+    
+    def text(self, element=None, strip=True):
+        text = (self.root if element is None else element).get_text()
+        return text.strip() if strip else text
+    
+    def search(self, pattern, element=None):
+        return pattern.search(self.text(element, strip=False))
+
+
+def median_ms(call, repeat: int) -> float:
+    """Run `call` `repeat` times and return the median duration in milliseconds."""
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        durations.append(time.perf_counter() - started)
+    return round(statistics.median(durations) * 1000, 3)
+
+
+def run_benchmark(repeat: int, compare: bool, parsers: list) -> dict:
+    """
+    Time parsing and extraction for every fixture page.
+    
+    Args:
+        repeat: Runs per measurement (the median is reported)
+        compare: Also time extraction through soupsieve and check all results agree
+        parsers: Parser backends to time
+    
+    Returns:
+        Per-page timings in milliseconds
+    """
+    results = {"repeat": repeat, "pages": {}}
+    
+    for filename, scraper_cls, method in PAGES:
+        html = (FIXTURES_DIR / filename).read_bytes()
+        extract = getattr(scraper_cls(), method)
+        only = scraper_cls.parse_only.get(method)
+        page = {"bytes": len(html), "partial": only is not None, "parsers": {}}
+        expected = extract(BeautifulSoup(html, "html.parser"))
+        
+        for parser in parsers:
+            parsed = parse_page(html, parser, only)
+            if compare and extract(parsed) != expected:
+                raise AssertionError(f"{parser} extraction differs on {filename}")
+            timings = {
+                "parse_ms": median_ms(lambda: parse_page(html, parser, only), repeat),
+                "extract_ms": median_ms(lambda: extract(parsed), repeat),
+            }
+            timings["total_ms"] = round(timings["parse_ms"] + timings["extract_ms"], 3)
+            page["parsers"][parser] = timings
+        
+        if compare:
+            soup = BeautifulSoup(html, "html.parser")
+            with mock.patch.object(base_scraper, "PageIndex", SoupsievePage), \
+                    mock.patch.object(house_scraper, "PageIndex", SoupsievePage), \
+                    mock.patch.object(senate_scraper, "PageIndex", SoupsievePage):
+                if extract(soup) != expected:
+                    raise AssertionError(f"Index and soupsieve extraction differ on {filename}")
+                page["soupsieve_extract_ms"] = median_ms(lambda: extract(soup), repeat)
+            page["index_speedup"] = round(
+                page["soupsieve_extract_ms"] / median_ms(lambda: extract(soup), repeat), 1
+            )
+        
+        results["pages"][filename] = page
+    
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark scraper extraction on saved pages")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per measurement")
+    parser.add_argument("--compare", action="store_true", help="Also time the soupsieve path")
+    parser.add_argument("--parsers", nargs="+", choices=PARSERS, help="Parser backends (default: all installed)")
+    args = parser.parse_args()
+    
+    print(json.dumps(run_benchmark(args.repeat, args.compare, args.parsers or available_parsers()), indent=2))
+
+
+if __name__ == "__main__":
+    main()
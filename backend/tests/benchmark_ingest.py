@@ -0,0 +1,115 @@
+"""
+Reproducible ingest benchmark against the fake Congress.gov server.
+
+Runs the member, committee-assignment and hearing collections plus the
+member ingest through CongressApiClient and DataProcessor, with the fake
+server in-process and a throwaway SQLite database, and prints timings and
+request counts as JSON. No network or API key is needed:
+
+    python -m tests.benchmark_ingest --scale 20 --latency 0.05 --concurrency 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+# Configure an isolated environment BEFORE importing app modules
+_workdir = tempfile.mkdtemp(prefix="ingest-benchmark-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_workdir, 'benchmark.db')}")
+os.environ.setdefault("CONGRESS_API_KEY", "benchmark")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("GCP_PROJECT_ID", "benchmark")
+os.environ["CONGRESS_API_CACHE_MODE"] = "off"
+os.environ["CONGRESS_API_QUOTA_PATH"] = os.path.join(_workdir, "quota.db")
+os.environ["CONGRESS_API_CHECKPOINT_PATH"] = os.path.join(_workdir, "checkpoints.db")
+
+import httpx
+from app.core.database import Base, engine
+from app.services.congress_api import CongressApiClient
+from app.services.data_processor import DataProcessor
+from app.services.quota_ledger import QuotaLedger
+from app.services.rate_limiter import AdaptiveTokenBucket
+from tests.fake_congress_api import FakeCongressApi, load_fixtures, scale_fixtures
+
+
+async def run_benchmark(scale: int, latency: float, jitter: float, concurrency: int,
+                        requests_per_second: float) -> dict:
+    """
+    Time the collection and ingest steps against an in-process fake server.
+    
+    Args:
+        scale: Copies of each recorded member and hearing
+        latency: Seconds of simulated server latency per request
+        jitter: Random extra latency, in seconds
+        concurrency: Client fan-out concurrency
+        requests_per_second: Client pacing
+    
+    Returns:
+        Timings, request counts and peak server concurrency per step
+    """
+    fake = FakeCongressApi(
+        fixtures=scale_fixtures(load_fixtures(), scale), latency=latency, jitter=jitter, rate_limit=10 ** 9
+    )
+    Base.metadata.create_all(bind=engine)
+    results = {"scale": scale, "latency": latency, "concurrency": concurrency, "steps": {}}
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=fake)) as http_client:
+        client = CongressApiClient(
+            http_client=http_client,
+            quota_ledger=QuotaLedger(os.environ["CONGRESS_API_QUOTA_PATH"], daily_limit=10 ** 9),
+            rate_limiter=AdaptiveTokenBucket(
+                rate=requests_per_second, capacity=concurrency, min_rate=requests_per_second,
+                smoothing=0.0, window_seconds=3600,
+            ),
+        )
+        client.max_concurrency = concurrency
+        
+        async def members():
+            return len(await client.get_all_members())
+        
+        async def memberships():
+            return sum(len(seats) for seats in (await client.get_all_committee_memberships()).values())
+        
+        async def hearings():
+            return len(await client.get_hearings())
+        
+        async def ingest_members():
+            processor = DataProcessor()
+            processor.congress_api = client
+            return (await processor.update_members(force_refresh=True))["total_processed"]
+        
+        for name, step in (("members", members), ("committee_memberships", memberships),
+                           ("hearings", hearings), ("ingest_members", ingest_members)):
+            requests_before = len(fake.request_log)
+            fake.peak_in_flight = 0
+            started = time.perf_counter()
+            records = await step()
+            elapsed = time.perf_counter() - started
+            results["steps"][name] = {
+                "records": records,
+                "requests": len(fake.request_log) - requests_before,
+                "seconds": round(elapsed, 3),
+                "records_per_second": round(records / elapsed, 1) if elapsed else None,
+                "peak_server_concurrency": fake.peak_in_flight,
+            }
+    
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ingest against the fake Congress.gov server")
+    parser.add_argument("--scale", type=int, default=10, help="Copies of each recorded member and hearing")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds of server latency per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra latency, in seconds")
+    parser.add_argument("--concurrency", type=int, default=10, help="Client fan-out concurrency")
+    parser.add_argument("--rps", type=float, default=1000.0, help="Client requests per second")
+    args = parser.parse_args()
+    
+    results = asyncio.run(run_benchmark(args.scale, args.latency, args.jitter, args.concurrency, args.rps))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
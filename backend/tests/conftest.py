@@ -2,6 +2,7 @@
 Test configuration and fixtures.
 """
 import os
+import tempfile
 import pytest
 
 # Set test environment variables BEFORE importing app modules
@@ -10,6 +11,10 @@ os.environ["CONGRESS_API_KEY"] = "test_api_key"
 os.environ["SECRET_KEY"] = "test_secret_key"
 os.environ["GCP_PROJECT_ID"] = "test_project"
 os.environ["DEBUG"] = "true"
+os.environ["CONGRESS_API_CACHE_MODE"] = "off"
+os.environ["CONGRESS_API_QUOTA_PATH"] = os.path.join(tempfile.mkdtemp(), "quota.db")
+os.environ["CONGRESS_API_CHECKPOINT_PATH"] = os.path.join(tempfile.mkdtemp(), "checkpoints.db")
+os.environ["SCRAPING_FINGERPRINT_PATH"] = os.path.join(tempfile.mkdtemp(), "scraper_pages.db")
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -0,0 +1,322 @@
+"""
+Local stand-in for the Congress.gov API that replays recorded fixtures.
+
+The app serves the endpoints CongressApiClient uses under /v3, with
+Congress.gov-style offset/limit pagination (pagination.count and
+pagination.next), X-RateLimit-* headers, 429 responses with Retry-After
+once the budget is spent, and optional per-request latency. It can run
+in-process through httpx.ASGITransport (tests, benchmarks) or as a real
+server that the backend reaches through CONGRESS_API_BASE_URL:
+
+    python -m tests.fake_congress_api serve --port 8010 --latency 0.05 --scale 10
+    CONGRESS_API_BASE_URL=http://127.0.0.1:8010/v3 uvicorn app.main:app
+
+Fixtures live in tests/fixtures/congress_api and can be refreshed from the
+live API with a real key:
+
+    python -m tests.fake_congress_api record --out tests/fixtures/congress_api
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from copy import deepcopy
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "congress_api")
+FIXTURE_FILES = ("members", "committees", "hearings", "committee_assignments")
+
+# Congress.gov defaults to 20 items per page and caps limit at 250
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 250
+
+
+def load_fixtures(directory: str = FIXTURES_DIR) -> Dict[str, Any]:
+    """
+    Load recorded payloads from a fixtures directory.
+    
+    Args:
+        directory: Directory holding members.json, committees.json,
+            hearings.json and committee_assignments.json
+    
+    Returns:
+        Fixtures keyed by file name (missing files load as empty)
+    """
+    fixtures = {}
+    for name in FIXTURE_FILES:
+        path = os.path.join(directory, f"{name}.json")
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                fixtures[name] = json.load(f)
+        else:
+            fixtures[name] = {} if name == "committee_assignments" else []
+    return fixtures
+
+
+def scale_fixtures(fixtures: Dict[str, Any], factor: int) -> Dict[str, Any]:
+    """
+    Multiply the recorded members and hearings for volume benchmarks.
+    
+    Copies get distinct bioguide IDs and jacket numbers, and member copies
+    keep their recorded committee assignments.
+    
+    Args:
+        fixtures: Fixtures from load_fixtures
+        factor: Number of copies of each record (1 returns the fixtures unchanged)
+    
+    Returns:
+        Scaled fixtures
+    """
+    if factor <= 1:
+        return fixtures
+    
+    members = []
+    assignments = dict(fixtures["committee_assignments"])
+    hearings = []
+    for copy_index in range(factor):
+        for member in fixtures["members"]:
+            clone = deepcopy(member)
+            if copy_index:
+                clone["bioguideId"] = f"{member['bioguideId']}X{copy_index}"
+                clone["url"] = member.get("url", "").replace(member["bioguideId"], clone["bioguideId"])
+                assignments[clone["bioguideId"]] = fixtures["committee_assignments"].get(member["bioguideId"], [])
+            members.append(clone)
+        for hearing in fixtures["hearings"]:
+            clone = deepcopy(hearing)
+            if copy_index:
+                clone["jacketNumber"] = hearing["jacketNumber"] + copy_index * 100000
+                clone["url"] = hearing.get("url", "").replace(str(hearing["jacketNumber"]), str(clone["jacketNumber"]))
+            hearings.append(clone)
+    
+    return {**fixtures, "members": members, "hearings": hearings, "committee_assignments": assignments}
+
+
+class FakeCongressApi:
+    """
+    ASGI app replaying fixtures with Congress.gov pagination, pacing and quota behaviour.
+    """
+    
+    def __init__(self, fixtures: Optional[Dict[str, Any]] = None, latency: float = 0.0,
+                 jitter: float = 0.0, rate_limit: int = 5000, window_seconds: int = 3600,
+                 api_key: Optional[str] = None, seed: int = 0):
+        """
+        Args:
+            fixtures: Fixtures from load_fixtures (default: the recorded fixtures)
+            latency: Seconds added to every response
+            jitter: Extra random latency of up to this many seconds
+            rate_limit: Requests allowed per window before answering 429
+            window_seconds: Length of the rate-limit window
+            api_key: Key required in X-API-Key or api_key (None accepts any key)
+            seed: Seed for the latency jitter, so runs are reproducible
+        """
+        self.fixtures = fixtures if fixtures is not None else load_fixtures()
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.window_seconds = window_seconds
+        self.api_key = api_key
+        self.random = random.Random(seed)
+        
+        self.request_log: List[str] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._window_start = time.monotonic()
+        self._window_used = 0
+        
+        self.app = FastAPI(title="Fake Congress.gov API")
+        self.app.middleware("http")(self._pace_and_meter)
+        self.app.get("/v3/member")(self.list_members)
+        self.app.get("/v3/member/{bioguide_id}")(self.member_detail)
+        self.app.get("/v3/member/{bioguide_id}/committee-assignment")(self.committee_assignments)
+        self.app.get("/v3/committee")(self.list_committees)
+        self.app.get("/v3/committee/{chamber}")(self.list_committees)
+        self.app.get("/v3/committee/{chamber}/{system_code}")(self.committee_detail)
+        self.app.get("/v3/hearing")(self.list_hearings)
+    
+    async def __call__(self, scope, receive, send):
+        await self.app(scope, receive, send)
+    
+    def _rate_limit_headers(self) -> Dict[str, str]:
+        """Report the remaining budget the way api.data.gov does."""
+        reset_in = max(0, int(self.window_seconds - (time.monotonic() - self._window_start)))
+        return {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(max(self.rate_limit - self._window_used, 0)),
+            "X-RateLimit-Reset": str(reset_in),
+        }
+    
+    async def _pace_and_meter(self, request: Request, call_next):
+        """Check the key, spend the rate-limit budget and add latency."""
+        self.request_log.append(f"{request.url.path}?{request.url.query}")
+        
+        key = request.headers.get("x-api-key") or request.query_params.get("api_key")
+        if self.api_key is not None and key != self.api_key:
+            return JSONResponse({"error": {"code": "API_KEY_INVALID"}}, status_code=403)
+        
+        if time.monotonic() - self._window_start >= self.window_seconds:
+            self._window_start = time.monotonic()
+            self._window_used = 0
+        if self._window_used >= self.rate_limit:
+            headers = self._rate_limit_headers()
+            headers["Retry-After"] = headers["X-RateLimit-Reset"]
+            return JSONResponse({"error": {"code": "OVER_RATE_LIMIT"}}, status_code=429, headers=headers)
+        self._window_used += 1
+        
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+            if delay:
+                await asyncio.sleep(delay)
+            response = await call_next(request)
+        finally:
+            self.in_flight -= 1
+        
+        response.headers.update(self._rate_limit_headers())
+        return response
+    
+    @staticmethod
+    def _page(request: Request, items_key: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Slice a list like Congress.gov, including the pagination block."""
+        try:
+            limit = min(int(request.query_params.get("limit", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+            offset = int(request.query_params.get("offset", 0))
+        except ValueError:
+            limit, offset = DEFAULT_PAGE_SIZE, 0
+        
+        pagination = {"count": len(items)}
+        if offset + limit < len(items):
+            params = {**request.query_params, "offset": offset + limit, "limit": limit}
+            params.pop("api_key", None)
+            pagination["next"] = f"{str(request.base_url).rstrip('/')}{request.url.path}?{urlencode(params)}"
+        
+        return {
+            items_key: items[offset:offset + limit],
+            "pagination": pagination,
+            "request": {"contentType": "application/json", "format": "json"},
+        }
+    
+    async def list_members(self, request: Request) -> Dict[str, Any]:
+        members = self.fixtures["members"]
+        
+        chamber = request.query_params.get("chamber")
+        if chamber:
+            wanted = "Senate" if chamber.lower() == "senate" else "House of Representatives"
+            members = [m for m in members if (m.get("terms", {}).get("item") or [{}])[-1].get("chamber") == wanted]
+        
+        since = request.query_params.get("fromDateTime")
+        if since:
+            since = datetime.fromisoformat(since.replace("Z", "+00:00"))
+            members = [
+                m for m in members
+                if m.get("updateDate") and datetime.fromisoformat(m["updateDate"].replace("Z", "+00:00")) >= since
+            ]
+        
+        return self._page(request, "members", members)
+    
+    async def member_detail(self, bioguide_id: str):
+        for member in self.fixtures["members"]:
+            if member["bioguideId"] == bioguide_id:
+                return {"member": member}
+        return JSONResponse({"error": f"Unknown member {bioguide_id}"}, status_code=404)
+    
+    async def committee_assignments(self, bioguide_id: str) -> Dict[str, Any]:
+        return {"committeeAssignments": self.fixtures["committee_assignments"].get(bioguide_id, [])}
+    
+    async def list_committees(self, request: Request, chamber: Optional[str] = None) -> Dict[str, Any]:
+        chamber = chamber or request.query_params.get("chamber")
+        committees = self.fixtures["committees"]
+        if chamber:
+            committees = [c for c in committees if c.get("chamber", "").lower() == chamber.lower()]
+        return self._page(request, "committees", committees)
+    
+    async def committee_detail(self, chamber: str, system_code: str):
+        for committee in self.fixtures["committees"]:
+            if committee["systemCode"] == system_code:
+                return {"committee": committee}
+        return JSONResponse({"error": f"Unknown committee {system_code}"}, status_code=404)
+    
+    async def list_hearings(self, request: Request) -> Dict[str, Any]:
+        return self._page(request, "hearings", self.fixtures["hearings"])
+
+
+async def record_fixtures(directory: str, max_members: Optional[int] = None) -> Dict[str, int]:
+    """
+    Record fresh fixtures from the live API using the configured key.
+    
+    Args:
+        directory: Directory to write the fixture files to
+        max_members: Only keep this many members (and their assignments)
+    
+    Returns:
+        Number of records written per fixture file
+    """
+    from app.services.congress_api import CongressApiClient, close_http_client
+    
+    client = CongressApiClient()
+    try:
+        members = await client.get_members(max_items=max_members)
+        fixtures = {
+            "members": members,
+            "committees": await client.get_committees(),
+            "hearings": await client.get_hearings(),
+            "committee_assignments": {
+                member["bioguideId"]: await client.get_member_committees(member["bioguideId"])
+                for member in members
+            },
+        }
+    finally:
+        await close_http_client()
+    
+    os.makedirs(directory, exist_ok=True)
+    for name, payload in fixtures.items():
+        with open(os.path.join(directory, f"{name}.json"), "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+    return {name: len(payload) for name, payload in fixtures.items()}
+
+
+def main() -> None:
+    """Serve the fixtures over HTTP or record new ones."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    serve = commands.add_parser("serve", help="Serve fixtures at http://HOST:PORT/v3")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8010)
+    serve.add_argument("--fixtures", default=FIXTURES_DIR)
+    serve.add_argument("--scale", type=int, default=1, help="Copies of each member and hearing")
+    serve.add_argument("--latency", type=float, default=0.0, help="Seconds added to each response")
+    serve.add_argument("--jitter", type=float, default=0.0, help="Random extra latency, in seconds")
+    serve.add_argument("--rate-limit", type=int, default=5000, help="Requests per window")
+    serve.add_argument("--window", type=int, default=3600, help="Rate-limit window, in seconds")
+    
+    record = commands.add_parser("record", help="Record fixtures from the live API")
+    record.add_argument("--out", default=FIXTURES_DIR)
+    record.add_argument("--max-members", type=int, default=None)
+    
+    args = parser.parse_args()
+    if args.command == "record":
+        print(json.dumps(asyncio.run(record_fixtures(args.out, args.max_members))))
+        return
+    
+    import uvicorn
+    
+    fake = FakeCongressApi(
+        fixtures=scale_fixtures(load_fixtures(args.fixtures), args.scale),
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        window_seconds=args.window,
+    )
+    uvicorn.run(fake.app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
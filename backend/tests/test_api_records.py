@@ -0,0 +1,66 @@
+"""
+Tests for the typed Congress.gov payload records.
+"""
+from datetime import datetime, timezone
+import pytest
+from app.services.api_records import (
+    MemberRecord, CommitteeRecord, CommitteeAssignmentRecord, HearingRecord, RecordError, decode_records,
+)
+
+
+def test_member_record_picks_nested_fields_and_drops_the_rest():
+    """Test that a member decodes terms, depiction and updateDate into a slotted record."""
+    record = MemberRecord.from_api({
+        "bioguideId": "A000001",
+        "name": "Doe, Jane A.",
+        "partyName": "Democratic",
+        "state": "California",
+        "district": 12,
+        "terms": {"item": [{"chamber": "House of Representatives", "startYear": 2023}]},
+        "depiction": {"imageUrl": "https://example.com/photo.jpg", "attribution": "ignored"},
+        "updateDate": "2025-01-04T23:35:19Z",
+        "url": "https://api.congress.gov/v3/member/A000001",
+        "unused": {"deeply": {"nested": ["payload"]}},
+    })
+    
+    assert record.chamber == "House of Representatives"
+    assert record.district == "12"
+    assert record.image_url == "https://example.com/photo.jpg"
+    assert record.update_date == datetime(2025, 1, 4, 23, 35, 19, tzinfo=timezone.utc)
+    assert not hasattr(record, "__dict__")
+
+
+def test_records_reject_missing_or_mistyped_fields():
+    """Test that invalid payloads are skipped by decode_records."""
+    with pytest.raises(RecordError):
+        MemberRecord.from_api({"name": "No Id"})
+    with pytest.raises(RecordError):
+        HearingRecord.from_data({"title": "Oversight", "video_urls": "not-a-list"})
+    
+    records = decode_records(MemberRecord.from_api, [
+        {"bioguideId": "A000001"},
+        {"bioguideId": 42},
+        {"bioguideId": "B000002", "updateDate": "yesterday"},
+    ])
+    
+    assert [record.bioguide_id for record in records] == ["A000001"]
+
+
+def test_committee_and_assignment_records_map_api_keys():
+    """Test that system codes, parents and assignment roles are decoded."""
+    committee = CommitteeRecord.from_api({
+        "name": "Conservation and Forestry Subcommittee",
+        "chamber": "House",
+        "systemCode": "hsag15",
+        "committeeTypeCode": "Standing",
+        "parent": {"systemCode": "hsag00", "name": "Agriculture Committee"},
+    })
+    assert committee.congress_gov_id == committee.committee_code == "hsag15"
+    assert committee.is_subcommittee is True
+    assert committee.parent_code == "hsag00"
+    
+    assignment = CommitteeAssignmentRecord.from_api({"name": "Committee on Rules", "chamber": "House",
+                                                     "title": "Ranking Member"})
+    assert assignment.position == "Ranking Member"
+    assert assignment.is_current is True
+    assert assignment.is_subcommittee is False
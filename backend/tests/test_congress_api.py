@@ -0,0 +1,767 @@
+"""
+Tests for the Congress.gov API client.
+"""
+import asyncio
+import json
+import sqlite3
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+import httpx
+import pytest
+from app.services import congress_api
+from app.services.congress_api import CongressApiClient, get_http_client, close_http_client
+from app.services.rate_limiter import TokenBucket, AdaptiveTokenBucket, gather_bounded, parse_retry_after
+from app.services.api_paginator import paginate, collect
+from app.services.http_cache import ResponseCache, CacheMissError
+from app.services.quota_ledger import QuotaLedger, QuotaExceededError, QuotaDeferredError
+from app.services.quota_scheduler import QuotaScheduler
+from app.services.single_flight import SingleFlight
+from app.services.hedging import RequestHedger, normalize_endpoint
+from app.services.collection_checkpoints import CheckpointStore
+
+
+def make_transport(handler):
+    """Build a mock transport that records every request it serves."""
+    requests = []
+    
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+    
+    transport = httpx.MockTransport(_handler)
+    transport.requests = requests
+    return transport
+
+
+@pytest.mark.asyncio
+async def test_client_uses_injected_http_client():
+    """Test that requests go through the injected HTTP client."""
+    transport = make_transport(lambda request: httpx.Response(200, json={"members": [{"bioguideId": "A000001"}]}))
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client)
+        members = await client.get_members(chamber="house")
+    
+    assert members == [{"bioguideId": "A000001"}]
+    assert len(transport.requests) == 1
+    request = transport.requests[0]
+    assert request.url.path.endswith("/member")
+    assert request.url.params["chamber"] == "house"
+    assert request.headers["X-API-Key"] == "test_api_key"
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_is_reused():
+    """Test that the shared connection pool is reused until closed."""
+    first = get_http_client()
+    second = get_http_client()
+    assert first is second
+    
+    await close_http_client()
+    assert first.is_closed
+    assert congress_api._shared_http_client is None
+    
+    third = get_http_client()
+    assert third is not first
+    await close_http_client()
+
+
+def test_token_bucket_allows_burst_then_paces():
+    """Test that the token bucket allows a burst and then enforces the rate."""
+    bucket = TokenBucket(rate=100.0, capacity=3)
+    
+    waits = [bucket.reserve() for _ in range(5)]
+    
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.01, abs=0.005)
+    assert waits[4] == pytest.approx(0.02, abs=0.005)
+
+
+def make_adaptive_bucket(rate=10.0):
+    """Build an adaptive bucket that follows the server budget immediately."""
+    return AdaptiveTokenBucket(rate=rate, capacity=5, min_rate=0.5, smoothing=1.0, window_seconds=3600)
+
+
+def test_adaptive_bucket_follows_server_budget():
+    """Test that pacing stays at full speed with headroom and slows as the budget runs out."""
+    bucket = make_adaptive_bucket()
+    
+    # Plenty of headroom: full speed, even with no reset header (the usual Congress.gov case)
+    for remaining in range(5000, 4980, -1):
+        bucket.update_from_headers({"x-ratelimit-limit": "5000", "x-ratelimit-remaining": str(remaining)})
+    assert bucket.rate == 10.0
+    
+    bucket.update_from_headers({"x-ratelimit-limit": "5000", "x-ratelimit-remaining": "1500"})
+    assert bucket.rate == 10.0
+    
+    # Below 20% of the budget the rate scales with what is left
+    bucket.update_from_headers({"x-ratelimit-limit": "5000", "x-ratelimit-remaining": "500"})
+    assert bucket.rate == pytest.approx(5.0)
+    
+    bucket.update_from_headers({"x-ratelimit-limit": "5000", "x-ratelimit-remaining": "100"})
+    assert bucket.rate == pytest.approx(1.0)
+    
+    bucket.update_from_headers({"x-ratelimit-limit": "5000", "x-ratelimit-remaining": "0"})
+    assert bucket.rate == 0.5  # never below the floor
+    
+    # A window about to reset allows spending what is left by then
+    bucket.update_from_headers({"x-ratelimit-limit": "5000", "x-ratelimit-remaining": "120",
+                                "x-ratelimit-reset": "60"})
+    assert bucket.rate == pytest.approx(2.0)
+    
+    # Without a limit header, the largest remaining budget seen stands in for it
+    bucket = make_adaptive_bucket()
+    bucket.update_from_headers({"x-ratelimit-remaining": "5000"})
+    bucket.update_from_headers({"x-ratelimit-remaining": "250"})
+    assert bucket.rate == pytest.approx(2.5)
+
+
+def test_adaptive_bucket_smooths_rate_changes():
+    """Test that partial smoothing moves only part of the way to the target."""
+    bucket = AdaptiveTokenBucket(rate=10.0, capacity=5, min_rate=0.5, smoothing=0.5, window_seconds=3600)
+    
+    bucket.update_from_headers({"x-ratelimit-limit": "5000", "x-ratelimit-remaining": "120",
+                                "x-ratelimit-reset": "60"})
+    
+    assert bucket.rate == pytest.approx(6.0)
+
+
+def test_adaptive_bucket_backs_off_for_retry_after():
+    """Test that a 429 halves the rate and delays the next request."""
+    bucket = make_adaptive_bucket()
+    
+    wait = bucket.backoff(parse_retry_after("2"))
+    
+    assert wait == 2.0
+    assert bucket.rate == 5.0
+    assert bucket.reserve() == pytest.approx(2.2, abs=0.05)
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+@pytest.mark.asyncio
+async def test_client_retries_after_429(tmp_path):
+    """Test that rate-limited requests are retried after backing off."""
+    responses = iter([
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={"committees": []}, headers={"x-ratelimit-remaining": "4999"}),
+    ])
+    transport = make_transport(lambda request: next(responses))
+    bucket = make_adaptive_bucket()
+    ledger = QuotaLedger(str(tmp_path / "quota.db"), daily_limit=100)
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client, quota_ledger=ledger, rate_limiter=bucket)
+        committees = await client.get_committees()
+    
+    assert committees == []
+    assert len(transport.requests) == 2
+    assert bucket.backoffs == 1
+    assert bucket.server_remaining == 4999
+    assert ledger.get_usage()["used"] == 2
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_limits_concurrency():
+    """Test that bounded gather never exceeds the concurrency limit."""
+    in_flight = 0
+    peak = 0
+    
+    async def worker(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return item * 2
+    
+    results = await gather_bounded(range(10), worker, concurrency=3)
+    
+    assert results == [item * 2 for item in range(10)]
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_get_all_committee_memberships_fans_out():
+    """Test that memberships are collected for every member and failures are reported, not emptied."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/member"):
+            return httpx.Response(200, json={"members": [{"bioguideId": "A000001"}, {"bioguideId": "B000002"}]})
+        if path.endswith("/B000002/committee-assignment"):
+            return httpx.Response(500)
+        return httpx.Response(200, json={"committeeAssignments": [{"name": "Committee on Agriculture"}]})
+    
+    transport = make_transport(handler)
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client)
+        failures = {}
+        memberships = await client.get_all_committee_memberships(
+            on_error=lambda bioguide_id, error: failures.setdefault(bioguide_id, error)
+        )
+    
+    assert memberships == {"A000001": [{"name": "Committee on Agriculture"}]}
+    assert isinstance(failures["B000002"], httpx.HTTPStatusError)
+    assert len(transport.requests) == 3
+
+
+
+def make_cache(tmp_path, mode="read_write", ttl=3600):
+    """Build a response cache in a temporary directory."""
+    return ResponseCache(
+        path=str(tmp_path / "cache.db"),
+        max_bytes=1024 * 1024,
+        ttls={"committee": ttl},
+        default_ttl=ttl,
+        mode=mode,
+    )
+
+
+@pytest.mark.asyncio
+async def test_response_cache_serves_fresh_entries(tmp_path):
+    """Test that fresh cached responses are served without a network call."""
+    transport = make_transport(lambda request: httpx.Response(200, json={"committees": [{"systemCode": "hsag00"}]}))
+    cache = make_cache(tmp_path)
+    ledger = QuotaLedger(str(tmp_path / "quota.db"), daily_limit=100)
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client, response_cache=cache, quota_ledger=ledger)
+        first = await client.get_committees(chamber="house")
+        second = await client.get_committees(chamber="house")
+    
+    assert first == second == [{"systemCode": "hsag00"}]
+    assert len(transport.requests) == 1
+    assert ledger.get_usage()["used"] == 1
+
+
+@pytest.mark.asyncio
+async def test_response_cache_revalidates_stale_entries(tmp_path):
+    """Test that stale entries are revalidated with their ETag."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"committees": [{"systemCode": "hsag00"}]}, headers={"ETag": '"v1"'})
+    
+    transport = make_transport(handler)
+    cache = make_cache(tmp_path, ttl=0)
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client, response_cache=cache)
+        await client.get_committees()
+        committees = await client.get_committees()
+    
+    assert committees == [{"systemCode": "hsag00"}]
+    assert len(transport.requests) == 2
+    assert transport.requests[1].headers["If-None-Match"] == '"v1"'
+    assert cache.get_stats()["revalidated"] == 1
+
+
+@pytest.mark.asyncio
+async def test_response_cache_replay_mode_never_hits_network(tmp_path):
+    """Test that replay mode raises on a cache miss instead of making a request."""
+    transport = make_transport(lambda request: httpx.Response(200, json={}))
+    cache = make_cache(tmp_path, mode="replay")
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client, response_cache=cache)
+        with pytest.raises(CacheMissError):
+            await client.get_committee_details("hsag00")
+    
+    assert transport.requests == []
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path):
+    """Test that the cache stays within its byte budget."""
+    cache = make_cache(tmp_path)
+    body = json.dumps({"members": [{"bioguideId": f"A{i:06d}"} for i in range(50)]}).encode()
+    cache.max_bytes = len(zlib.compress(body)) * 2
+    
+    cache.put("a", "a", body, ttl=60)
+    cache.put("b", "b", body, ttl=60)
+    cache.get("a")  # "b" becomes least recently used
+    cache.put("c", "c", body, ttl=60)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.get_stats()["evicted"] == 1
+
+
+def test_quota_ledger_is_shared_through_the_file(tmp_path):
+    """Test that separate ledger instances (e.g. processes) draw from one quota."""
+    path = str(tmp_path / "quota.db")
+    first = QuotaLedger(path, daily_limit=3)
+    second = QuotaLedger(path, daily_limit=3)
+    
+    assert first.acquire(consumer="backend") == 1
+    assert second.acquire(2, consumer="full_data_collection") == 3
+    with pytest.raises(QuotaExceededError):
+        first.acquire(consumer="backend")
+    
+    usage = second.get_usage()
+    assert usage["used"] == 3
+    assert usage["remaining"] == 0
+    assert usage["by_consumer"] == {"backend": 1, "full_data_collection": 2}
+
+
+@pytest.mark.asyncio
+async def test_clients_draw_from_shared_quota(tmp_path):
+    """Test that every client instance counts against the same ledger."""
+    transport = make_transport(lambda request: httpx.Response(200, json={"committees": []}))
+    ledger = QuotaLedger(str(tmp_path / "quota.db"), daily_limit=2)
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        clients = [CongressApiClient(http_client=http_client, quota_ledger=ledger) for _ in range(3)]
+        await clients[0].get_committees()
+        await clients[1].get_committees()
+        with pytest.raises(QuotaExceededError):
+            await clients[2].get_committees()
+    
+    assert len(transport.requests) == 2
+    assert clients[2].get_rate_limit_status()["daily_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_quota_draw_waiting_on_another_process_does_not_block_the_loop(tmp_path):
+    """Test that a request waiting for the ledger's write lock leaves the event loop free."""
+    path = str(tmp_path / "quota.db")
+    ledger = QuotaLedger(path, daily_limit=10)
+    transport = make_transport(lambda request: httpx.Response(200, json={"committees": []}))
+    
+    # Another process (e.g. a root collection script) holds the write lock
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client, quota_ledger=ledger)
+        request = asyncio.create_task(client.get_committees())
+        
+        started = time.monotonic()
+        await asyncio.sleep(0.05)
+        assert time.monotonic() - started < 0.2
+        assert not request.done()
+        
+        other.execute("COMMIT")
+        await request
+    
+    other.close()
+    assert ledger.get_usage()["used"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_write_waiting_on_another_process_does_not_block_the_loop(tmp_path):
+    """Test that storing a response while the cache is write-locked leaves the event loop free."""
+    cache = make_cache(tmp_path)
+    transport = make_transport(lambda request: httpx.Response(200, json={"committees": []}))
+    
+    other = sqlite3.connect(cache.path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client, response_cache=cache,
+                                   quota_ledger=QuotaLedger(str(tmp_path / "quota.db"), daily_limit=10))
+        request = asyncio.create_task(client.get_committees())
+        
+        started = time.monotonic()
+        await asyncio.sleep(0.05)
+        assert time.monotonic() - started < 0.2
+        assert not request.done()
+        
+        other.execute("COMMIT")
+        await request
+    
+    other.close()
+    assert cache.get_stats()["stored"] == 1
+
+
+@pytest.mark.asyncio
+async def test_scheduler_reserves_quota_for_higher_priorities(tmp_path):
+    """Test that low-priority work defers at its reserve while high-priority work still runs."""
+    ledger = QuotaLedger(str(tmp_path / "quota.db"), daily_limit=10)
+    scheduler = QuotaScheduler(ledger, reserves={"high": 0.0, "normal": 0.2, "low": 0.5},
+                               priorities={"backfill": "low"})
+    transport = make_transport(lambda request: httpx.Response(200, json={"member": {}}))
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client, quota_ledger=ledger, scheduler=scheduler)
+        
+        async def backfill():
+            for n in range(10):
+                await client.get_member_details(f"M{n:06d}")
+        
+        # Stops part-way once only the low-priority reserve is left
+        with pytest.raises(QuotaDeferredError):
+            await scheduler.submit("backfill", backfill, planned=2)
+        assert ledger.get_usage()["used"] == 5
+        
+        # Deferred up front now, without spending anything
+        with pytest.raises(QuotaDeferredError):
+            await scheduler.submit("backfill", backfill, planned=1)
+        assert len(transport.requests) == 5
+        
+        await scheduler.submit("hearings", lambda: client.get_member_details("H000001"), priority="high", planned=1)
+    
+    stats = scheduler.get_stats()
+    assert stats["reserves"] == {"high": 0, "normal": 2, "low": 5}
+    assert stats["by_priority"]["low"] == {"planned": 3, "spent": 5, "deferred": 2}
+    assert stats["by_priority"]["high"] == {"planned": 1, "spent": 1, "deferred": 0}
+    assert [item["status"] for item in stats["recent"]] == ["completed", "deferred", "deferred"]
+
+
+@pytest.mark.asyncio
+async def test_unscheduled_requests_leave_the_high_priority_reserve(tmp_path):
+    """Test that requests outside a work item stop at the normal reserve."""
+    ledger = QuotaLedger(str(tmp_path / "quota.db"), daily_limit=10)
+    scheduler = QuotaScheduler(ledger, reserves={"high": 0.0, "normal": 0.3, "low": 0.5})
+    transport = make_transport(lambda request: httpx.Response(200, json={"member": {}}))
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client, quota_ledger=ledger, scheduler=scheduler)
+        
+        for n in range(7):
+            await client.get_member_details(f"M{n:06d}")
+        with pytest.raises(QuotaDeferredError):
+            await client.get_member_details("M000007")
+        
+        # High-priority work can still use what was held back
+        await scheduler.submit("hearings", lambda: client.get_member_details("H000001"), priority="high", planned=1)
+    
+    assert ledger.get_usage()["used"] == 8
+    assert scheduler.get_stats()["unscheduled_spent"] == 7
+
+
+def paged_handler(total, items_key="committees", with_pagination=True):
+    """Serve `total` numbered items in offset/limit pages like Congress.gov."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params.get("offset", 0))
+        limit = int(request.url.params.get("limit", 250))
+        body = {items_key: [{"n": n} for n in range(offset, min(offset + limit, total))]}
+        if with_pagination:
+            body["pagination"] = {"count": total}
+            if offset + limit < total:
+                body["pagination"]["next"] = f"https://api.congress.gov/v3/x?offset={offset + limit}&limit={limit}"
+        return httpx.Response(200, json=body)
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_list_methods_follow_every_page():
+    """Test that collected list methods no longer stop after the first page."""
+    transport = make_transport(paged_handler(600))
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client)
+        committees = await client.get_committees()
+    
+    assert [c["n"] for c in committees] == list(range(600))
+    assert [r.url.params["offset"] for r in transport.requests] == ["0", "250", "500"]
+
+
+@pytest.mark.asyncio
+async def test_paginator_falls_back_to_offsets_without_pagination_block():
+    """Test offset paging for responses that carry no pagination metadata."""
+    transport = make_transport(paged_handler(300, items_key="members", with_pagination=False))
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client)
+        members = await client.get_committee_members("hsag00")
+    
+    assert len(members) == 300
+    assert len(transport.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_paginator_fans_out_pages_once_count_is_known():
+    """Test that parallel pagination requests the remaining pages concurrently."""
+    in_flight = 0
+    peak = 0
+    serve = paged_handler(1000, items_key="members")
+    
+    async def fetch_page(params):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        request = httpx.Request("GET", "https://api.congress.gov/v3/member", params=params)
+        return serve(request).json()
+    
+    items = await collect(paginate(fetch_page, "members", parallel=True, concurrency=3))
+    
+    assert [m["n"] for m in items] == list(range(1000))
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_paginator_stops_at_max_items_and_cancels_prefetch():
+    """Test that streaming consumers can stop early."""
+    transport = make_transport(paged_handler(1000, items_key="bills"))
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client)
+        bills = await client.search_bills("farm", limit=30)
+        
+        streamed = []
+        async for bill in client.iter_bills("farm"):
+            streamed.append(bill)
+            if len(streamed) == 5:
+                break
+    
+    assert len(bills) == 30
+    assert transport.requests[0].url.params["limit"] == "30"
+    assert len(streamed) == 5
+
+
+@pytest.mark.asyncio
+async def test_interrupted_collection_resumes_from_checkpoint(tmp_path):
+    """Test that a collection that died part-way resumes after its last completed page."""
+    serve = paged_handler(1000, items_key="members")
+    fail_at = {"750"}
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("offset") in fail_at:
+            return httpx.Response(500)
+        body = serve(request).json()
+        body["members"] = [{"bioguideId": f"M{m['n']:06d}"} for m in body["members"]]
+        return httpx.Response(200, json=body)
+    
+    transport = make_transport(handler)
+    checkpoints = CheckpointStore(str(tmp_path / "checkpoints.db"))
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client, checkpoints=checkpoints)
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_all_members()
+        
+        saved = checkpoints.get_stats()
+        assert [(c["name"], c["next_offset"], c["items"]) for c in saved] == [
+            ("/member?currentMember=true", 750, 750)
+        ]
+        
+        fail_at.clear()
+        transport.requests.clear()
+        members = await client.get_all_members()
+    
+    assert [m["bioguideId"] for m in members] == [f"M{n:06d}" for n in range(1000)]
+    assert [r.url.params["offset"] for r in transport.requests] == ["750"]
+    assert checkpoints.get_stats() == []
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_write_waiting_on_another_process_does_not_block_the_loop(tmp_path):
+    """Test that saving a page checkpoint while the store is write-locked leaves the event loop free."""
+    serve = paged_handler(500, items_key="members")
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = serve(request).json()
+        body["members"] = [{"bioguideId": f"M{m['n']:06d}"} for m in body["members"]]
+        return httpx.Response(200, json=body)
+    
+    checkpoints = CheckpointStore(str(tmp_path / "checkpoints.db"))
+    other = sqlite3.connect(checkpoints.path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    
+    async with httpx.AsyncClient(transport=make_transport(handler)) as http_client:
+        client = CongressApiClient(http_client=http_client, checkpoints=checkpoints)
+        request = asyncio.create_task(client.get_all_members())
+        
+        started = time.monotonic()
+        await asyncio.sleep(0.05)
+        assert time.monotonic() - started < 0.2
+        assert not request.done()
+        
+        other.execute("COMMIT")
+        members = await request
+    
+    other.close()
+    assert len(members) == 500
+    assert checkpoints.get_stats() == []
+
+
+@pytest.mark.asyncio
+async def test_interrupted_incremental_sync_resumes_with_its_window(tmp_path):
+    """Test that a newer fromDateTime resumes the interrupted sync, and a narrower window does not."""
+    serve = paged_handler(600, items_key="members")
+    fail_at = {"500"}
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("offset") in fail_at:
+            return httpx.Response(500)
+        body = serve(request).json()
+        body["members"] = [{"bioguideId": f"M{m['n']:06d}"} for m in body["members"]]
+        return httpx.Response(200, json=body)
+    
+    transport = make_transport(handler)
+    checkpoints = CheckpointStore(str(tmp_path / "checkpoints.db"))
+    first_run = datetime(2025, 1, 4, 12, 0, tzinfo=timezone.utc)
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client, checkpoints=checkpoints)
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_all_members(updated_since=first_run)
+        
+        saved = checkpoints.get_stats()
+        assert [(c["name"], c["next_offset"], c["window"]) for c in saved] == [
+            ("/member?currentMember=true", 500, {"fromDateTime": "2025-01-04T12:00:00Z"})
+        ]
+        
+        # The next run asks for a later window; the earlier one covers it, so it resumes
+        fail_at.clear()
+        transport.requests.clear()
+        members = await client.get_all_members(updated_since=first_run + timedelta(hours=6))
+        
+        assert len(members) == 600
+        assert [(r.url.params["offset"], r.url.params["fromDateTime"]) for r in transport.requests] == [
+            ("500", "2025-01-04T12:00:00Z")
+        ]
+        assert checkpoints.get_stats() == []
+        
+        # A checkpoint from a later window does not cover an earlier request and is dropped
+        fail_at.add("500")
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_all_members(updated_since=first_run)
+        fail_at.clear()
+        transport.requests.clear()
+        await client.get_all_members(updated_since=first_run - timedelta(days=1))
+        assert transport.requests[0].url.params["offset"] == "0"
+
+
+def test_stale_checkpoints_are_purged_whatever_their_name(tmp_path):
+    """Test that abandoned checkpoints are deleted on open and on save, not only when reloaded."""
+    path = str(tmp_path / "checkpoints.db")
+    store = CheckpointStore(path)
+    store.save_page("/member?currentMember=true", 250, [{"bioguideId": "A000001"}], ["A000001"])
+    store.save_page("/hearing", 250, [{"jacketNumber": 1}])
+    store._conn.execute("UPDATE collection_checkpoints SET updated_at = 0 WHERE name = '/hearing'")
+    
+    store.save_page("/member?currentMember=true", 500, [{"bioguideId": "A000002"}], ["A000002"])
+    assert [c["name"] for c in store.get_stats()] == ["/member?currentMember=true"]
+    assert store._conn.execute("SELECT COUNT(*) FROM collection_checkpoint_items").fetchone()[0] == 2
+    
+    store._conn.execute("UPDATE collection_checkpoints SET updated_at = 0")
+    store.close()
+    assert CheckpointStore(path).get_stats() == []
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_share_one_call(tmp_path):
+    """Test that concurrent identical requests from different clients are coalesced."""
+    release = asyncio.Event()
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={"committees": [{"systemCode": "hsag00"}]})
+    
+    transport = make_transport(handler)
+    ledger = QuotaLedger(str(tmp_path / "quota.db"), daily_limit=100)
+    single_flight = SingleFlight()
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        clients = [
+            CongressApiClient(http_client=http_client, quota_ledger=ledger, single_flight=single_flight)
+            for _ in range(3)
+        ]
+        calls = [asyncio.ensure_future(client.get_committees(chamber="house")) for client in clients]
+        other = asyncio.ensure_future(clients[0].get_committees(chamber="senate"))
+        await asyncio.sleep(0.01)
+        
+        # Cancelling one waiter must not cancel the shared request
+        calls[0].cancel()
+        release.set()
+        results = await asyncio.gather(*calls[1:], other)
+    
+    assert results[0] == results[1] == [{"systemCode": "hsag00"}]
+    assert len(transport.requests) == 2
+    assert ledger.get_usage()["used"] == 2
+    stats = single_flight.get_stats()
+    assert stats["calls"] == 2
+    assert stats["coalesced"] == 2
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesced_callers_all_see_the_failure():
+    """Test that an error from the shared call reaches every waiting caller."""
+    single_flight = SingleFlight()
+    calls = 0
+    
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise httpx.ConnectError("boom")
+    
+    results = await asyncio.gather(
+        *[single_flight.run("key", failing) for _ in range(3)], return_exceptions=True
+    )
+    
+    assert calls == 1
+    assert all(isinstance(result, httpx.ConnectError) for result in results)
+    assert single_flight.get_stats()["in_flight"] == 0
+
+
+def test_normalize_endpoint_collapses_identifiers():
+    """Test that detail paths share one latency histogram per endpoint."""
+    assert normalize_endpoint("/member/A000001") == "/member/{id}"
+    assert normalize_endpoint("member/B000002/committee-assignment") == "/member/{id}/committee-assignment"
+    assert normalize_endpoint("/committee/house/hsag00") == "/committee/house/{id}"
+    assert normalize_endpoint("/member") == "/member"
+
+
+def primed_hedger(endpoint="/member/{id}", latency=0.005, **kwargs):
+    """Build an enabled hedger that already has latency samples for an endpoint."""
+    hedger = RequestHedger(enabled=True, min_samples=5, min_delay=0.01, **kwargs)
+    for _ in range(40):
+        hedger.latency.record(endpoint, latency)
+    return hedger
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged_and_first_response_wins(tmp_path):
+    """Test that a stalled detail call is duplicated and the fast copy is returned."""
+    attempts = 0
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            await asyncio.sleep(5)
+        return httpx.Response(200, json={"member": {"bioguideId": "A000001", "attempt": attempts}})
+    
+    transport = make_transport(handler)
+    ledger = QuotaLedger(str(tmp_path / "quota.db"), daily_limit=100)
+    hedger = primed_hedger()
+    
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = CongressApiClient(http_client=http_client, quota_ledger=ledger, hedger=hedger)
+        started = asyncio.get_running_loop().time()
+        member = await client.get_member_details("A000001")
+        elapsed = asyncio.get_running_loop().time() - started
+    
+    assert member["attempt"] == 2
+    assert elapsed < 1
+    assert hedger.stats["hedged"] == hedger.stats["hedge_wins"] == 1
+    assert ledger.get_usage()["used"] == 2
+    assert client.get_rate_limit_status()["hedging"]["endpoints"]["/member/{id}"]["samples"] == 41
+
+
+@pytest.mark.asyncio
+async def test_hedging_budget_caps_extra_requests():
+    """Test that hedges stop once the budget is spent."""
+    hedger = primed_hedger(endpoint="/bill", budget=0.0)
+    calls = 0
+    
+    async def slow():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return calls
+    
+    await hedger.run("/bill", slow)
+    await hedger.run("/bill", slow)
+    
+    assert hedger.stats["hedged"] == 1
+    assert hedger.stats["over_budget"] == 1
+    assert calls == 3
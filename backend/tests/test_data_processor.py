@@ -0,0 +1,208 @@
+"""
+Tests for the data processing service.
+"""
+import pytest
+from datetime import datetime
+from app.core.read_cache import read_cache
+from app.models import Member, SyncState, Committee, Hearing
+from app.services.data_processor import DataProcessor
+
+
+class FakeCongressApi:
+    """Stand-in for CongressApiClient that serves canned member batches."""
+    
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.calls = []
+    
+    async def get_all_members(self, current_only=True, updated_since=None):
+        self.calls.append(updated_since)
+        return self.batches.pop(0)
+
+
+class FakeSource:
+    """Stand-in for an API client or scraper serving fixed committees and hearings."""
+    
+    def __init__(self, committees=(), hearings=(), pages=()):
+        self.committees = list(committees)
+        self.hearings = list(hearings)
+        self.pages = list(pages)
+        self.saved = []
+    
+    async def get_committees(self, chamber=None):
+        return [c for c in self.committees if c["chamber"].lower() == chamber]
+    
+    async def scrape_committees(self, changed_only=False, force_refresh=False, pending=None):
+        pending.extend(page for page in self.pages if page.startswith("committees"))
+        return list(self.committees)
+    
+    async def get_hearings(self):
+        return list(self.hearings)
+    
+    async def scrape_hearings(self, changed_only=False, force_refresh=False, pending=None):
+        pending.extend(page for page in self.pages if page.startswith("hearings"))
+        return list(self.hearings)
+    
+    def save_pages(self, pages):
+        self.saved.extend(pages)
+
+
+def api_member(bioguide_id, party="Democratic", state="California", update_date="2025-01-01T00:00:00Z"):
+    """Build a member record shaped like the Congress.gov /member list."""
+    return {
+        "bioguideId": bioguide_id,
+        "name": "Doe, Jane A.",
+        "partyName": party,
+        "state": state,
+        "district": 12,
+        "terms": {"item": [{"chamber": "House of Representatives"}]},
+        "depiction": {"imageUrl": "https://example.com/photo.jpg"},
+        "updateDate": update_date,
+        "url": f"https://api.congress.gov/v3/member/{bioguide_id}",
+    }
+
+
+@pytest.fixture
+def db(test_db):
+    """Provide a clean session against the test database."""
+    session = test_db()
+    session.query(Member).delete()
+    session.query(Committee).delete()
+    session.query(Hearing).delete()
+    session.query(SyncState).delete()
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.mark.asyncio
+async def test_update_members_runs_incrementally_after_first_sync(db):
+    """Test that the second run requests only changes and touches only changed rows."""
+    processor = DataProcessor()
+    processor.congress_api = FakeCongressApi([
+        [api_member("A000001"), api_member("B000002", update_date="2025-02-01T00:00:00Z")],
+        [api_member("A000001", party="Independent", update_date="2025-03-01T00:00:00Z"),
+         api_member("B000002", update_date="2025-02-01T00:00:00Z")],
+    ])
+    
+    version = read_cache.version
+    first = await processor.update_members()
+    second = await processor.update_members()
+    
+    assert read_cache.version == version + 2    
+    assert first["mode"] == "full"
+    assert first["created"] == 2
+    assert processor.congress_api.calls[0] is None
+    
+    assert second["mode"] == "incremental"
+    assert processor.congress_api.calls[1] is not None
+    assert processor.congress_api.calls[1].isoformat().startswith("2025-01-31T23:55")
+    assert second["updated"] == 1
+    assert second["unchanged"] == 1
+    assert second["high_water_mark"].startswith("2025-03-01")
+    
+    db.expire_all()
+    member = db.query(Member).filter(Member.bioguide_id == "A000001").first()
+    assert member.party == "Independent"
+    assert member.state == "CA"
+    assert member.chamber == "House"
+
+
+@pytest.mark.asyncio
+async def test_update_members_force_refresh_ignores_high_water_mark(db):
+    """Test that force_refresh performs a full pull."""
+    processor = DataProcessor()
+    processor.congress_api = FakeCongressApi([[api_member("A000001")], [api_member("A000001")]])
+    
+    await processor.update_members()
+    version = read_cache.version
+    summary = await processor.update_members(force_refresh=True)
+    
+    assert summary["mode"] == "full"
+    assert read_cache.version == version  # nothing changed, cached reads stay valid
+    assert processor.congress_api.calls == [None, None]
+    assert summary["unchanged"] == 1
+
+
+@pytest.mark.asyncio
+async def test_update_committees_merges_duplicates_in_one_batch(db):
+    """Test that committees seen from several sources are written once and updated in place."""
+    db.add(Committee(name="Committee on Agriculture", chamber="House", committee_type="Standing",
+                     committee_code="hsag00", is_active=True))
+    db.commit()
+    
+    processor = DataProcessor()
+    processor.congress_api = FakeSource()
+    processor.house_scraper = FakeSource(committees=[
+        {"name": "Committee on Agriculture", "chamber": "House", "url": "https://agriculture.house.gov"},
+        {"name": "Committee on Rules", "chamber": "House", "committee_code": "hsru00"},
+    ])
+    processor.senate_scraper = FakeSource(committees=[
+        {"name": "Committee on Rules", "chamber": "House", "phone": "202-225-9191"},
+    ])
+    
+    summary = await processor.update_committees()
+    
+    assert summary["created"] == 1
+    assert summary["updated"] == 2
+    
+    db.expire_all()
+    committees = {c.name: c for c in db.query(Committee).all()}
+    assert len(committees) == 2
+    assert committees["Committee on Agriculture"].website == "https://agriculture.house.gov"
+    assert committees["Committee on Rules"].phone == "202-225-9191"
+
+
+@pytest.mark.asyncio
+async def test_update_hearings_matches_by_title_and_date(db):
+    """Test that scraped hearings match existing rows by title and date."""
+    scheduled = datetime(2025, 3, 4, 10, 0)
+    db.add(Hearing(title="Farm Bill Oversight", scheduled_date=scheduled, scraped_video_urls=["a"]))
+    db.commit()
+    
+    processor = DataProcessor()
+    processor.congress_api = FakeSource()
+    processor.house_scraper = FakeSource(hearings=[
+        {"title": "Farm Bill Oversight", "scheduled_date": scheduled.isoformat(),
+         "location": "1300 Longworth", "video_urls": ["b"]},
+    ])
+    processor.senate_scraper = FakeSource(hearings=[
+        {"title": "Nominations", "scheduled_date": "2025-03-05T14:30:00"},
+    ])
+    
+    summary = await processor.update_hearings()
+    
+    assert summary["created"] == 1
+    assert summary["updated"] == 1
+    
+    db.expire_all()
+    hearing = db.query(Hearing).filter(Hearing.title == "Farm Bill Oversight").one()
+    assert hearing.location == "1300 Longworth"
+    assert sorted(hearing.scraped_video_urls) == ["a", "b"]
+    assert db.query(Hearing).count() == 2
+
+
+@pytest.mark.asyncio
+async def test_scraped_pages_are_saved_only_after_their_rows_commit(db, monkeypatch):
+    """Test that a failed update leaves its pages unsaved and other jobs' pages alone."""
+    processor = DataProcessor()
+    processor.congress_api = FakeSource()
+    processor.house_scraper = FakeSource(
+        committees=[{"name": "Committee on Agriculture", "chamber": "House", "source": "house.gov"}],
+        hearings=[{"title": "Farm Bill Oversight", "scheduled_date": "2025-03-04T10:00:00"}],
+        pages=["committees:list", "hearings:calendar"],
+    )
+    processor.senate_scraper = FakeSource()
+    
+    await processor.update_committees()
+    assert processor.house_scraper.saved == ["committees:list"]
+    
+    def fail(*args, **kwargs):
+        raise RuntimeError("database unavailable")
+    
+    monkeypatch.setattr("app.services.data_processor.bulk_insert", fail)
+    with pytest.raises(RuntimeError):
+        await processor.update_hearings()
+    
+    assert processor.house_scraper.saved == ["committees:list"]
+    assert db.query(Hearing).count() == 0
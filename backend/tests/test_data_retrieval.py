@@ -0,0 +1,263 @@
+"""
+Tests for the data retrieval endpoints.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from app.main import app
+from datetime import datetime
+from app.core.read_cache import read_cache, invalidate_read_cache
+from app.models import Member, Committee, CommitteeMembership, Hearing
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def fresh_read_cache():
+    """Tests write to the database directly, so start each one with an empty read cache."""
+    invalidate_read_cache()
+    yield
+    invalidate_read_cache()
+
+
+@pytest.fixture
+def seeded_db(test_db):
+    """Seed members with committee memberships."""
+    session = test_db()
+    session.query(CommitteeMembership).delete()
+    session.query(Committee).delete()
+    session.query(Member).delete()
+    
+    agriculture = Committee(name="Committee on Agriculture", chamber="House", committee_type="Standing")
+    rules = Committee(name="Committee on Rules", chamber="House", committee_type="Standing")
+    livestock = Committee(name="Subcommittee on Livestock", chamber="House", committee_type="Subcommittee",
+                          is_subcommittee=True)
+    members = [
+        Member(bioguide_id=f"M{i:06d}", first_name="Jane", last_name=f"Member{i}", chamber="House",
+               state="CA", party="Democratic", is_current=True)
+        for i in range(3)
+    ]
+    session.add_all([agriculture, rules, livestock, *members])
+    session.flush()
+    
+    session.add_all([
+        CommitteeMembership(member_id=members[0].id, committee_id=agriculture.id, position="Chair", is_current=True),
+        CommitteeMembership(member_id=members[0].id, committee_id=livestock.id, position="Member", is_current=True),
+        CommitteeMembership(member_id=members[1].id, committee_id=rules.id, position="Member", is_current=True),
+        CommitteeMembership(member_id=members[1].id, committee_id=agriculture.id, position="Member", is_current=False),
+    ])
+    session.commit()
+    
+    yield session
+    
+    session.query(CommitteeMembership).delete()
+    session.query(Committee).delete()
+    session.query(Member).delete()
+    session.commit()
+    session.close()
+
+
+def test_members_include_committees_uses_one_committee_query(seeded_db):
+    """Test that committee summaries for a page are fetched in a single query."""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    engine = seeded_db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get("/api/v1/members?include_committees=true")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    
+    assert response.status_code == 200
+    members = {m["bioguide_id"]: m for m in response.json()}
+    
+    assert [c["name"] for c in members["M000000"]["committees"]] == [
+        "Committee on Agriculture", "Subcommittee on Livestock",
+    ]
+    assert members["M000000"]["committee_summary"] == {
+        "total_committees": 2,
+        "leadership_positions": 1,
+        "standing_committees": 1,
+        "subcommittees": 1,
+    }
+    assert [c["name"] for c in members["M000001"]["committees"]] == ["Committee on Rules"]
+    assert members["M000002"]["committees"] == []
+    
+    assert len([s for s in statements if "committee_memberships" in s]) == 1
+
+
+def test_committee_hierarchy_returns_nested_tree_in_two_queries(seeded_db):
+    """Test that the hierarchy endpoint walks every level with a constant number of queries."""
+    agriculture = seeded_db.query(Committee).filter(Committee.name == "Committee on Agriculture").one()
+    livestock = seeded_db.query(Committee).filter(Committee.name == "Subcommittee on Livestock").one()
+    poultry = Committee(name="Panel on Poultry", chamber="House", committee_type="Subcommittee",
+                        is_subcommittee=True, parent_committee_id=livestock.id)
+    livestock.parent_committee_id = agriculture.id
+    seeded_db.add(poultry)
+    seeded_db.commit()
+    agriculture_id = agriculture.id
+    
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    engine = seeded_db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get(f"/api/v1/committees/{agriculture_id}/hierarchy")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["committee"]["name"] == "Committee on Agriculture"
+    assert [m["last_name"] for m in data["members"]] == ["Member0"]
+    
+    livestock_node = data["subcommittees"][0]
+    assert livestock_node["name"] == "Subcommittee on Livestock"
+    assert livestock_node["member_count"] == 1
+    assert [sub["name"] for sub in livestock_node["subcommittees"]] == ["Panel on Poultry"]
+    assert data["statistics"]["total_subcommittees"] == 2
+    assert data["statistics"]["max_depth"] == 2
+    assert len(statements) == 2
+    
+    shallow = client.get(f"/api/v1/committees/{agriculture_id}/hierarchy?depth=1").json()
+    assert shallow["subcommittees"][0]["subcommittees"] == []
+    
+    assert client.get("/api/v1/committees/999999/hierarchy").status_code == 404
+
+
+def page_through(path, limit):
+    """Follow X-Next-Cursor headers and collect every row."""
+    rows = []
+    response = client.get(f"{path}&limit={limit}")
+    rows.extend(response.json())
+    while "x-next-cursor" in response.headers:
+        response = client.get(f"{path}&limit={limit}&cursor={response.headers['x-next-cursor']}")
+        assert response.status_code == 200
+        rows.extend(response.json())
+    return rows
+
+
+def test_hearings_cursor_pagination_visits_every_row_once(test_db):
+    """Test keyset paging over hearings with tied and missing sort values."""
+    session = test_db()
+    session.query(Hearing).delete()
+    dates = [datetime(2025, 1, 1), datetime(2025, 1, 1), datetime(2025, 2, 1), None, None, datetime(2025, 3, 1)]
+    session.add_all([Hearing(title=f"Hearing {i}", scheduled_date=d, status="Scheduled") for i, d in enumerate(dates)])
+    session.commit()
+    
+    try:
+        rows = page_through("/api/v1/hearings?sort_by=scheduled_date&sort_order=desc", limit=2)
+        offset_rows = client.get("/api/v1/hearings?sort_by=scheduled_date&sort_order=desc&limit=200").json()
+    finally:
+        session.query(Hearing).delete()
+        session.commit()
+        session.close()
+    
+    assert len(rows) == 6
+    assert [r["id"] for r in rows] == [r["id"] for r in offset_rows]
+    assert [r["scheduled_date"] for r in rows][-2:] == [None, None]
+
+
+def test_members_cursor_pagination_matches_offset_order(seeded_db):
+    """Test keyset paging over the raw SQL members listing."""
+    rows = page_through("/api/v1/members?sort_by=last_name&sort_order=asc", limit=1)
+    
+    assert [r["last_name"] for r in rows] == ["Member0", "Member1", "Member2"]
+
+
+def test_invalid_cursor_is_rejected(seeded_db):
+    """Test that malformed or mismatched cursors return 400."""
+    assert client.get("/api/v1/committees?cursor=not-a-cursor").status_code == 400
+    
+    response = client.get("/api/v1/committees?limit=1&active_only=false")
+    cursor = response.headers["x-next-cursor"]
+    assert client.get(f"/api/v1/committees?cursor={cursor}&sort_order=desc").status_code == 400
+
+
+def test_members_include_total_and_facets(seeded_db):
+    """Test that totals and facet counts come back with the page."""
+    seeded_db.query(Member).filter(Member.bioguide_id == "M000002").update({"party": "Republican", "state": "TX"})
+    seeded_db.commit()
+    
+    response = client.get("/api/v1/members?limit=1&include_total=true&include_facets=true")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["items"]) == 1
+    assert data["total"] == 3
+    assert data["facets"]["party"] == {"Democratic": 2, "Republican": 1}
+    assert data["facets"]["state"] == {"CA": 2, "TX": 1}
+    assert data["facets"]["chamber"] == {"House": 3}
+    assert data["next_cursor"] == response.headers["x-next-cursor"]
+    
+    filtered = client.get("/api/v1/members?party=Republican&include_total=true").json()
+    assert filtered["total"] == 1
+    assert filtered["facets"] is None
+
+
+def test_database_stats_counts_all_tables(seeded_db):
+    """Test the single-query database statistics."""
+    response = client.get("/api/v1/stats/database")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["members"] == {"total": 3, "house": 3, "senate": 0, "current": 3}
+    assert data["committees"]["total"] == 3
+    assert data["committees"]["subcommittees"] == 1
+    assert set(data["hearings"]) == {"total", "scheduled", "completed"}
+
+
+def test_read_cache_serves_hits_until_invalidated(seeded_db):
+    """Test that repeat reads are cached and invalidation drops them."""
+    first = client.get("/api/v1/members?sort_by=last_name&limit=10")
+    second = client.get("/api/v1/members?limit=10&sort_by=last_name")
+    
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+    
+    seeded_db.query(Member).filter(Member.bioguide_id == "M000000").update({"party": "Independent"})
+    seeded_db.commit()
+    assert client.get("/api/v1/members?sort_by=last_name&limit=10").json()[0]["party"] == "Democratic"
+    
+    invalidate_read_cache()
+    refreshed = client.get("/api/v1/members?sort_by=last_name&limit=10")
+    assert refreshed.headers["x-cache"] == "MISS"
+    assert refreshed.json()[0]["party"] == "Independent"
+
+
+def test_read_cache_answers_conditional_requests(seeded_db):
+    """Test ETag / If-None-Match handling."""
+    response = client.get("/api/v1/committees?active_only=false")
+    etag = response.headers["etag"]
+    
+    not_modified = client.get("/api/v1/committees?active_only=false", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    
+    invalidate_read_cache()
+    seeded_db.query(Committee).filter(Committee.name == "Committee on Rules").update({"phone": "202-225-9191"})
+    seeded_db.commit()
+    changed = client.get("/api/v1/committees?active_only=false", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_read_cache_evicts_least_recently_used():
+    """Test the LRU bound of the read cache."""
+    cache = type(read_cache)(ttl=60, max_entries=2)
+    
+    cache.put("a", b"a", "application/json", {}, cache.version)
+    cache.put("b", b"b", "application/json", {}, cache.version)
+    cache.get("a")
+    cache.put("c", b"c", "application/json", {}, cache.version)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get_stats()["evicted"] == 1
@@ -0,0 +1,179 @@
+"""
+Tests running the collectors against the fake Congress.gov server.
+"""
+from datetime import datetime, timedelta, timezone
+import httpx
+import pytest
+from app.models import Member, Committee, CommitteeMembership, SyncState, FailedLookup
+from app.services.congress_api import CongressApiClient
+from app.services.data_processor import DataProcessor
+from app.services.quota_ledger import QuotaExceededError, QuotaLedger
+from app.services.rate_limiter import AdaptiveTokenBucket
+from app.services.relationship_data_collector import RelationshipDataCollector
+from tests.fake_congress_api import FakeCongressApi, load_fixtures, scale_fixtures
+
+
+def fake_client(http_client, tmp_path):
+    """Build a client that talks to the fake server with a private ledger and limiter."""
+    return CongressApiClient(
+        http_client=http_client,
+        quota_ledger=QuotaLedger(str(tmp_path / "quota.db"), daily_limit=100000),
+        rate_limiter=AdaptiveTokenBucket(rate=1000.0, capacity=50, min_rate=1.0, smoothing=0.0,
+                                         window_seconds=3600),
+    )
+
+
+@pytest.mark.asyncio
+async def test_client_pages_through_fake_server(tmp_path):
+    """Test that list endpoints paginate and rate-limit headers are reported."""
+    fake = FakeCongressApi(fixtures=scale_fixtures(load_fixtures(), 50))
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=fake)) as http_client:
+        client = fake_client(http_client, tmp_path)
+        members = await client.get_all_members()
+    
+    assert len(members) == 600
+    assert len({m["bioguideId"] for m in members}) == 600
+    assert len(fake.request_log) == 3
+    assert client.rate_limiter.server_remaining == 5000 - 3
+
+
+@pytest.mark.asyncio
+async def test_fake_server_enforces_rate_limit(tmp_path):
+    """Test that the fake answers 429 with Retry-After once its budget is spent."""
+    fake = FakeCongressApi(rate_limit=2, api_key="test_api_key")
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=fake)) as http_client:
+        client = fake_client(http_client, tmp_path)
+        client.max_retries = 0
+        await client.get_committees(chamber="house")
+        await client.get_committees(chamber="senate")
+        with pytest.raises(httpx.HTTPStatusError) as error:
+            await client.get_hearings()
+    
+    assert error.value.response.status_code == 429
+    assert error.value.response.headers["Retry-After"]
+
+
+@pytest.mark.asyncio
+async def test_collectors_ingest_from_fake_server(test_db, tmp_path):
+    """Test member ingest and committee membership population end to end."""
+    db = test_db()
+    for model in (CommitteeMembership, Member, Committee, SyncState, FailedLookup):
+        db.query(model).delete()
+    db.commit()
+    
+    fake = FakeCongressApi()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=fake)) as http_client:
+        processor = DataProcessor()
+        processor.congress_api = fake_client(http_client, tmp_path)
+        summary = await processor.update_members()
+        
+        collector = RelationshipDataCollector(db)
+        collector.congress_client = processor.congress_api
+        stats = await collector.populate_committee_memberships()
+    
+    assert summary["created"] == 12
+    assert stats["members_processed"] == 12
+    assert stats["errors"] == 0
+    assert db.query(CommitteeMembership).count() == 24
+    assert db.query(Committee).filter(Committee.committee_code == "hsag15").one().is_subcommittee
+    db.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_committee_lookups_are_dead_lettered_and_retried(test_db, tmp_path):
+    """Test that a failed member lookup is queued, not stored as empty, and a retry only refetches it."""
+    db = test_db()
+    for model in (CommitteeMembership, Member, Committee, SyncState, FailedLookup):
+        db.query(model).delete()
+    db.commit()
+    
+    fake = FakeCongressApi()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=fake)) as http_client:
+        processor = DataProcessor()
+        processor.congress_api = fake_client(http_client, tmp_path)
+        await processor.update_members()
+        failing_id = db.query(Member.bioguide_id).order_by(Member.bioguide_id).first()[0]
+        
+        collector = RelationshipDataCollector(db)
+        collector.congress_client = processor.congress_api
+        fetch = collector.congress_client.get_member_committees
+        
+        async def flaky(bioguide_id):
+            if bioguide_id == failing_id:
+                raise httpx.ConnectTimeout("timed out")
+            return await fetch(bioguide_id)
+        
+        collector.congress_client.get_member_committees = flaky
+        gather = collector.congress_client.get_all_committee_memberships
+        reported = []
+        
+        async def spy(bioguide_ids=None, on_error=None, on_result=None):
+            def report(bioguide_id, error):
+                reported.append(bioguide_id)
+                on_error(bioguide_id, error)
+            return await gather(bioguide_ids, on_error=report, on_result=on_result)
+        
+        collector.congress_client.get_all_committee_memberships = spy
+        stats = await collector.populate_committee_memberships()
+        
+        entry = db.query(FailedLookup).one()
+        assert reported == [failing_id]
+        assert stats["dead_lettered"] == 1
+        assert (entry.kind, entry.key, entry.error_class, entry.attempts) == (
+            "member_committees", failing_id, "ConnectTimeout", 1
+        )
+        
+        # Not due until the backoff elapses
+        assert (await collector.retry_failed_memberships())["retried"] == 0
+        
+        entry.next_attempt_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        db.commit()
+        collector.congress_client.get_member_committees = fetch
+        requests_before = len(fake.request_log)
+        retry = await collector.retry_failed_memberships()
+    
+    assert retry["retried"] == 1
+    assert retry["members_processed"] == 1
+    assert reported == [failing_id]
+    assert len(fake.request_log) - requests_before == 1
+    assert db.query(FailedLookup).count() == 0
+    assert db.query(CommitteeMembership).count() == 24
+    db.close()
+
+
+@pytest.mark.asyncio
+async def test_quota_exhaustion_keeps_collected_memberships_without_dead_lettering(test_db, tmp_path):
+    """Test that running out of quota stops the lookups, keeps what was stored and queues nothing."""
+    db = test_db()
+    for model in (CommitteeMembership, Member, Committee, SyncState, FailedLookup):
+        db.query(model).delete()
+    db.commit()
+    
+    fake = FakeCongressApi()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=fake)) as http_client:
+        processor = DataProcessor()
+        processor.congress_api = fake_client(http_client, tmp_path)
+        await processor.update_members()
+        bioguide_ids = [row[0] for row in db.query(Member.bioguide_id).order_by(Member.bioguide_id)]
+        
+        collector = RelationshipDataCollector(db)
+        collector.congress_client = processor.congress_api
+        collector.congress_client.max_concurrency = 1
+        fetch = collector.congress_client.get_member_committees
+        
+        async def exhausted(bioguide_id):
+            if bioguide_id == bioguide_ids[6]:
+                raise QuotaExceededError("daily quota exhausted")
+            return await fetch(bioguide_id)
+        
+        collector.congress_client.get_member_committees = exhausted
+        requests_before = len(fake.request_log)
+        with pytest.raises(QuotaExceededError):
+            await collector.populate_committee_memberships(bioguide_ids=bioguide_ids)
+    
+    assert len(fake.request_log) - requests_before == 6
+    assert db.query(FailedLookup).count() == 0
+    assert db.query(CommitteeMembership.member_id).distinct().count() == 6
+    db.close()
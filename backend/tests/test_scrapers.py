@@ -0,0 +1,252 @@
+"""
+Tests for the web scrapers' shared session, crawling and page extraction.
+"""
+import asyncio
+import time
+from pathlib import Path
+import httpx
+import pytest
+from bs4 import BeautifulSoup
+from scrapers import HouseScraper, SenateScraper, HostThrottle, PageFingerprintStore, shutdown_parse_pool
+from scrapers import base_scraper, house_scraper, senate_scraper
+from scrapers.extraction import PageIndex, Selector
+from scrapers.parsers import PARSERS, SelectolaxPage, available_parsers, parse_page
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "scraper_pages"
+
+LIST_PAGE = """
+<html><body>
+  <a href="https://agriculture.house.gov/committees/">Agriculture</a>
+  <a href="https://appropriations.house.gov/committees/">Appropriations</a>
+  <a href="https://armedservices.house.gov/committees/">Armed Services</a>
+  <a href="https://agriculture.house.gov/committees/sub/">Agriculture Subcommittees</a>
+</body></html>
+"""
+
+
+@pytest.mark.asyncio
+async def test_committee_crawl_is_concurrent_and_polite_per_host():
+    """Test that committee pages load in parallel across hosts but stay spaced on one host."""
+    starts = {}
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "www.house.gov":
+            return httpx.Response(200, text=LIST_PAGE)
+        starts.setdefault(request.url.host, []).append(time.monotonic())
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, text="<p>Room 1301 Longworth Office Building, (202) 225-2171</p>")
+    
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        scraper = HouseScraper(http_client=http_client, throttle=HostThrottle(delay=0.05, concurrency=1))
+        started = time.monotonic()
+        committees = await scraper.scrape_committees()
+        elapsed = time.monotonic() - started
+    
+    assert [c["name"] for c in committees] == [
+        "Agriculture", "Appropriations", "Armed Services", "Agriculture Subcommittees"
+    ]
+    assert all(c["phone"] == "(202) 225-2171" for c in committees)
+    
+    # Three hosts fetched side by side; the two Agriculture pages one after the other
+    assert elapsed < 0.35
+    first, second = starts["agriculture.house.gov"]
+    assert second - first >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_pages_are_parsed_in_worker_processes():
+    """Test that the parse pool returns the same plain results as parsing inline."""
+    calendar = b"""
+    <div class="hearing">
+      <h3>Oversight of Farm Credit</h3>
+      <span class="date">March 4, 2025</span>
+      <span class="location">1300 Longworth</span>
+    </div>
+    """
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=calendar)
+    
+    results = {}
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        scraper = HouseScraper(http_client=http_client, throttle=HostThrottle(delay=0, concurrency=1))
+        for workers in (0, 2):
+            scraper.parse_workers = workers
+            results[workers] = await scraper.scrape_hearings(force_refresh=True)
+    
+    assert results[2] == results[0]
+    assert results[2][0]["title"] == "Oversight of Farm Credit"
+    assert results[2][0]["scheduled_date"] == "2025-03-04T00:00:00"
+    shutdown_parse_pool()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_pages_are_not_parsed_again(tmp_path, monkeypatch):
+    """Test that 304s and unchanged bodies reuse the stored result and changed_only skips them."""
+    calendar = b'<div class="hearing"><h3>Oversight of Farm Credit</h3></div>'
+    details = {"agriculture.house.gov": "<p>(202) 225-2171</p>"}
+    conditional = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/legislative-activity/committee-hearings":
+            conditional.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=calendar, headers={"ETag": '"v1"'})
+        if request.url.host == "www.house.gov":
+            return httpx.Response(200, text=LIST_PAGE)
+        return httpx.Response(200, text=details.get(request.url.host, "<p>(202) 225-0000</p>"))
+    
+    parsed = []
+    run_parser = base_scraper.run_parser
+    
+    async def counting_run_parser(workers, scraper_cls, method, *args):
+        parsed.append(method)
+        return await run_parser(workers, scraper_cls, method, *args)
+    
+    monkeypatch.setattr(base_scraper, "run_parser", counting_run_parser)
+    fingerprints = PageFingerprintStore(str(tmp_path / "pages.db"))
+    
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        scraper = HouseScraper(http_client=http_client, throttle=HostThrottle(delay=0, concurrency=4),
+                               fingerprints=fingerprints)
+        scraper.parse_workers = 0
+        
+        # Calendar: parsed once, then answered by a 304 until a refresh is forced
+        first = await scraper.scrape_hearings(changed_only=True)
+        assert first[0]["title"] == "Oversight of Farm Credit"
+        assert await scraper.scrape_hearings(changed_only=True) == []
+        assert await scraper.scrape_hearings() == first
+        assert await scraper.scrape_hearings(changed_only=True, force_refresh=True) == first
+        assert conditional == [None, '"v1"', '"v1"', None]
+        assert parsed == ["parse_hearings", "parse_hearings"]
+        
+        # Committees: no validators, so unchanged bodies are recognized by their hash
+        parsed.clear()
+        assert len(await scraper.scrape_committees(changed_only=True)) == 4
+        assert len(parsed) == 5
+        # The stored list holds the list entries only, not the details merged into them
+        stored = fingerprints.load(scraper.committee_list_url, "parse_committee_list").result
+        assert len(stored) == 4 and all("phone" not in committee for committee in stored)
+        
+        parsed.clear()
+        assert await scraper.scrape_committees(changed_only=True) == []
+        assert parsed == []
+        
+        details["appropriations.house.gov"] = "<p>(202) 225-2771</p>"
+        changed = await scraper.scrape_committees(changed_only=True)
+        assert [(c["name"], c["phone"]) for c in changed] == [("Appropriations", "(202) 225-2771")]
+        assert parsed == ["parse_committee_details"]
+        
+        # With a pending list, changed pages count as new until the caller saves them
+        details["armedservices.house.gov"] = "<p>(202) 225-4151</p>"
+        pending = []
+        assert len(await scraper.scrape_committees(changed_only=True, pending=pending)) == 1
+        assert len(await scraper.scrape_committees(changed_only=True, pending=[])) == 1
+        assert [page.url for page in pending] == ["https://armedservices.house.gov/committees/"]
+        scraper.save_pages(pending)
+        assert await scraper.scrape_committees(changed_only=True, pending=[]) == []
+    
+    stats = fingerprints.get_stats()
+    assert stats["not_modified"] == 2
+    assert stats["unchanged"] == 22
+    assert stats["misses"] == 10
+    assert stats["pages"] == 6
+    fingerprints.close()
+
+
+def test_page_index_matches_soupsieve_on_saved_pages():
+    """Test that every scraper selector finds the same elements through the index as through soupsieve."""
+    selectors = []
+    for module in (base_scraper, house_scraper, senate_scraper):
+        for value in vars(module).values():
+            if isinstance(value, Selector):
+                selectors.append(value)
+            elif isinstance(value, tuple) and value and all(isinstance(item, Selector) for item in value):
+                selectors.extend(value)
+    assert len(selectors) > 40
+    
+    for path in sorted(FIXTURES_DIR.glob("*.html")):
+        soup = BeautifulSoup(path.read_bytes(), "html.parser")
+        page = PageIndex(soup)
+        assert page.text(strip=False) == soup.get_text()
+        
+        for selector in selectors:
+            assert page.select(selector) == soup.select(selector.css), (path.name, selector)
+            for element in page.select(house_scraper.HEARING_SELECTORS[-1]) + page.select(senate_scraper.ROW_SELECTOR):
+                assert page.select(selector, element) == element.select(selector.css), (path.name, selector)
+                assert page.text(element) == element.get_text().strip()
+
+
+def test_saved_pages_extract_details():
+    """Test committee and hearing extraction on saved House and Senate pages."""
+    def parse(scraper, method, filename):
+        soup = BeautifulSoup((FIXTURES_DIR / filename).read_bytes(), "html.parser")
+        return getattr(scraper, method)(soup)
+    
+    house = parse(HouseScraper(), "parse_committee_details", "house_committee.html")
+    assert house["phone"] == "(202) 225-2171"
+    assert house["email"] == "agriculture.press@mail.house.gov"
+    assert len(house["subcommittees"]) == 6
+    assert house["hearings_url"] == "https://www.house.gov/legislative-activity/committee-hearings"
+    
+    senate = parse(SenateScraper(), "parse_committee_details", "senate_committee.html")
+    assert senate["jurisdiction"] == "revenue measures generally, the bonded debt of the United States and customs"
+    assert senate["office_location"] == "219"
+    
+    hearings = parse(SenateScraper(), "parse_hearings", "senate_hearings.html")
+    assert hearings[0]["scheduled_date"] == "2025-03-04T00:00:00"
+    assert hearings[0]["video_urls"] == ["https://www.senate.gov/isvp/?comm=finance&filename=finance00"]
+    assert "video_urls" not in hearings[1]
+    assert hearings[6]["video_urls"] == ["https://www.senate.gov/media/field-hearing.mp4"]
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_parser_backends_extract_the_same_results(parser):
+    """Test that each installed parser, with and without partial parsing, matches html.parser."""
+    if parser not in available_parsers():
+        pytest.skip(f"{parser} is not installed")
+    
+    pages = [
+        (HouseScraper, "parse_committee_list", "house_committees.html"),
+        (HouseScraper, "parse_committee_details", "house_committee.html"),
+        (HouseScraper, "parse_hearings", "house_hearings.html"),
+        (SenateScraper, "parse_committee_list", "senate_committees.html"),
+        (SenateScraper, "parse_committee_details", "senate_committee.html"),
+        (SenateScraper, "parse_hearings", "senate_hearings.html"),
+    ]
+    
+    for scraper_cls, method, filename in pages:
+        html = (FIXTURES_DIR / filename).read_bytes()
+        extract = getattr(scraper_cls(), method)
+        expected = extract(BeautifulSoup(html, "html.parser"))
+        assert expected
+        
+        assert extract(parse_page(html, parser)) == expected, filename
+        only = scraper_cls.parse_only.get(method)
+        assert extract(parse_page(html, parser, only)) == expected, filename
+        if only:
+            partial, full = PageIndex(parse_page(html, parser, only)), PageIndex(parse_page(html, parser))
+            assert len(partial.elements) < len(full.elements)
+
+
+@pytest.mark.asyncio
+async def test_scraper_can_use_selectolax():
+    """Test that a scraper configured for selectolax parses with it and matches html.parser."""
+    pytest.importorskip("selectolax")
+    html = (FIXTURES_DIR / "senate_hearings.html").read_bytes()
+    assert isinstance(parse_page(html, "selectolax"), SelectolaxPage)
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=html)
+    
+    results = {}
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        scraper = SenateScraper(http_client=http_client, throttle=HostThrottle(delay=0, concurrency=1))
+        scraper.parse_workers = 0
+        for parser in ("html.parser", "selectolax"):
+            scraper.parser = parser
+            results[parser] = await scraper.fetch_and_parse(scraper.hearing_calendar_url, "parse_hearings")
+    
+    assert results["selectolax"]
+    assert results["selectolax"] == results["html.parser"]
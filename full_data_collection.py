@@ -7,12 +7,19 @@ and uploads directly to production database.
 import keyring
 import requests
 import json
+import os
 import time
 import subprocess
 import sys
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+# Draw from the same Congress.gov quota ledger as the backend service
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend")
+sys.path.insert(0, BACKEND_DIR)
+from app.services.quota_ledger import QuotaLedger
+from app.services.rate_limiter import AdaptiveTokenBucket, parse_retry_after
+
 class FullDataCollector:
     """Comprehensive data collector for congressional data."""
     
@@ -28,6 +35,16 @@ class FullDataCollector:
             "Accept": "application/json"
         }
         
+        self.quota_ledger = QuotaLedger(
+            path=os.getenv("CONGRESS_API_QUOTA_PATH", os.path.join(BACKEND_DIR, "congress_api_quota.db")),
+            daily_limit=int(os.getenv("CONGRESS_API_RATE_LIMIT", "5000")),
+        )
+        
+        # Pace requests by the budget the API reports instead of fixed sleeps
+        self.rate_limiter = AdaptiveTokenBucket(
+            rate=10.0, capacity=20, min_rate=0.2, smoothing=0.3, window_seconds=3600
+        )
+        
         # Statistics
         self.collected_members = []
         self.collected_committees = []
@@ -36,10 +53,28 @@ class FullDataCollector:
         
         print(f"✅ API Key loaded: {self.api_key[:8]}...{self.api_key[-4:]}")
     
+    def api_get(self, url: str, params: Optional[Dict[str, Any]] = None,
+                max_retries: int = 3) -> requests.Response:
+        """GET a Congress.gov URL, drawing from the shared quota and adapting pace to the server budget."""
+        for attempt in range(max_retries + 1):
+            self.quota_ledger.acquire(consumer="full_data_collection")
+            time.sleep(self.rate_limiter.reserve())
+            
+            response = requests.get(url, headers=self.headers, params=params)
+            self.rate_limiter.update_from_headers(response.headers)
+            
+            if response.status_code != 429 or attempt == max_retries:
+                return response
+            
+            wait = self.rate_limiter.backoff(parse_retry_after(response.headers.get("Retry-After")))
+            print(f"⏳ Rate limited, backing off {wait:.1f}s")
+        
+        return response
+    
     def rate_limit_check(self) -> Dict[str, Any]:
         """Check current rate limit status."""
         try:
-            response = requests.get(f"{self.base_url}/member?limit=1", headers=self.headers)
+            response = self.api_get(f"{self.base_url}/member?limit=1")
             remaining = response.headers.get('x-ratelimit-remaining', 'unknown')
             limit = response.headers.get('x-ratelimit-limit', 'unknown')
             reset = response.headers.get('x-ratelimit-reset', 'unknown')
@@ -48,6 +83,7 @@ class FullDataCollector:
                 "remaining": remaining,
                 "limit": limit,
                 "reset": reset,
+                "ledger": self.quota_ledger.get_usage(),
                 "status": "healthy" if response.status_code == 200 else "error"
             }
         except Exception as e:
@@ -63,9 +99,6 @@ class FullDataCollector:
         all_members.extend(house_members)
         print(f"✅ House members collected: {len(house_members)}")
         
-        # Small delay between requests
-        time.sleep(1)
-        
         # Collect Senate members
         print("📊 Collecting Senate members...")
         senate_members = self.collect_chamber_members("senate")
@@ -107,7 +140,7 @@ class FullDataCollector:
             }
             
             try:
-                response = requests.get(url, headers=self.headers, params=params)
+                response = self.api_get(url, params=params)
                 response.raise_for_status()
                 
                 data = response.json()
@@ -124,7 +157,6 @@ class FullDataCollector:
                     break
                 
                 offset += limit
-                time.sleep(1)  # Rate limiting
                 
             except requests.exceptions.HTTPError as e:
                 print(f"❌ Error collecting {chamber} members: {e}")
@@ -146,7 +178,7 @@ class FullDataCollector:
             url = f"{self.base_url}/committee"
             params = {"limit": 250}
             
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.api_get(url, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -160,7 +192,6 @@ class FullDataCollector:
                 if committee_code:
                     memberships = self.collect_committee_members(committee_code)
                     relationships.extend(memberships)
-                    time.sleep(0.5)  # Rate limiting
             
         except Exception as e:
             print(f"❌ Error collecting committee relationships: {e}")
@@ -173,7 +204,7 @@ class FullDataCollector:
         """Collect members of a specific committee."""
         try:
             url = f"{self.base_url}/committee/{committee_code}"
-            response = requests.get(url, headers=self.headers)
+            response = self.api_get(url)
             response.raise_for_status()
             
             data = response.json()